@@ -13,24 +13,271 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-"""Convert all vspec input files to Velocitas Python Vehicle Model."""
+"""Convert all vspec input files to Velocitas Python Vehicle Model.
 
-import os
-import shutil
-import sys
-from typing import List
+vss-tools, the input formats and the generators are imported where they are
+used, so that e.g. gen-model --help and argument errors do not pay for
+importing them and a generation loads only the selected ones.
+"""
 
-import vspec  # type: ignore
+import sys
+import threading
+from typing import TYPE_CHECKING, Callable, List, Optional
 
-from velocitas.model_generator.cpp.cpp_generator import VehicleModelCppGenerator
-from velocitas.model_generator.python.python_generator import (
-    VehicleModelPythonGenerator,
-)
-from velocitas.model_generator.tree_generator.file_import import (
-    FileImport,
-    UnsupportedFileFormat,
+from velocitas.model_generator.log import logger
+from velocitas.model_generator.manifest import ManifestSink, ModelManifest
+from velocitas.model_generator.progress import ProgressEvent
+from velocitas.model_generator.sinks import (
+    FileSystemSink,
+    MemorySink,
+    ObservedSink,
+    OutputSink,
+    TeeSink,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from vspec.model.vsstree import VSSNode  # type: ignore
+
+    from velocitas.model_generator.cache import ModelCache
+    from velocitas.model_generator.progress import ProgressStream
+    from velocitas.model_generator.prune import SignalFilter
+    from velocitas.model_generator.tree_generator.file_import import FileImport
+
+
+def _render_model(
+    tree,
+    language: str,
+    target_folder: str,
+    name: str,
+    sink: Optional[OutputSink] = None,
+    manifest: Optional[ModelManifest] = None,
+    docs: str = "full",
+    stubs: bool = False,
+    release_payloads: bool = False,
+) -> bool:
+    """Render the loaded tree into the target folder or the sink.
+
+    If a manifest is given, it collects the hashes of the generated files and
+    is written into the model. docs is one of DOCS_MODES, stubs only applies
+    to Python models. With release_payloads, the documentation of the nodes
+    is dropped while rendering, the tree can not be rendered again.
+
+    Returns:
+        bool: False if the language is not supported
+    """
+    if language not in ("python", "cpp"):
+        logger.error("Language %s is not supported yet.", language)
+        return False
+
+    model_sink = sink
+    if manifest is not None:
+        model_sink = sink if sink is not None else FileSystemSink(target_folder)
+        sink = ManifestSink(model_sink, manifest)
+
+    if language == "python":
+        from velocitas.model_generator.python.python_generator import (
+            VehicleModelPythonGenerator,
+        )
+
+        logger.info("Recursing tree and creating Python code...")
+        VehicleModelPythonGenerator(
+            tree,
+            target_folder,
+            name,
+            sink,
+            docs,
+            stubs,
+            release_payloads,
+        ).generate()
+        logger.info("All done.")
+    else:
+        from velocitas.model_generator.cpp.cpp_generator import (
+            VehicleModelCppGenerator,
+        )
+
+        logger.info("Recursing tree and creating c++ code...")
+        VehicleModelCppGenerator(
+            tree,
+            target_folder,
+            name,
+            sink,
+            docs,
+            release_payloads,
+        ).generate()
+        logger.info("All done.")
+
+    if manifest is not None and model_sink is not None:
+        manifest.write(model_sink)
+        model_sink.flush()
+    return True
+
+
+def _generate(
+    file_import: "FileImport",
+    language: str,
+    target_folder: str,
+    name: str,
+    strict: bool,
+    ext_attributes_list: List[str],
+    cache: Optional["ModelCache"],
+    depfile: Optional[str],
+    depfile_target: Optional[str],
+    signal_filter: Optional["SignalFilter"] = None,
+    sink: Optional[OutputSink] = None,
+    load_tree: Optional[Callable[["FileImport"], "VSSNode"]] = None,
+    progress: Optional[Callable[[ProgressEvent], None]] = None,
+    docs: str = "full",
+    stubs: bool = False,
+    descriptor: Optional[str] = None,
+    catalog: Optional[str] = None,
+    low_memory: bool = False,
+):
+    """Generate the model of an import, see generate_model for the arguments.
+
+    load_tree allows to provide the tree e.g. from trees loaded before, whose
+    payloads are then kept even with low_memory. progress is called for each
+    step of the generation, see ProgressEvent.
+    """
+    from velocitas.model_generator.memory import gc_paused
+    from velocitas.model_generator.staging import DiscardStaging, staged_folder
+    from velocitas.model_generator.vss_state import vss_tools_state
+
+    options = signal_filter.options() if signal_filter is not None else []
+    if cache is not None:
+        cache_options = options if docs == "full" else options + [f"docs={docs}"]
+        if stubs:
+            cache_options = cache_options + ["stubs"]
+        cache_key = cache.key(
+            file_import.input_files(),
+            language,
+            name,
+            strict,
+            ext_attributes_list,
+            cache_options,
+        )
+
+    def load() -> "VSSNode":
+        if progress is not None:
+            progress(ProgressEvent("load"))
+        with gc_paused():
+            with vss_tools_state(ext_attributes_list):
+                tree = (
+                    load_tree(file_import)
+                    if load_tree is not None
+                    else file_import.load_tree()
+                )
+            if signal_filter is not None:
+                tree = signal_filter.prune(tree)
+        return tree
+
+    def write_signal_files(tree: "VSSNode"):
+        if descriptor is not None:
+            from velocitas.model_generator.descriptor import write_descriptor
+
+            write_descriptor(tree, descriptor)
+        if catalog is not None:
+            from velocitas.model_generator.catalog import write_catalog
+
+            write_catalog(tree, catalog)
+
+    def write_model(folder: str, sink: Optional[OutputSink]) -> bool:
+        if cache is not None and (
+            cache.restore(cache_key, folder)
+            if sink is None
+            else cache.restore_to_sink(cache_key, sink)
+        ):
+            logger.info("Restored model from cache (%s).", cache_key[:12])
+            if progress is not None:
+                progress(ProgressEvent("restore"))
+            if descriptor is not None or catalog is not None:
+                # the descriptor and catalog are not cached, they need the tree
+                write_signal_files(load())
+            return True
+
+        tree = load()
+
+        render_sink = sink
+        if sink is not None and cache is not None:
+            # keep a copy of the files to store them in the cache
+            cached_files = MemorySink()
+            render_sink = TeeSink(sink, cached_files)
+        if progress is not None:
+            from anytree import PreOrderIter  # type: ignore
+
+            nodes = sum(1 for _ in PreOrderIter(tree))
+            progress(ProgressEvent("render", nodes=nodes))
+            render_sink = ObservedSink(
+                render_sink or FileSystemSink(folder),
+                lambda path, content: progress(
+                    ProgressEvent("write", path, len(content.encode("utf-8")))
+                ),
+            )
+        manifest = ModelManifest(
+            file_import.input_files(),
+            language,
+            name,
+            strict,
+            ext_attributes_list,
+            options,
+            docs,
+            stubs,
+        )
+        # the signal files need the payloads after rendering
+        release_payloads = (
+            low_memory and load_tree is None and descriptor is None and catalog is None
+        )
+        with gc_paused():
+            rendered = _render_model(
+                tree,
+                language,
+                folder,
+                name,
+                render_sink,
+                manifest,
+                docs,
+                stubs,
+                release_payloads,
+            )
+        if not rendered:
+            return False
+        write_signal_files(tree)
+
+        if cache is not None:
+            if sink is None:
+                cache.store(cache_key, folder)
+            else:
+                cache.store_files(cache_key, cached_files.files)
+        return True
+
+    if sink is not None:
+        if not write_model(target_folder, sink):
+            return
+    else:
+        # the previous model stays in place until the new one is complete
+        written = False
+        with staged_folder(target_folder) as staging:
+            written = write_model(staging, None)
+            if not written:
+                raise DiscardStaging()
+        if not written:
+            return
+
+    if depfile is not None:
+        from velocitas.model_generator.depfile import list_files, write_depfile
+
+        if depfile_target:
+            targets = [depfile_target]
+        else:
+            targets = list_files(target_folder) if sink is None else sink.paths
+        write_depfile(
+            depfile,
+            targets,
+            file_import.input_files()
+            + (signal_filter.signals_files if signal_filter is not None else []),
+        )
+
 
 def generate_model(
     input_file_path: str,
@@ -42,7 +289,18 @@ def generate_model(
     include_dir: str = ".",
     ext_attributes_list: List[str] = [],
     overlays: List[str] = [],
-) -> None:
+    cache: Optional["ModelCache"] = None,
+    depfile: Optional[str] = None,
+    depfile_target: Optional[str] = None,
+    signal_filter: Optional["SignalFilter"] = None,
+    sink: Optional[OutputSink] = None,
+    progress: Optional[Callable[[ProgressEvent], None]] = None,
+    docs: str = "full",
+    stubs: bool = False,
+    descriptor: Optional[str] = None,
+    catalog: Optional[str] = None,
+    low_memory: bool = False,
+) -> Optional[OutputSink]:
     """Generates a model to a file (json, vspec)
     input_file_path str: The file to convert.
     input_unit_file_path_list List[str]: The unit file(s) used to generate the model.
@@ -53,7 +311,34 @@ def generate_model(
     include_dir: which directories to include for file searches
     ext_attributes_list List[str]: The extended attributes that aren't considered by the generator (no warnings)
     overlays List[str]: The overlay that is used to generate the model.
+    cache Optional[ModelCache]: The cache to look up and store the generated model.
+    depfile Optional[str]: Write a Makefile dependency file listing all files read.
+    depfile_target Optional[str]: The target of the dependency file rule,
+        defaults to all generated files.
+    signal_filter Optional[SignalFilter]: Generate only the selected signals.
+    sink Optional[OutputSink]: Write the model to the sink instead of the target
+        folder, e.g. a MemorySink to keep it in memory. The sink is returned.
+    progress Optional[Callable[[ProgressEvent], None]]: Called for each step of
+        the generation, e.g. a JsonLinesEvents.
+    docs str: full documents every member in the generated code, minimal only
+        its name and type, external additionally writes the documentation
+        into model-docs.json.
+    stubs bool: Also generate .pyi type stubs for a Python model, they carry
+        the documentation and the modules are generated without docstrings.
+    descriptor Optional[str]: Also write the binary descriptor of all signals
+        to this file, see ModelDescriptor.
+    catalog Optional[str]: Also write an SQLite database of all signals to
+        this file, see velocitas.model_generator.catalog.
+    low_memory bool: Drop the documentation of the loaded nodes as soon as it
+        is rendered, for very large trees. Has no effect with external docs,
+        a descriptor or a catalog, which need it afterwards.
     """
+    import vspec  # type: ignore
+
+    from velocitas.model_generator.tree_generator.file_import import (
+        FileImport,
+        UnsupportedFileFormat,
+    )
 
     include_dirs = ["."]
     include_dirs.extend(include_dir)
@@ -61,44 +346,157 @@ def generate_model(
     # yaml_out = open(args.yaml_file, "w", encoding="utf-8")
 
     if len(ext_attributes_list) > 0:
-        vspec.model.vsstree.VSSNode.whitelisted_extended_attributes = (
-            ext_attributes_list
-        )
-        print(f"Known extended attributes: {', '.join(ext_attributes_list)}")
+        logger.info("Known extended attributes: %s", ", ".join(ext_attributes_list))
 
     try:
-        if os.path.exists(target_folder):
-            shutil.rmtree(target_folder)
-
-        tree = FileImport(
+        file_import = FileImport(
             input_file_path,
             input_unit_file_path_list,
             include_dirs,
             strict,
             overlays,
-        ).load_tree()
+        )
 
-        if language == "python":
-            print("Recursing tree and creating Python code...")
-            VehicleModelPythonGenerator(
-                tree,
-                target_folder,
-                name,
-            ).generate()
-            print("All done.")
-        elif language == "cpp":
-            print("Recursing tree and creating c++ code...")
-            VehicleModelCppGenerator(
-                tree,
-                target_folder,
-                name,
-            ).generate()
-            print("All done.")
-        else:
-            print(f"Language {language} is not supported yet.")
+        _generate(
+            file_import,
+            language,
+            target_folder,
+            name,
+            strict,
+            ext_attributes_list,
+            cache,
+            depfile,
+            depfile_target,
+            signal_filter,
+            sink,
+            progress=progress,
+            docs=docs,
+            stubs=stubs,
+            descriptor=descriptor,
+            catalog=catalog,
+            low_memory=low_memory,
+        )
     except vspec.VSpecError as e:
-        print(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(255)
     except UnsupportedFileFormat as e:
-        print(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(255)
+    if progress is not None:
+        progress(ProgressEvent("done"))
+    return sink
+
+
+class _Cancelled(Exception):
+    """Stops a generation whose coroutine was cancelled."""
+
+
+async def generate_model_async(
+    input_file_path: str,
+    input_unit_file_path_list: List[str],
+    language: str,
+    target_folder: str = "./gen_model",
+    name: str = "vehicle",
+    strict: bool = True,
+    include_dir: str = ".",
+    ext_attributes_list: List[str] = [],
+    overlays: List[str] = [],
+    cache: Optional["ModelCache"] = None,
+    depfile: Optional[str] = None,
+    depfile_target: Optional[str] = None,
+    signal_filter: Optional["SignalFilter"] = None,
+    sink: Optional[OutputSink] = None,
+    progress: Optional["ProgressStream"] = None,
+    executor: Optional["Executor"] = None,
+    docs: str = "full",
+    stubs: bool = False,
+    descriptor: Optional[str] = None,
+    catalog: Optional[str] = None,
+    low_memory: bool = False,
+) -> Optional[OutputSink]:
+    """Generates a model without blocking the event loop.
+
+    Takes the arguments of generate_model and additionally:
+    progress Optional[ProgressStream]: Receives the events of the generation,
+        iterate it while awaiting the generation.
+    executor Optional[Executor]: The thread pool to load and render the model
+        in, defaults to the one of the event loop.
+
+    Errors are raised instead of exiting. On cancellation, the coroutine waits
+    for the generation to stop. Unless it completed already, the target
+    folder is left untouched and nothing is written to the sink.
+    """
+    import asyncio
+
+    from velocitas.model_generator.tree_generator.file_import import FileImport
+
+    include_dirs = ["."]
+    include_dirs.extend(include_dir)
+
+    if len(ext_attributes_list) > 0:
+        logger.info("Known extended attributes: %s", ", ".join(ext_attributes_list))
+
+    cancelled = threading.Event()
+
+    def report(event: ProgressEvent):
+        if cancelled.is_set():
+            raise _Cancelled()
+        if progress is not None:
+            progress.emit(event)
+
+    def run() -> Optional[OutputSink]:
+        # the files reach the sink only once the model is complete
+        buffer = MemorySink() if sink is not None else None
+        try:
+            _generate(
+                FileImport(
+                    input_file_path,
+                    input_unit_file_path_list,
+                    include_dirs,
+                    strict,
+                    overlays,
+                ),
+                language,
+                target_folder,
+                name,
+                strict,
+                ext_attributes_list,
+                cache,
+                depfile,
+                depfile_target,
+                signal_filter,
+                buffer,
+                progress=report,
+                docs=docs,
+                stubs=stubs,
+                descriptor=descriptor,
+                catalog=catalog,
+                low_memory=low_memory,
+            )
+        except SystemExit as e:
+            # vss-tools exits on invalid specifications
+            raise RuntimeError("Loading the tree failed.") from e
+
+        if sink is not None and buffer is not None:
+            if cancelled.is_set():
+                raise _Cancelled()
+            for path, content in buffer.files.items():
+                sink.write(path, content)
+            sink.flush()
+        if progress is not None:
+            progress.emit(ProgressEvent("done"))
+        return sink
+
+    future = asyncio.get_running_loop().run_in_executor(executor, run)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        cancelled.set()
+        try:
+            await future
+        except _Cancelled:
+            pass
+        raise
+    finally:
+        if progress is not None:
+            progress.close()
@@ -0,0 +1,277 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Generate many models described by a manifest in one process.
+
+A manifest lists the jobs and optional defaults for all of them::
+
+    defaults:
+      units: [spec/units.yaml]
+      include_dirs: [spec]
+    jobs:
+      - input: spec/VehicleSignalSpecification.vspec
+        language: python
+        target_folder: gen/python
+      - input: spec/VehicleSignalSpecification.vspec
+        language: cpp
+        target_folder: gen/cpp
+        overlays: [overlays/private.vspec]
+
+Relative paths are resolved against the folder of the manifest. Jobs with the
+same input, units, include dirs and options share one loaded base tree, the
+overlays of a job are applied to a copy of it.
+"""
+
+import copy
+import inspect
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import vspec  # type: ignore
+import yaml  # type: ignore
+
+from velocitas.model_generator import _render_model
+from velocitas.model_generator.catalog import write_catalog
+from velocitas.model_generator.descriptor import write_descriptor
+from velocitas.model_generator.manifest import ModelManifest
+from velocitas.model_generator.staging import DiscardStaging, staged_folder
+from velocitas.model_generator.tree_generator.file_import import (
+    FileImport,
+    UnsupportedFileFormat,
+)
+from velocitas.model_generator.vss_state import vss_tools_state
+
+_PATH_KEYS = ("input", "target_folder", "descriptor", "catalog")
+_PATH_LIST_KEYS = ("units", "include_dirs", "overlays")
+
+
+class BatchJob:
+    """A single model to generate."""
+
+    def __init__(
+        self,
+        label: str,
+        input: str,
+        language: str,
+        target_folder: str,
+        name: str = "vehicle",
+        units: List[str] = [],
+        include_dirs: List[str] = [],
+        strict: bool = True,
+        overlays: List[str] = [],
+        extended_attributes: List[str] = [],
+        docs: str = "full",
+        stubs: bool = False,
+        descriptor: Optional[str] = None,
+        catalog: Optional[str] = None,
+    ):
+        """Create a new job, the arguments match the options of generate_model."""
+        self.label = label
+        self.input = input
+        self.language = language
+        self.target_folder = target_folder
+        self.name = name
+        self.units = units
+        self.include_dirs = ["."] + include_dirs
+        self.strict = strict
+        self.overlays = overlays
+        self.extended_attributes = extended_attributes
+        self.docs = docs
+        self.stubs = stubs
+        self.descriptor = descriptor
+        self.catalog = catalog
+
+    def base_key(self) -> Tuple:
+        """Jobs with the same key can share the tree loaded without overlays."""
+        return (
+            self.input,
+            tuple(self.units),
+            tuple(self.include_dirs),
+            self.strict,
+            tuple(self.extended_attributes),
+        )
+
+    def file_import(self) -> FileImport:
+        return FileImport(
+            self.input, self.units, self.include_dirs, self.strict, self.overlays
+        )
+
+
+class BatchResult:
+    """Outcome and timings of a job."""
+
+    def __init__(self, job: BatchJob):
+        """Create an empty result for the job."""
+        self.label = job.label
+        self.language = job.language
+        self.error: Optional[str] = None
+        # loading the shared base tree is accounted to the first job using it
+        self.base_s = 0.0
+        self.overlays_s = 0.0
+        self.render_s = 0.0
+        self.total_s = 0.0
+
+
+def _check_options(options: Dict[str, Any]):
+    """Raise a ValueError naming the job if its options do not fit BatchJob."""
+    parameters = inspect.signature(BatchJob).parameters
+    for key in options:
+        if key not in parameters:
+            raise ValueError(f"Unknown key '{key}' in batch job {options['label']}")
+    for key, parameter in parameters.items():
+        if parameter.default is parameter.empty and key not in options:
+            raise ValueError(f"Batch job {options['label']} is missing key '{key}'")
+
+
+def load_manifest(manifest_path: str) -> List[BatchJob]:
+    """Read the jobs of a batch manifest.
+
+    Raises:
+        ValueError: If the manifest is no mapping with a list of jobs, or a
+            job has an unknown key or misses a required one
+    """
+    with open(manifest_path, encoding="utf-8") as file:
+        try:
+            manifest = yaml.safe_load(file)
+        except yaml.YAMLError as e:
+            raise ValueError(f"{manifest_path} is not valid YAML: {e}")
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("jobs"), list):
+        raise ValueError(f"{manifest_path} is not a mapping with a list of jobs")
+    defaults = manifest.get("defaults", {})
+    if not isinstance(defaults, dict):
+        raise ValueError(f"The defaults of {manifest_path} are not a mapping")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    jobs = []
+    for index, job_spec in enumerate(manifest["jobs"]):
+        if not isinstance(job_spec, dict):
+            raise ValueError(f"Batch job {index} of {manifest_path} is not a mapping")
+        options: Dict[str, Any] = {**defaults, **job_spec}
+        for key in _PATH_KEYS:
+            if key in options:
+                options[key] = os.path.join(base_dir, options[key])
+        for key in _PATH_LIST_KEYS:
+            if key in options:
+                options[key] = [os.path.join(base_dir, p) for p in options[key]]
+        options.setdefault("label", f"{index}-{options.get('language', '')}")
+        _check_options(options)
+        jobs.append(BatchJob(**options))
+    return jobs
+
+
+def _run_group(jobs: List[BatchJob]) -> List[BatchResult]:
+    """Generate all jobs sharing a base tree, loading it only once."""
+    results = []
+    base_tree = None
+    for job in jobs:
+        result = BatchResult(job)
+        start = time.perf_counter()
+        try:
+            file_import = job.file_import()
+            if base_tree is None:
+                with vss_tools_state(job.extended_attributes):
+                    base_tree = file_import.load_base_tree()
+                result.base_s = time.perf_counter() - start
+
+            tree = base_tree
+            if job.overlays:
+                overlays_start = time.perf_counter()
+                with vss_tools_state(job.extended_attributes):
+                    file_import.load_units()
+                    tree = file_import.apply_overlays(copy.deepcopy(base_tree))
+                result.overlays_s = time.perf_counter() - overlays_start
+
+            render_start = time.perf_counter()
+            manifest = ModelManifest(
+                file_import.input_files(),
+                job.language,
+                job.name,
+                job.strict,
+                job.extended_attributes,
+                docs=job.docs,
+                stubs=job.stubs,
+            )
+            with staged_folder(job.target_folder) as staging:
+                if not _render_model(
+                    tree,
+                    job.language,
+                    staging,
+                    job.name,
+                    manifest=manifest,
+                    docs=job.docs,
+                    stubs=job.stubs,
+                ):
+                    result.error = f"Language {job.language} is not supported"
+                    raise DiscardStaging()
+            if job.descriptor is not None:
+                write_descriptor(tree, job.descriptor)
+            if job.catalog is not None:
+                write_catalog(tree, job.catalog)
+            result.render_s = time.perf_counter() - render_start
+        except (vspec.VSpecError, UnsupportedFileFormat, OSError) as e:
+            result.error = str(e)
+        except SystemExit as e:
+            # vss-tools exits on invalid specifications
+            result.error = f"vss-tools exited with {e.code}"
+        except Exception as e:
+            # a failing job must not abort the others of the batch
+            result.error = repr(e)
+        result.total_s = time.perf_counter() - start
+        results.append(result)
+    return results
+
+
+def run_batch(
+    jobs: List[BatchJob], max_workers: Optional[int] = None
+) -> List[BatchResult]:
+    """Generate all jobs, groups of jobs sharing a base tree run in parallel.
+
+    Args:
+        jobs (List[BatchJob]): The jobs to generate
+        max_workers (Optional[int]): The number of worker processes, defaults
+            to the number of CPUs. With 1 all jobs run in this process.
+
+    Returns:
+        List[BatchResult]: The results in the order of the jobs
+    """
+    groups: Dict[Tuple, List[BatchJob]] = {}
+    for job in jobs:
+        groups.setdefault(job.base_key(), []).append(job)
+
+    if max_workers == 1 or len(groups) == 1:
+        group_results = [_run_group(group) for group in groups.values()]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            group_results = list(executor.map(_run_group, groups.values()))
+
+    results: Dict[int, BatchResult] = {}
+    for group, group_result in zip(groups.values(), group_results):
+        for job, result in zip(group, group_result):
+            results[id(job)] = result
+    return [results[id(job)] for job in jobs]
+
+
+def print_summary(results: List[BatchResult]):
+    """Print a table with the timings of all jobs."""
+    print(
+        f"{'job':30}{'language':10}{'base':>8}{'overlays':>10}"
+        f"{'render':>8}{'total':>8}  status"
+    )
+    for r in results:
+        print(
+            f"{r.label:30}{r.language:10}{r.base_s:8.3f}{r.overlays_s:10.3f}"
+            f"{r.render_s:8.3f}{r.total_s:8.3f}  {r.error or 'ok'}"
+        )
@@ -0,0 +1,237 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Content addressed cache of generated models."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from velocitas.model_generator.depfile import list_files
+from velocitas.model_generator.sinks import FileSystemSink, OutputSink
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # no locking on platforms without fcntl
+    fcntl = None  # type: ignore
+
+DEFAULT_CACHE_MAX_SIZE = 5 * 1024**3
+
+_SIZE_SUFFIXES = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_size(size: str) -> int:
+    """Parse a size like 512M or 5G into bytes."""
+    suffix = size[-1:].upper()
+    if suffix in _SIZE_SUFFIXES:
+        return int(float(size[:-1]) * _SIZE_SUFFIXES[suffix])
+    return int(size)
+
+
+def _generator_fingerprint() -> str:
+    """Identify the generator including local modifications of its sources."""
+    from importlib import metadata
+
+    try:
+        version = metadata.version("velocitas_model_generator")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    digest = hashlib.sha256(version.encode())
+    package_dir = Path(__file__).parent
+    for source in sorted(package_dir.rglob("*.py")):
+        digest.update(source.relative_to(package_dir).as_posix().encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _folder_size(folder: str) -> int:
+    size = 0
+    for dir_path, _, file_names in os.walk(folder):
+        for file_name in file_names:
+            size += os.path.getsize(os.path.join(dir_path, file_name))
+    return size
+
+
+class ModelCache:
+    """Cache of generated models, keyed by the hash of all generator inputs.
+
+    Entries are stored below ``cache_dir/entries``. The modification time of an
+    entry marks its last use, the least recently used entries are evicted once
+    the cache grows beyond ``max_size`` bytes. All processes sharing the cache
+    synchronize through a lock file, so parallel jobs can use the same cache.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        hard_link: bool = False,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir (str): The folder the cache is stored in
+            max_size (int): The maximum size of all cached models in bytes
+            hard_link (bool): Materialize models with hard links instead of
+                copies. Modifying a materialized file then modifies the cache.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hard_link = hard_link
+        self.entries_dir = os.path.join(cache_dir, "entries")
+        os.makedirs(self.entries_dir, exist_ok=True)
+
+    @contextmanager
+    def __lock(self, exclusive: bool) -> Iterator[None]:
+        with open(os.path.join(self.cache_dir, "lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def key(
+        self,
+        input_files: List[str],
+        language: str,
+        name: str,
+        strict: bool,
+        ext_attributes_list: List[str],
+        options: List[str] = [],
+    ) -> str:
+        """Compute the cache key of a generation.
+
+        Only the content of the input files is hashed, not their location, so
+        the same inputs checked out to different places share an entry.
+        options are further settings changing the generated model.
+        """
+        digest = hashlib.sha256(_generator_fingerprint().encode())
+        for option in (language, name, str(strict), ",".join(ext_attributes_list)):
+            digest.update(b"\0" + option.encode())
+        for option in options:
+            digest.update(b"\1" + option.encode())
+        for input_file in input_files:
+            with open(input_file, "rb") as file:
+                digest.update(b"\0" + hashlib.sha256(file.read()).digest())
+        return digest.hexdigest()
+
+    def __entry(self, key: str) -> str:
+        return os.path.join(self.entries_dir, key)
+
+    def restore(self, key: str, target_folder: str) -> bool:
+        """Materialize a cached model into the target folder.
+
+        Returns:
+            bool: False if the model is not cached
+        """
+        entry = self.__entry(key)
+        with self.__lock(exclusive=False):
+            if not os.path.isdir(entry):
+                return False
+            os.utime(entry)
+            if os.path.exists(target_folder):
+                shutil.rmtree(target_folder)
+            shutil.copytree(
+                os.path.join(entry, "model"),
+                target_folder,
+                copy_function=self.__link if self.hard_link else shutil.copy2,
+            )
+        return True
+
+    @staticmethod
+    def __link(src: str, dst: str):
+        try:
+            os.link(src, dst)
+        except OSError:
+            # e.g. cache and target folder on different file systems
+            shutil.copy2(src, dst)
+
+    def restore_to_sink(self, key: str, sink: OutputSink) -> bool:
+        """Write a cached model to a sink.
+
+        Returns:
+            bool: False if the model is not cached
+        """
+        entry = self.__entry(key)
+        with self.__lock(exclusive=False):
+            if not os.path.isdir(entry):
+                return False
+            os.utime(entry)
+            model_dir = os.path.join(entry, "model")
+            for path in list_files(model_dir):
+                with open(path, encoding="utf-8") as file:
+                    relative_path = os.path.relpath(path, model_dir)
+                    sink.write(relative_path.replace(os.sep, "/"), file.read())
+        return True
+
+    def store(self, key: str, target_folder: str):
+        """Add a generated model to the cache and evict old entries."""
+        self.__store(key, lambda model_dir: shutil.copytree(target_folder, model_dir))
+
+    def store_files(self, key: str, files: Dict[str, str]):
+        """Add a model kept in memory, see MemorySink, to the cache."""
+
+        def write_files(model_dir: str):
+            with FileSystemSink(model_dir) as sink:
+                for path, content in files.items():
+                    sink.write(path, content)
+
+        self.__store(key, write_files)
+
+    def __store(self, key: str, write_model: Callable[[str], object]):
+        entry = self.__entry(key)
+        if os.path.isdir(entry):
+            return
+
+        # copy outside of the lock, other jobs only wait for the rename
+        staging = tempfile.mkdtemp(prefix=f".{key}.", dir=self.entries_dir)
+        try:
+            write_model(os.path.join(staging, "model"))
+            with open(os.path.join(staging, "size"), "w", encoding="utf-8") as file:
+                file.write(str(_folder_size(staging)))
+            with self.__lock(exclusive=True):
+                if not os.path.isdir(entry):
+                    os.rename(staging, entry)
+                    self.__evict(keep=key)
+        finally:
+            if os.path.exists(staging):
+                shutil.rmtree(staging)
+
+    def __evict(self, keep: Optional[str] = None):
+        """Remove least recently used entries until the cache fits max_size."""
+        entries = []
+        total_size = 0
+        for key in os.listdir(self.entries_dir):
+            entry = self.__entry(key)
+            if key.startswith(".") or not os.path.isdir(entry):
+                continue
+            with open(os.path.join(entry, "size"), encoding="utf-8") as file:
+                size = int(file.read())
+            total_size += size
+            entries.append((os.path.getmtime(entry), key, size))
+
+        for _, key, size in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self.__entry(key))
+            total_size -= size
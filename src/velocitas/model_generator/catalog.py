@@ -0,0 +1,201 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""SQLite catalog of the signals of a model.
+
+The catalog lets tools query the signals with SQL instead of loading the
+tree, e.g. all actuators below Vehicle.Body::
+
+    SELECT path FROM nodes
+    WHERE type = 'actuator' AND path GLOB 'Vehicle.Body.*'
+
+Path prefixes are matched with GLOB, which uses the index of nodes.path,
+LIKE does not as it ignores case. Tables:
+
+    nodes           id, parent_id, name, path, type, datatype, unit, min,
+                    max, description, comment of every node, pre-order
+    allowed_values  node_id, position, value
+    instances       node_id, level, position, name: the instance levels of
+                    branches, e.g. level 0 Row1, Row2 and level 1 DriverSide,
+                    PassengerSide of Vehicle.Cabin.Door
+    expanded_paths  path, node_id: the paths of all nodes with the instances
+                    of their branches, e.g. Vehicle.Cabin.Door.Row1.DriverSide
+                    .IsOpen
+    meta            key, value, e.g. the schema_version
+"""
+
+import sqlite3
+from typing import List, Optional, Tuple
+
+from velocitas.model_generator.naming import parse_instances
+from velocitas.model_generator.staging import staged_file
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE nodes (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER REFERENCES nodes (id),
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    type TEXT NOT NULL,
+    datatype TEXT,
+    unit TEXT,
+    min NUMERIC,
+    max NUMERIC,
+    description TEXT NOT NULL,
+    comment TEXT NOT NULL
+);
+CREATE TABLE allowed_values (
+    node_id INTEGER NOT NULL REFERENCES nodes (id),
+    position INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (node_id, position)
+) WITHOUT ROWID;
+CREATE TABLE instances (
+    node_id INTEGER NOT NULL REFERENCES nodes (id),
+    level INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (node_id, level, position)
+) WITHOUT ROWID;
+CREATE TABLE expanded_paths (
+    path TEXT NOT NULL,
+    node_id INTEGER NOT NULL REFERENCES nodes (id)
+);
+"""
+
+# created after the rows are inserted, which is faster than updating them
+_INDEXES = [
+    "CREATE UNIQUE INDEX nodes_path ON nodes (path)",
+    "CREATE INDEX nodes_parent ON nodes (parent_id)",
+    "CREATE INDEX nodes_type ON nodes (type, path)",
+    "CREATE UNIQUE INDEX expanded_paths_path ON expanded_paths (path)",
+    "CREATE INDEX expanded_paths_node ON expanded_paths (node_id)",
+]
+
+_NO_INSTANCES = [""]
+
+
+def _instance_suffixes(levels: List[Tuple[str, ...]]) -> List[str]:
+    """Return the suffixes of all instances, e.g. .Row1.DriverSide."""
+    suffixes = [""]
+    for elements in levels:
+        suffixes = [f"{s}.{element}" for s in suffixes for element in elements]
+    return suffixes
+
+
+def write_catalog(root_node, path: str):
+    """Write the catalog of a tree of VSSNodes to an SQLite database.
+
+    All rows are inserted in one transaction without a journal into a staging
+    file, which then replaces the database atomically.
+    """
+    nodes: List[Tuple] = []
+    allowed_values: List[Tuple[int, int, str]] = []
+    instances: List[Tuple[int, int, int, str]] = []
+    expanded_paths: List[Tuple[str, int]] = []
+
+    # pre-order with an explicit stack, deep trees do not hit the recursion
+    # limit; a node holds its path and the expanded paths of its parent, None
+    # if the parent is not below instances
+    stack: List[Tuple[object, Optional[int], str, Optional[List[str]]]] = [
+        (root_node, None, root_node.name, None)
+    ]
+    while stack:
+        node, parent_id, node_path, parent_paths = stack.pop()
+        node_id = len(nodes) + 1
+
+        node_min = getattr(node, "min", "")
+        node_max = getattr(node, "max", "")
+        datatype = getattr(node, "datatype", None)
+        unit = getattr(node, "unit", None)
+        nodes.append(
+            (
+                node_id,
+                parent_id,
+                node.name,  # type: ignore
+                node_path,
+                node.type.value,  # type: ignore
+                datatype.value if datatype is not None else None,
+                f"{unit}" if unit is not None else None,
+                None if isinstance(node_min, str) else node_min,
+                None if isinstance(node_max, str) else node_max,
+                f"{node.description}",  # type: ignore
+                getattr(node, "comment", "") or "",
+            )
+        )
+        for position, value in enumerate(getattr(node, "allowed", None) or []):
+            allowed_values.append((node_id, position, f"{value}"))
+
+        node_instances = getattr(node, "instances", None)
+        if node_instances:
+            levels = []
+            for level, spec in enumerate(parse_instances(node_instances)):
+                levels.append(spec.elements)
+                for position, element in enumerate(spec.elements):
+                    instances.append((node_id, level, position, element))
+            suffixes = _instance_suffixes(levels)
+        else:
+            suffixes = _NO_INSTANCES
+
+        paths: Optional[List[str]] = None
+        if parent_paths is not None:
+            paths = [
+                f"{prefix}.{node.name}{suffix}"  # type: ignore
+                for prefix in parent_paths
+                for suffix in suffixes
+            ]
+        elif suffixes is not _NO_INSTANCES:
+            paths = [f"{node_path}{suffix}" for suffix in suffixes]
+
+        if paths is None:
+            # most nodes are not below instances, their path is the expanded one
+            expanded_paths.append((node_path, node_id))
+        else:
+            for expanded in paths:
+                expanded_paths.append((expanded, node_id))
+
+        for child in reversed(node.children):  # type: ignore
+            stack.append((child, node_id, f"{node_path}.{child.name}", paths))
+
+    with staged_file(path) as staging:
+        connection = sqlite3.connect(staging, isolation_level=None)
+        try:
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.executescript(_SCHEMA)
+            connection.execute("BEGIN")
+            connection.execute(
+                "INSERT INTO meta VALUES ('schema_version', ?)", (SCHEMA_VERSION,)
+            )
+            connection.executemany(
+                "INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", nodes
+            )
+            connection.executemany(
+                "INSERT INTO allowed_values VALUES (?, ?, ?)", allowed_values
+            )
+            connection.executemany(
+                "INSERT INTO instances VALUES (?, ?, ?, ?)", instances
+            )
+            connection.executemany(
+                "INSERT INTO expanded_paths VALUES (?, ?)", expanded_paths
+            )
+            for statement in _INDEXES:
+                connection.execute(statement)
+            connection.execute("ANALYZE")
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
@@ -0,0 +1,95 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare a model generated in memory with the model in a folder.
+
+Used by --check to verify that a committed model is up to date without
+writing anything. Files are compared by size first, and their contents only
+if the sizes match.
+"""
+
+import os
+from typing import Dict, List
+
+from velocitas.model_generator.depfile import list_files
+
+# created by importing the Python model, not part of it
+_IGNORED_FOLDERS = {"__pycache__"}
+
+
+class ModelDrift:
+    """Differences between a generated model and the model in a folder.
+
+    Paths are relative to the model and use / as separator. Added files are
+    only generated, removed files only exist in the folder.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty drift."""
+        self.added: List[str] = []
+        self.removed: List[str] = []
+        self.changed: List[str] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def _expected_bytes(content: str) -> bytes:
+    # the sinks write text files, translating newlines on e.g. Windows
+    return content.replace("\n", os.linesep).encode("utf-8")
+
+
+def compare_model(files: Dict[str, str], target_folder: str) -> ModelDrift:
+    """Compare the files of a model, e.g. of a MemorySink, with a folder."""
+    existing = {}
+    if os.path.isdir(target_folder):
+        for path in list_files(target_folder):
+            relative_path = os.path.relpath(path, target_folder)
+            parts = relative_path.split(os.sep)
+            if not _IGNORED_FOLDERS.intersection(parts[:-1]):
+                existing["/".join(parts)] = path
+
+    drift = ModelDrift()
+    for path in sorted(files.keys() | existing.keys()):
+        if path not in existing:
+            drift.added.append(path)
+        elif path not in files:
+            drift.removed.append(path)
+        else:
+            expected = _expected_bytes(files[path])
+            if os.path.getsize(existing[path]) != len(expected):
+                drift.changed.append(path)
+                continue
+            with open(existing[path], "rb") as file:
+                if file.read() != expected:
+                    drift.changed.append(path)
+    return drift
+
+
+def print_drift(drift: ModelDrift, target_folder: str):
+    """Print the differences, or that the model is up to date."""
+    if not drift:
+        print(f"The model in {target_folder} is up to date.")
+        return
+    for label, paths in (
+        ("added", drift.added),
+        ("removed", drift.removed),
+        ("changed", drift.changed),
+    ):
+        for path in paths:
+            print(f"{label:8} {path}")
+    print(
+        f"The model in {target_folder} is out of date: {len(drift.added)} added,"
+        f" {len(drift.removed)} removed and {len(drift.changed)} changed files."
+    )
@@ -17,17 +17,40 @@
 """CLI entry point for the model generator."""
 
 import argparse
+import contextlib
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING, Callable, List, Optional
 
-import vspec  # type: ignore
-
+# vss-tools, the input formats and the generators are imported only once the
+# arguments are parsed, see test_startup.py
 from velocitas.model_generator import generate_model
+from velocitas.model_generator.cache import (
+    DEFAULT_CACHE_MAX_SIZE,
+    ModelCache,
+    parse_size,
+)
+from velocitas.model_generator.docs import DOCS_MODES
+from velocitas.model_generator.log import configure_logging, logger
+from velocitas.model_generator.progress import JsonLinesEvents, ProgressEvent
+from velocitas.model_generator.sinks import (
+    ARCHIVE_FORMATS,
+    ArchiveSink,
+    MemorySink,
+    OutputSink,
+    archive_format_of,
+)
+
+if TYPE_CHECKING:
+    from velocitas.model_generator.prune import SignalFilter
 
 
-def main():
+def _create_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
     # The arguments we accept
 
     parser = argparse.ArgumentParser(
-        description="Convert vspec to Velocitas Vehicle Model code."
+        prog=prog, description="Convert vspec to Velocitas Vehicle Model code."
     )
     # Add para to name package
     parser.add_argument(
@@ -95,20 +118,481 @@ def main():
         "extended attributes aren't considered by the generator. This paramter is "
         "only for suppressing warnings/errors.",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=os.environ.get("VELOCITAS_MODEL_CACHE_DIR"),
+        help="Folder of a cache of generated models shared by all generator runs."
+        " Defaults to VELOCITAS_MODEL_CACHE_DIR, no cache is used if neither is set.",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=parse_size,
+        default=os.environ.get(
+            "VELOCITAS_MODEL_CACHE_MAX_SIZE", str(DEFAULT_CACHE_MAX_SIZE)
+        ),
+        help="Maximum size of the cache, e.g. 512M or 5G. Least recently used"
+        " models are evicted beyond that size.",
+    )
+    parser.add_argument(
+        "--cache-hard-link",
+        action="store_true",
+        help="Materialize cached models with hard links instead of copies.",
+    )
+    parser.add_argument(
+        "--depfile",
+        type=str,
+        help="Write a Makefile dependency file listing every file the generator"
+        " read, so build systems can skip generation if none of them changed.",
+    )
+    parser.add_argument(
+        "--depfile-target",
+        type=str,
+        help="The target of the rule in the dependency file, e.g. a stamp file."
+        " Defaults to all generated files.",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="PATTERN",
+        type=str,
+        default=[],
+        help="Only generate signals and branches whose path matches the glob"
+        " pattern, e.g. 'Vehicle.Cabin.Seat.*'. Ancestors are kept.",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        metavar="PATTERN",
+        type=str,
+        default=[],
+        help="Do not generate signals and branches whose path matches the glob"
+        " pattern, takes precedence over --include.",
+    )
+    parser.add_argument(
+        "--signals-file",
+        action="append",
+        type=str,
+        default=[],
+        help="Only generate the signals listed in the file, either an app"
+        " manifest or a text file with one path or pattern per line.",
+    )
+    parser.add_argument(
+        "--docs",
+        choices=DOCS_MODES,
+        default="full",
+        help="How the members are documented in the generated code: full,"
+        " minimal (only names and types) or external (like minimal, the"
+        " documentation is written to model-docs.json).",
+    )
+    parser.add_argument(
+        "--stubs",
+        action="store_true",
+        help="Python only: also generate .pyi type stubs carrying the"
+        " documentation, the modules are generated without docstrings.",
+    )
+    parser.add_argument(
+        "--descriptor",
+        type=str,
+        help="Also write a binary descriptor of all signals to the file, to be"
+        " memory-mapped by apps, see ModelDescriptor.hpp.",
+    )
+    parser.add_argument(
+        "--catalog",
+        type=str,
+        help="Also write an SQLite database of all signals to the file, to be"
+        " queried by tools.",
+    )
     parser.add_argument(
         "input_file_path",
         metavar="<input_file_path>",
-        help="The file to convert. Currently supports JSON and Vspec file formats.",
+        help="The file to convert. Currently supports JSON, Vspec and binary tree"
+        " (.vssb) file formats.",
     )
+    return parser
 
-    args = parser.parse_args()
 
-    ext_attributes_list = args.extended_attributes.split(",")
-    if len(ext_attributes_list) > 0:
-        vspec.model.vsstree.VSSNode.whitelisted_extended_attributes = (
-            ext_attributes_list
+def main_batch(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        prog="gen-model batch",
+        description="Generate all models listed in a manifest in one process.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes, defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "manifest",
+        metavar="<manifest>",
+        help="YAML file listing the models to generate.",
+    )
+    args = parser.parse_args(argv)
+
+    from velocitas.model_generator.batch import load_manifest, print_summary, run_batch
+
+    try:
+        jobs = load_manifest(args.manifest)
+    except ValueError as e:
+        parser.error(str(e))
+    results = run_batch(jobs, args.jobs)
+    print_summary(results)
+    if any(r.error for r in results):
+        sys.exit(1)
+
+
+def main_convert(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        prog="gen-model convert",
+        description="Convert a vspec or JSON file into a binary tree file, which"
+        " loads much faster in later generations.",
+    )
+    parser.add_argument(
+        "-I",
+        "--include-dir",
+        action="append",
+        metavar="dir",
+        type=str,
+        default=[],
+        help="Add include directory to search for included vspec files.",
+    )
+    parser.add_argument(
+        "-s",
+        "--strict",
+        action="store_true",
+        help="Use strict checking: Terminate when anything not covered"
+        " or not recommended by the core VSS specs is found.",
+    )
+    parser.add_argument(
+        "-o",
+        "--overlays",
+        action="append",
+        metavar="overlays",
+        type=str,
+        default=[],
+        help="Add overlays that will be layered on top of the VSS file in the order they"
+        " appear.",
+    )
+    parser.add_argument(
+        "-u",
+        "--units",
+        nargs="+",
+        type=str,
+        default=[],
+        help="The file locations of units files as comma separated list.",
+    )
+    parser.add_argument(
+        "-e",
+        "--extended-attributes",
+        type=str,
+        default="",
+        help="Whitelisted extended attributes as comma separated list.",
+    )
+    parser.add_argument(
+        "input_file_path",
+        metavar="<input_file_path>",
+        help="The file to convert, a JSON or Vspec file.",
+    )
+    parser.add_argument(
+        "output_file_path",
+        metavar="<output_file_path>",
+        help="The binary tree file to write, ending in .vssb.",
+    )
+    args = parser.parse_args(argv)
+    if not args.output_file_path.endswith(".vssb"):
+        parser.error("the binary tree file has to end in .vssb")
+
+    import vspec  # type: ignore
+
+    from velocitas.model_generator.tree_generator.binary_tree import (
+        write_binary_tree,
+    )
+    from velocitas.model_generator.tree_generator.file_import import (
+        FileImport,
+        UnsupportedFileFormat,
+    )
+    from velocitas.model_generator.vss_state import vss_tools_state
+
+    try:
+        with vss_tools_state(args.extended_attributes.split(",")):
+            tree = FileImport(
+                args.input_file_path,
+                args.units,
+                ["."] + args.include_dir,
+                args.strict,
+                args.overlays,
+            ).load_tree()
+    except (vspec.VSpecError, UnsupportedFileFormat) as e:
+        logger.error("Error: %s", e)
+        sys.exit(255)
+    write_binary_tree(tree, args.output_file_path)
+    logger.info("Wrote %s.", args.output_file_path)
+
+
+def _add_server_arguments(parser: argparse.ArgumentParser):
+    from velocitas.model_generator.server import DEFAULT_SOCKET
+
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=DEFAULT_SOCKET,
+        help="The Unix socket of the server, defaults to"
+        " VELOCITAS_MODEL_GENERATOR_SOCKET or a socket in the temp folder.",
+    )
+
+
+def main_serve(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        prog="gen-model serve",
+        description="Serve generation requests of gen-model client, keeping"
+        " vss-tools and recently loaded trees in memory.",
+    )
+    _add_server_arguments(parser)
+    parser.add_argument(
+        "--max-trees",
+        type=int,
+        default=8,
+        help="Number of loaded trees kept in memory.",
+    )
+    args = parser.parse_args(argv)
+
+    from velocitas.model_generator.server import create_server
+
+    server = create_server(args.socket, args.max_trees)
+    logger.info("Listening on %s...", args.socket)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(args.socket):
+            os.remove(args.socket)
+
+
+def main_client(argv: List[str]):
+    parser = _create_parser(prog="gen-model client")
+    _add_server_arguments(parser)
+    args = parser.parse_args(argv)
+
+    def absolute(path):
+        return os.path.abspath(path) if path else path
+
+    # the server resolves paths relative to its own working directory
+    request_args = {
+        "input_file_path": absolute(args.input_file_path),
+        "input_unit_file_path_list": [absolute(u) for u in args.units],
+        "language": args.language,
+        "target_folder": absolute(args.target_folder),
+        "name": args.name,
+        "strict": args.strict,
+        "include_dir": [os.getcwd()] + [absolute(i) for i in args.include_dir],
+        "ext_attributes_list": args.extended_attributes.split(","),
+        "overlays": [absolute(o) for o in args.overlays],
+        "cache_dir": absolute(args.cache_dir),
+        "cache_max_size": args.cache_max_size,
+        "cache_hard_link": args.cache_hard_link,
+        "depfile": absolute(args.depfile),
+        "depfile_target": args.depfile_target,
+        "include": args.include,
+        "exclude": args.exclude,
+        "signals_files": [absolute(f) for f in args.signals_file],
+        "docs": args.docs,
+        "stubs": args.stubs,
+        "descriptor": absolute(args.descriptor),
+        "catalog": absolute(args.catalog),
+    }
+
+    from velocitas.model_generator.server import send_request
+
+    response = send_request({"command": "generate", "args": request_args}, args.socket)
+    print(response["output"], end="")
+    sys.exit(response["exit_code"])
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    configure_logging()
+    if argv[:1] == ["batch"]:
+        main_batch(argv[1:])
+        return
+    if argv[:1] == ["serve"]:
+        main_serve(argv[1:])
+        return
+    if argv[:1] == ["client"]:
+        main_client(argv[1:])
+        return
+    if argv[:1] == ["convert"]:
+        main_convert(argv[1:])
+        return
+
+    parser = _create_parser()
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate the changed parts of the model whenever"
+        " an input file changes.",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=0.5,
+        help="Seconds between two checks of the input files in watch mode.",
+    )
+    parser.add_argument(
+        "--archive",
+        type=str,
+        help="Write the model into a tar or zip archive instead of the target"
+        " folder, '-' streams the archive to stdout.",
+    )
+    parser.add_argument(
+        "--archive-format",
+        choices=ARCHIVE_FORMATS,
+        help="The format of the archive, guessed from its file name by default.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Load the tree and print its statistics and the size of the models"
+        " instead of generating the model.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Generate the model in memory and compare it with the target folder"
+        " instead of writing it, exits with 1 if they differ.",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Only print warnings and errors.",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Also print the collections and types generated for each branch.",
+    )
+    parser.add_argument(
+        "--events",
+        type=str,
+        help="Write the progress of the generation as JSON lines to the file,"
+        " '-' writes them to stderr.",
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Drop the documentation of the loaded signals once it is rendered,"
+        " for very large trees. Has no effect with external docs, --descriptor"
+        " or --catalog, which need it afterwards.",
+    )
+    args = parser.parse_args(argv)
+    if args.archive and args.watch:
+        parser.error("--archive cannot be combined with --watch")
+    if args.events and args.watch:
+        parser.error("--events cannot be combined with --watch")
+    if args.low_memory and args.watch:
+        parser.error("--low-memory cannot be combined with --watch")
+    if args.dry_run and (args.watch or args.archive or args.events):
+        parser.error("--dry-run cannot be combined with --watch, --archive or --events")
+    if args.dry_run and (
+        args.cache_dir or args.depfile or args.descriptor or args.catalog
+    ):
+        parser.error(
+            "--dry-run cannot be combined with --cache-dir, --depfile, --descriptor"
+            " or --catalog"
+        )
+    if args.check and (args.watch or args.archive or args.dry_run):
+        parser.error("--check cannot be combined with --watch, --archive or --dry-run")
+    if args.check and (
+        args.cache_dir or args.depfile or args.descriptor or args.catalog
+    ):
+        # a check must not touch the disk
+        parser.error(
+            "--check cannot be combined with --cache-dir, --depfile, --descriptor"
+            " or --catalog"
         )
-        print(f"Known extended attributes: {', '.join(ext_attributes_list)}")
+
+    if args.quiet:
+        configure_logging(logging.WARNING)
+    elif args.verbose:
+        configure_logging(logging.DEBUG)
+
+    with contextlib.ExitStack() as stack:
+        progress = None
+        if args.events:
+            events_file = (
+                sys.stderr
+                if args.events == "-"
+                else stack.enter_context(open(args.events, "w", encoding="utf-8"))
+            )
+            progress = JsonLinesEvents(events_file)
+        _main_archive(args, progress)
+
+
+def _main_archive(
+    args: argparse.Namespace, progress: Optional[Callable[[ProgressEvent], None]]
+):
+    if not args.archive:
+        _main_generate(args, None, progress)
+        return
+
+    archive_format = args.archive_format or archive_format_of(args.archive)
+    if args.archive == "-":
+        # the archive is streamed to stdout, so all messages go to stderr
+        sink = ArchiveSink(sys.stdout.buffer, archive_format)
+        with contextlib.redirect_stdout(sys.stderr):
+            _main_generate(args, sink, progress)
+        sink.close()
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.archive, "wb") as archive_file:
+            with ArchiveSink(archive_file, archive_format) as sink:
+                _main_generate(args, sink, progress)
+
+
+def _main_generate(
+    args: argparse.Namespace,
+    sink: Optional[OutputSink],
+    progress: Optional[Callable[[ProgressEvent], None]] = None,
+):
+    from velocitas.model_generator.prune import SignalFilter
+
+    ext_attributes_list = args.extended_attributes.split(",")
+    requested_filter = SignalFilter(args.include, args.exclude, args.signals_file)
+    signal_filter = requested_filter if requested_filter.is_active() else None
+
+    if args.dry_run:
+        _main_dry_run(args, ext_attributes_list, signal_filter)
+        return
+
+    if args.watch:
+        from velocitas.model_generator.watch import ModelWatcher
+
+        ModelWatcher(
+            args.input_file_path,
+            args.units,
+            args.language,
+            args.target_folder,
+            args.name,
+            args.strict,
+            ["."] + args.include_dir,
+            args.overlays,
+            signal_filter,
+            ext_attributes_list,
+            args.docs,
+            args.stubs,
+            args.descriptor,
+            args.catalog,
+        ).watch(args.watch_interval)
+        return
+
+    check_sink: Optional[MemorySink] = None
+    if args.check:
+        sink = check_sink = MemorySink()
 
     generate_model(
         args.input_file_path,
@@ -120,6 +604,61 @@ def main():
         args.include_dir,
         ext_attributes_list,
         args.overlays,
+        ModelCache(args.cache_dir, args.cache_max_size, args.cache_hard_link)
+        if args.cache_dir
+        else None,
+        args.depfile,
+        args.depfile_target,
+        signal_filter,
+        sink,
+        progress,
+        args.docs,
+        args.stubs,
+        args.descriptor,
+        args.catalog,
+        args.low_memory,
+    )
+
+    if check_sink is not None:
+        from velocitas.model_generator.check import compare_model, print_drift
+
+        drift = compare_model(check_sink.files, args.target_folder)
+        print_drift(drift, args.target_folder)
+        if drift:
+            sys.exit(1)
+
+
+def _main_dry_run(
+    args: argparse.Namespace,
+    ext_attributes_list: List[str],
+    signal_filter: Optional["SignalFilter"],
+):
+    import vspec  # type: ignore
+
+    from velocitas.model_generator.stats import analyze_tree, print_statistics
+    from velocitas.model_generator.tree_generator.file_import import (
+        FileImport,
+        UnsupportedFileFormat,
+    )
+    from velocitas.model_generator.vss_state import vss_tools_state
+
+    try:
+        file_import = FileImport(
+            args.input_file_path,
+            args.units,
+            ["."] + args.include_dir,
+            args.strict,
+            args.overlays,
+        )
+        with vss_tools_state(ext_attributes_list):
+            tree = file_import.load_tree()
+    except (vspec.VSpecError, UnsupportedFileFormat) as e:
+        logger.error("Error: %s", e)
+        sys.exit(255)
+    if signal_filter is not None:
+        tree = signal_filter.prune(tree)
+    print_statistics(
+        analyze_tree(tree, args.name, [args.language], docs=args.docs, stubs=args.stubs)
     )
 
 
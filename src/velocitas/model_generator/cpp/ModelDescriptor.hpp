@@ -0,0 +1,370 @@
+// Copyright (c) 2026 Contributors to the Eclipse Foundation
+//
+// This program and the accompanying materials are made available under the
+// terms of the Apache License, Version 2.0 which is available at
+// https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+//
+// SPDX-License-Identifier: Apache-2.0
+
+// Header-only reader of the binary model descriptor written by
+// `gen-model --descriptor`, see velocitas/model_generator/descriptor.py for
+// the layout. The file is mapped read-only, so all apps reading the same
+// descriptor share its pages. Nodes and strings are views into the mapping
+// and valid as long as the ModelDescriptor lives. Requires C++17 and POSIX.
+
+#ifndef VELOCITAS_MODEL_DESCRIPTOR_H
+#define VELOCITAS_MODEL_DESCRIPTOR_H
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <optional>
+#include <stdexcept>
+#include <string>
+#include <string_view>
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ != __ORDER_LITTLE_ENDIAN__
+#error "The model descriptor is little-endian"
+#endif
+
+namespace velocitas::descriptor {
+
+constexpr char MAGIC[8] = {'V', 'S', 'S', 'D', 'E', 'S', 'C', '\0'};
+constexpr uint32_t VERSION = 1;
+constexpr uint32_t NO_STRING = 0xFFFFFFFF;
+constexpr uint8_t HAS_MIN = 1;
+constexpr uint8_t HAS_MAX = 2;
+
+enum class Kind : uint8_t { Branch, Attribute, Sensor, Actuator, Struct, Property };
+
+struct Header {
+    char     magic[8];
+    uint32_t version;
+    uint32_t headerSize;
+    uint32_t nodeCount;
+    uint32_t stringCount;
+    uint32_t levelCount;
+    uint32_t listCount;
+    uint32_t stringsOffset;
+    uint32_t stringDataOffset;
+    uint32_t nodesOffset;
+    uint32_t levelsOffset;
+    uint32_t listsOffset;
+    uint32_t fileSize;
+    uint8_t  reserved[8];
+};
+static_assert(sizeof(Header) == 64);
+
+struct NodeRecord {
+    int32_t  parent;
+    uint32_t firstChild;
+    uint32_t childCount;
+    uint32_t name;
+    uint32_t path;
+    uint32_t description;
+    uint32_t comment;
+    uint32_t datatype;
+    uint32_t unit;
+    uint32_t allowedFirst;
+    uint32_t allowedCount;
+    uint32_t levelFirst;
+    uint32_t levelCount;
+    uint8_t  kind;
+    uint8_t  flags;
+    uint8_t  reserved[2];
+    double   min;
+    double   max;
+};
+static_assert(sizeof(NodeRecord) == 72);
+
+struct LevelRecord {
+    uint32_t name;
+    uint32_t first;
+    uint32_t count;
+    uint8_t  isRange;
+    uint8_t  reserved[3];
+    int32_t  lower;
+    int32_t  upper;
+};
+static_assert(sizeof(LevelRecord) == 24);
+
+class ModelDescriptor;
+
+/** One level of the instances of a branch, e.g. Row[1,2]. */
+class Level {
+public:
+    Level(const ModelDescriptor& descriptor, const LevelRecord& record)
+        : m_descriptor(&descriptor)
+        , m_record(&record) {}
+
+    std::string_view name() const;
+    bool             isRange() const { return m_record->isRange != 0; }
+    int32_t          lower() const { return m_record->lower; }
+    int32_t          upper() const { return m_record->upper; }
+    uint32_t         size() const { return m_record->count; }
+    std::string_view element(uint32_t index) const;
+
+private:
+    const ModelDescriptor* m_descriptor;
+    const LevelRecord*     m_record;
+};
+
+/** A node of the descriptor, all accessors read the mapped record. */
+class Node {
+public:
+    Node(const ModelDescriptor& descriptor, uint32_t index);
+
+    uint32_t                        index() const { return m_index; }
+    std::optional<Node>             parent() const;
+    uint32_t                        childCount() const { return m_record->childCount; }
+    Node                            child(uint32_t index) const;
+    std::string_view                name() const;
+    std::string_view                path() const;
+    std::string_view                description() const;
+    std::string_view                comment() const;
+    std::optional<std::string_view> datatype() const;
+    std::optional<std::string_view> unit() const;
+    Kind                            kind() const { return static_cast<Kind>(m_record->kind); }
+    std::optional<double>           min() const;
+    std::optional<double>           max() const;
+    uint32_t                        allowedCount() const { return m_record->allowedCount; }
+    std::string_view                allowed(uint32_t index) const;
+    uint32_t                        levelCount() const { return m_record->levelCount; }
+    Level                           level(uint32_t index) const;
+
+private:
+    const ModelDescriptor* m_descriptor;
+    uint32_t               m_index;
+    const NodeRecord*      m_record;
+};
+
+/** A descriptor mapped read-only into memory. */
+class ModelDescriptor {
+public:
+    /** Map the descriptor file, throws std::runtime_error if it is invalid. */
+    explicit ModelDescriptor(const std::string& path) {
+        int fd = ::open(path.c_str(), O_RDONLY | O_CLOEXEC);
+        if (fd < 0) {
+            throw std::runtime_error("Cannot open model descriptor " + path);
+        }
+        struct stat status {};
+        if (::fstat(fd, &status) != 0 || status.st_size < static_cast<off_t>(sizeof(Header))) {
+            ::close(fd);
+            throw std::runtime_error(path + " is not a model descriptor");
+        }
+        m_size = static_cast<size_t>(status.st_size);
+        void* data = ::mmap(nullptr, m_size, PROT_READ, MAP_SHARED, fd, 0);
+        ::close(fd);
+        if (data == MAP_FAILED) {
+            throw std::runtime_error("Cannot map model descriptor " + path);
+        }
+        m_mapping = data;
+        m_data = static_cast<const uint8_t*>(data);
+        try {
+            validate();
+        } catch (...) {
+            ::munmap(m_mapping, m_size);
+            throw;
+        }
+    }
+
+    /** Read a descriptor already in memory, which must outlive the reader. */
+    ModelDescriptor(const void* data, size_t size)
+        : m_data(static_cast<const uint8_t*>(data))
+        , m_size(size) {
+        validate();
+    }
+
+    ModelDescriptor(const ModelDescriptor&)            = delete;
+    ModelDescriptor& operator=(const ModelDescriptor&) = delete;
+
+    ~ModelDescriptor() {
+        if (m_mapping != nullptr) {
+            ::munmap(m_mapping, m_size);
+        }
+    }
+
+    uint32_t size() const { return header().nodeCount; }
+
+    Node root() const { return node(0); }
+
+    Node node(uint32_t index) const {
+        if (index >= size()) {
+            throw std::out_of_range("Node index is out of range");
+        }
+        return Node(*this, index);
+    }
+
+    /** Find the node of a VSS path, e.g. Vehicle.Cabin.Door. */
+    std::optional<Node> find(std::string_view path) const {
+        Node   current = root();
+        size_t end     = path.find('.');
+        if (path.substr(0, end) != current.name()) {
+            return std::nullopt;
+        }
+        while (end != std::string_view::npos) {
+            size_t           start = end + 1;
+            end                    = path.find('.', start);
+            std::string_view name  = path.substr(start, end == std::string_view::npos ? end : end - start);
+            bool             found = false;
+            for (uint32_t i = 0; i < current.childCount(); ++i) {
+                Node child = current.child(i);
+                if (child.name() == name) {
+                    current = child;
+                    found   = true;
+                    break;
+                }
+            }
+            if (!found) {
+                return std::nullopt;
+            }
+        }
+        return current;
+    }
+
+    std::string_view string(uint32_t index) const {
+        const auto* offsets = at<uint32_t>(header().stringsOffset);
+        const auto* data    = reinterpret_cast<const char*>(m_data + header().stringDataOffset);
+        return std::string_view(data + offsets[index], offsets[index + 1] - offsets[index]);
+    }
+
+    std::optional<std::string_view> optionalString(uint32_t index) const {
+        if (index == NO_STRING) {
+            return std::nullopt;
+        }
+        return string(index);
+    }
+
+    std::string_view listString(uint32_t index) const {
+        return string(at<uint32_t>(header().listsOffset)[index]);
+    }
+
+    const NodeRecord& nodeRecord(uint32_t index) const {
+        return at<NodeRecord>(header().nodesOffset)[index];
+    }
+
+    const LevelRecord& levelRecord(uint32_t index) const {
+        return at<LevelRecord>(header().levelsOffset)[index];
+    }
+
+private:
+    const Header& header() const { return *at<Header>(0); }
+
+    template <typename T> const T* at(uint32_t offset) const {
+        // all sections are aligned to 8 bytes
+        return reinterpret_cast<const T*>(m_data + offset);
+    }
+
+    void validate() const {
+        if (m_size < sizeof(Header) || std::memcmp(header().magic, MAGIC, sizeof(MAGIC)) != 0) {
+            throw std::runtime_error("Not a model descriptor");
+        }
+        if (header().version != VERSION) {
+            throw std::runtime_error("Model descriptor version is not supported");
+        }
+        if (header().fileSize > m_size || header().nodeCount == 0) {
+            throw std::runtime_error("Model descriptor is truncated");
+        }
+    }
+
+    void*          m_mapping{nullptr};
+    const uint8_t* m_data;
+    size_t         m_size;
+};
+
+inline std::string_view Level::name() const {
+    return m_descriptor->string(m_record->name);
+}
+
+inline std::string_view Level::element(uint32_t index) const {
+    if (index >= m_record->count) {
+        throw std::out_of_range("Instance index is out of range");
+    }
+    return m_descriptor->listString(m_record->first + index);
+}
+
+inline Node::Node(const ModelDescriptor& descriptor, uint32_t index)
+    : m_descriptor(&descriptor)
+    , m_index(index)
+    , m_record(&descriptor.nodeRecord(index)) {}
+
+inline std::optional<Node> Node::parent() const {
+    if (m_record->parent < 0) {
+        return std::nullopt;
+    }
+    return Node(*m_descriptor, static_cast<uint32_t>(m_record->parent));
+}
+
+inline Node Node::child(uint32_t index) const {
+    if (index >= m_record->childCount) {
+        throw std::out_of_range("Child index is out of range");
+    }
+    return Node(*m_descriptor, m_record->firstChild + index);
+}
+
+inline std::string_view Node::name() const {
+    return m_descriptor->string(m_record->name);
+}
+
+inline std::string_view Node::path() const {
+    return m_descriptor->string(m_record->path);
+}
+
+inline std::string_view Node::description() const {
+    return m_descriptor->string(m_record->description);
+}
+
+inline std::string_view Node::comment() const {
+    return m_descriptor->string(m_record->comment);
+}
+
+inline std::optional<std::string_view> Node::datatype() const {
+    return m_descriptor->optionalString(m_record->datatype);
+}
+
+inline std::optional<std::string_view> Node::unit() const {
+    return m_descriptor->optionalString(m_record->unit);
+}
+
+inline std::optional<double> Node::min() const {
+    if ((m_record->flags & HAS_MIN) == 0) {
+        return std::nullopt;
+    }
+    return m_record->min;
+}
+
+inline std::optional<double> Node::max() const {
+    if ((m_record->flags & HAS_MAX) == 0) {
+        return std::nullopt;
+    }
+    return m_record->max;
+}
+
+inline std::string_view Node::allowed(uint32_t index) const {
+    if (index >= m_record->allowedCount) {
+        throw std::out_of_range("Allowed value index is out of range");
+    }
+    return m_descriptor->listString(m_record->allowedFirst + index);
+}
+
+inline Level Node::level(uint32_t index) const {
+    if (index >= m_record->levelCount) {
+        throw std::out_of_range("Instance level index is out of range");
+    }
+    return Level(*m_descriptor, m_descriptor->levelRecord(m_record->levelFirst + index));
+}
+
+} // namespace velocitas::descriptor
+
+#endif // VELOCITAS_MODEL_DESCRIPTOR_H
@@ -14,35 +14,78 @@
 
 """VehicleModelCppGenerator."""
 
-import os
-import re
-from typing import List, Set
+import functools
+from typing import List, Optional, Set
 
 # Until vsspec issue will be fixed: https://github.com/COVESA/vss-tools/issues/208
 from vspec.model.constants import VSSType  # type: ignore
 from vspec.model.vsstree import VSSNode  # type: ignore
 
-from velocitas.model_generator.cpp.cpp_keywords import cpp_keywords
-from velocitas.model_generator.utils import CodeGeneratorContext, camel_to_snake_case
+from velocitas.model_generator.docs import DOCS_FILE, docs_index, member_type
+from velocitas.model_generator.memory import release_payload
+from velocitas.model_generator.naming import ModelNames, cpp_namespace_name
+from velocitas.model_generator.sinks import FileSystemSink, OutputSink
+from velocitas.model_generator.utils import CodeGeneratorContext, Template
+
+_HEADER = Template("#ifndef %GUARD%\n#define %GUARD%\n\n")
+_FOOTER = Template("} // namespace %NAMESPACE%\n\n#endif // %GUARD%\n")
+
+_DATAPOINT_MEMBER = Template("velocitas::DataPoint%TYPE% %NAME%;\n\n")
+_COLLECTION_MEMBER = Template("%NAME%Collection %NAME%;\n\n")
+_BRANCH_MEMBER = Template("%NAMESPACE%::%NAME% %NAME%;\n\n")
+_MEMBER_NAME = Template("/** %NAME%: %TYPE% */\n")
+
+
+@functools.lru_cache(maxsize=None)
+def _member_doc(comment: bool, value_range: bool, unit: bool, allowed: bool):
+    """Return the template documenting a member with the given details."""
+    text = "/**\n* %NAME%: %TYPE%\n* %DESCRIPTION%\n*\n"
+    if comment:
+        text += "* %COMMENT%\n*\n"
+    if value_range:
+        text += "* Value range: [%MIN%, %MAX%]\n"
+    if unit:
+        text += "* Unit: %UNIT%\n"
+    if allowed:
+        text += "* Allowed values: %ALLOWED%\n"
+    return Template(text + "**/\n")
 
 
 class VehicleModelCppGenerator:
     """Generate c++ code for vehicle model."""
 
-    def __init__(self, root_node: VSSNode, target_folder: str, root_namespace: str):
+    def __init__(
+        self,
+        root_node: VSSNode,
+        target_folder: str,
+        root_namespace: str,
+        sink: Optional[OutputSink] = None,
+        docs: str = "full",
+        release_payloads: bool = False,
+    ):
         """Initialize the c++ generator.
 
         Args:
             root_node (VSSNode): The root node of the VSS tree
             target_folder (str): The path to the output folder
             root_namespace (str): The root namespace to use to which VSS based namespaces will be appended
+            sink (Optional[OutputSink]): Where the files are written to, defaults to the output folder
+            docs (str): How the members are documented, see DOCS_MODES
+            release_payloads (bool): Drop the documentation of the nodes of each
+                branch once its header is written, see release_payload. Ignored
+                for external docs, which need all of it at the end
         """
         self.root_node = root_node
         self.target_folder = target_folder
+        self.sink = sink if sink is not None else FileSystemSink(target_folder)
+        self.docs = docs
+        self.release_payloads = release_payloads and docs != "external"
+        self.branches: Optional[Set[str]] = None
         self.ctx_header = CodeGeneratorContext()
         self.includes: Set[str] = set()
         self.external_includes: Set[str] = set()
         self.root_namespace_list = self.__split_into_namespace_list(root_namespace)
+        self.names = ModelNames(root_node, self.root_namespace_list)
 
     def __split_into_namespace_list(self, namespace: str) -> List[str]:
         if "::" in namespace:
@@ -53,26 +96,40 @@ def __split_into_namespace_list(self, namespace: str) -> List[str]:
             return namespace.split("/")
         return [namespace]
 
-    def generate(self):
-        """Generate c++ code for vehicle model."""
-        self.root_path = os.path.join(self.target_folder, "include")
-
-        path = os.path.join(
-            self.root_path, *self.__to_folder_names(self.root_namespace_list)
-        )
+    def generate(self, branches: Optional[Set[str]] = None):
+        """Generate c++ code for vehicle model.
 
-        os.makedirs(path)
+        Args:
+            branches (Optional[Set[str]]): Qualified names of the branches to
+                render into an existing model, all branches if None.
+        """
+        self.branches = branches
 
-        self.__gen_model(self.root_node, self.root_namespace_list, is_root=True)
-        self.__visit_nodes(self.root_node, self.root_namespace_list)
+        if self.__is_selected(self.root_node):
+            self.__gen_model(self.root_node, is_root=True)
+        self.__visit_nodes(self.root_node)
         # self.__gen_cmake_project()
-        self.__gen_conan_package()
+        if branches is None:
+            self.generate_package()
+        if self.docs == "external":
+            self.sink.write(DOCS_FILE, docs_index(self.root_node))
+        self.sink.flush()
+
+    def remove_branch(self, qualified_name: str):
+        """Remove the header of a branch and of all its sub branches."""
+        namespace_list = self.root_namespace_list + qualified_name.split(".")[1:]
+        self.sink.remove(
+            "/".join(["include"] + [cpp_namespace_name(n) for n in namespace_list])
+        )
+
+    def __is_selected(self, node: VSSNode) -> bool:
+        return self.branches is None or self.names[node].path in self.branches
 
-    def __gen_conan_package(self):
-        path = os.path.join(self.target_folder, "conanfile.py")
-        with open(path, "w", encoding="utf-8") as file:
-            file.write(
-                """from conan import ConanFile
+    def generate_package(self):
+        """Write the conan package around the headers."""
+        self.sink.write(
+            "conanfile.py",
+            """from conan import ConanFile
 from conan.tools.files import copy
 import os
 
@@ -92,61 +149,45 @@ def package(self):
         copy(self,"*.hpp",
             src=os.path.join(self.source_folder, "include"),
             dst=os.path.join(self.package_folder, "include"),)
-"""
-            )
+""",
+        )
+
+    @staticmethod
+    def __branches(node: VSSNode) -> List[VSSNode]:
+        """The branches below the node, in reverse order for a stack."""
+        return [
+            child for child in reversed(node.children) if child.type == VSSType.BRANCH
+        ]
 
-    def __visit_nodes(self, node: VSSNode, parent_namespace_list: List[str]):
-        """Recursively render nodes."""
+    def __visit_nodes(self, node: VSSNode):
+        """Render the branches below the node in pre-order.
+
+        Uses an explicit stack, deep trees do not hit the recursion limit.
+        """
+        stack = self.__branches(node)
+        while stack:
+            branch = stack.pop()
+            if self.__is_selected(branch):
+                self.__gen_model(branch)
+            stack.extend(self.__branches(branch))
+
+    def __release_payloads(self, node: VSSNode):
+        # the parent header documenting the node was written before
+        release_payload(node)
+        self.names.release(node)
         for child in node.children:
-            child_namespace_list = parent_namespace_list + [child.name]
-            child_path = os.path.join(
-                self.root_path, *self.__to_folder_names(child_namespace_list)
-            )
+            if child.type != VSSType.BRANCH:
+                release_payload(child)
 
-            if child.type == VSSType.BRANCH:
-                if not os.path.exists(child_path):
-                    os.makedirs(child_path)
-                self.__gen_model(child, child_namespace_list)
-                self.__visit_nodes(child, child_namespace_list)
-
-    def __generate_opening_namespace_text(self, namespace_list: List[str]) -> str:
-        return "namespace " + self.__get_namespace(namespace_list) + " {\n"
-
-    def __generate_closing_namespace_text(self, namespace_list: List[str]) -> str:
-        return "} // namespace " + self.__get_namespace(namespace_list) + "\n"
-
-    def __convert_to_namespace(self, name: str) -> str:
-        namespace = camel_to_snake_case(name)
-        if namespace in cpp_keywords:
-            namespace += "_"
-        return namespace
-
-    def __to_folder_names(self, namespace_list: List[str]) -> List[str]:
-        return [self.__convert_to_namespace(n) for n in namespace_list]
-
-    def __get_namespace(self, namespace_list: List[str]) -> str:
-        converted_list = [self.__convert_to_namespace(n) for n in namespace_list]
-        return "::".join(converted_list)
-
-    def __generate_guard_name(self, namespace_list: List[str], node: VSSNode) -> str:
-        path_list = [n.upper() for n in self.__to_folder_names(namespace_list)]
-        path_list.append(node.name.upper())
-        return "_".join(path_list) + "_H"
-
-    def __gen_header(self, namespace_list: List[str], node: VSSNode):
-        guard_name = self.__generate_guard_name(namespace_list, node)
-        self.ctx_header.write(
-            f"""#ifndef {guard_name}
-            #define {guard_name}\n\n""",
-            strip_lines=True,
-        )
+    def __generate_opening_namespace_text(self, node: VSSNode) -> str:
+        return "namespace " + self.names[node].namespace + " {\n"
 
-    def __gen_footer(self, namespace_list: List[str], node: VSSNode):
-        self.ctx_header.write(self.__generate_closing_namespace_text(namespace_list))
-        self.ctx_header.write("\n")
-        self.ctx_header.write(
-            f"#endif // {self.__generate_guard_name(namespace_list, node)}\n"
-        )
+    def __gen_header(self, node: VSSNode):
+        self.ctx_header.emit(_HEADER, GUARD=self.names[node].guard)
+
+    def __gen_footer(self, node: VSSNode):
+        names = self.names[node]
+        self.ctx_header.emit(_FOOTER, NAMESPACE=names.namespace, GUARD=names.guard)
 
     def __gen_imports(self, node: VSSNode):
         self.ctx_header.write('#include "sdk/DataPoint.h"\n')
@@ -174,39 +215,37 @@ def __gen_model_docstring(self, node: VSSNode):
         self.ctx_header.write(f"/** {node.name} model. */\n")
 
     def __document_member(self, node: VSSNode):
-        self.ctx_header.write("/**\n")
-        if node.type.value == "attribute":
-            assert node.datatype is not None
-            self.ctx_header.write(
-                f"* {node.name}: {node.type.value} ({node.datatype.value})\n"
-            )
-        else:
-            self.ctx_header.write(f"* {node.name}: {node.type.value}\n")
-
-        self.ctx_header.write(f"* {node.description}\n")
-        self.ctx_header.write("*\n")
-        if len(node.comment) > 0:
-            self.ctx_header.write(f"* {node.comment}\n")
-            self.ctx_header.write("*\n")
-
-        if not isinstance(node.min, str) or not isinstance(node.max, str):
-            self.ctx_header.write(f"* Value range: [{node.min}, {node.max}]\n")
-        if hasattr(node, "unit"):
-            self.ctx_header.write(f"* Unit: {node.unit}\n")
-        if len(node.allowed) > 0:
-            allowed_values = ", ".join(node.allowed)
-            self.ctx_header.write(f"* Allowed values: {allowed_values}\n")
-        self.ctx_header.write("**/\n")
+        if self.docs != "full":
+            self.ctx_header.emit(_MEMBER_NAME, NAME=node.name, TYPE=member_type(node))
+            return
+        doc = {
+            "NAME": node.name,
+            "TYPE": member_type(node),
+            "DESCRIPTION": f"{node.description}",
+        }
+
+        comment = len(node.comment) > 0
+        if comment:
+            doc["COMMENT"] = f"{node.comment}"
+        value_range = not isinstance(node.min, str) or not isinstance(node.max, str)
+        if value_range:
+            doc["MIN"] = f"{node.min}"
+            doc["MAX"] = f"{node.max}"
+        unit = hasattr(node, "unit")
+        if unit:
+            doc["UNIT"] = f"{node.unit}"
+        allowed = len(node.allowed) > 0
+        if allowed:
+            doc["ALLOWED"] = ", ".join(node.allowed)
+        self.ctx_header.emit(_member_doc(comment, value_range, unit, allowed), **doc)
 
     def __gen_nested_class(
         self,
-        namespace_list: List[str],
         child: VSSNode,
         instances: list[tuple[str, list]],
         index: int,
-    ) -> str:
-        child_namespace_list = namespace_list + [child.name]
-        child_namespace = self.__get_namespace(child_namespace_list)
+    ) -> CodeGeneratorContext:
+        child_namespace = self.names[child].namespace
         name, values = instances[index]
         nested_name = (
             instances[index + 1][0] if index + 1 < len(instances) else child.name
@@ -282,8 +321,8 @@ def __gen_nested_class(
         class_code_context = CodeGeneratorContext()
         class_code_context.write(f"class {class_name} : public ParentClass {{\n")
 
-        # one indentation is lost after the first line when using replace,
-        # that`s why we add an additional one for nested classes
+        # nested classes fill the NESTED_CLASSES slot verbatim and write_slot
+        # only indents their first line, so the others are one level deeper
         if class_name.endswith("Type"):
             class_code_context.indent()
 
@@ -291,7 +330,8 @@ def __gen_nested_class(
 
         with class_code_context as public_scope:
             if name.endswith("Collection"):
-                public_scope.write("%NESTED_CLASSES%\n")
+                public_scope.write_slot("NESTED_CLASSES")
+                public_scope.write("\n")
             public_scope.write(f"{class_name}({ctor_params})")
             if len(ctor_initializer_str) > 0:
                 with public_scope as ctor_initializer_list_scope:
@@ -306,17 +346,13 @@ def __gen_nested_class(
             public_scope.write(f"{member_list_str}" + ";\n")
 
         class_code_context.write("};\n")
-        return class_code_context.get_content()
+        return class_code_context
 
-    def __gen_collection_types(self, node: VSSNode, namespace_list: List[str]) -> str:
+    def __gen_collection_types(self, node: VSSNode) -> str:
         collection_types = []
         for child in node.children:
             if child.type == VSSType.BRANCH:
-                child_namespace_list = namespace_list + [child.name]
-                path = os.path.join(
-                    *self.__to_folder_names(child_namespace_list), child.name
-                )
-                self.includes.add(path)
+                self.includes.add(self.names[child].include)
 
                 if child.instances:
                     instances = [
@@ -326,27 +362,26 @@ def __gen_collection_types(self, node: VSSNode, namespace_list: List[str]) -> st
 
                     # create all nested classes for this sub-tree
                     for i in range(len(instances) - 1):
-                        nested_class = self.__gen_nested_class(
-                            namespace_list, child, instances, i
-                        )
+                        nested_class = self.__gen_nested_class(child, instances, i)
                         generated_classes.append(nested_class)
 
+                    nested_classes = [c.get_content() for c in generated_classes[1:]]
                     collection_types.append(
-                        generated_classes[0].replace(
-                            "%NESTED_CLASSES%", "\n\n".join(generated_classes[1:])
+                        generated_classes[0].get_content(
+                            NESTED_CLASSES="\n\n".join(nested_classes)
                         )
                     )
 
         return "\n\n".join(collection_types)
 
-    def __gen_model(self, node: VSSNode, namespace_list: List[str], is_root=False):
+    def __gen_model(self, node: VSSNode, is_root=False):
         # must be done before generating the imports, since it is adding imports
         # to the list
-        collection_types = self.__gen_collection_types(node, namespace_list)
+        collection_types = self.__gen_collection_types(node)
 
-        self.__gen_header(namespace_list, node)
+        self.__gen_header(node)
         self.__gen_imports(node)
-        self.ctx_header.write(self.__generate_opening_namespace_text(namespace_list))
+        self.ctx_header.write(self.__generate_opening_namespace_text(node))
         # Provide an alias for the parent class to avoid name conflicts with members
         self.ctx_header.write("using ParentClass = velocitas::Model;\n\n")
         self.__gen_model_docstring(node)
@@ -369,93 +404,61 @@ def __gen_model(self, node: VSSNode, namespace_list: List[str], is_root=False):
                 header_public.write("ParentClass(name, parent)")
                 self.external_includes.add("string")
 
-            header_public.write("%MEMBER%\n")
+            header_public.write_slot("MEMBER")
+            header_public.write("\n")
             header_public.dedent()
             header_public.write("{}\n\n")
 
             # create members
-            member = ""
+            member: List[str] = []
             for child in node.children:
                 self.__document_member(child)
 
                 if child.type.value in ("attribute", "sensor", "actuator"):
                     data_type = self.__get_data_type(child.datatype.value)
-                    header_public.write(
-                        f"velocitas::DataPoint{data_type} {child.name};\n\n"
+                    header_public.emit(
+                        _DATAPOINT_MEMBER, TYPE=data_type, NAME=child.name
                     )
-                    member += (
+                    member.append(
                         ",\n\t\t"
                         + f'{child.name}("{child.name}", Type::{child.type.value.upper()}, this)'
                     )
 
                 if child.type == VSSType.BRANCH:
                     if child.instances:
-                        header_public.write(f"{child.name}Collection {child.name};\n\n")
-                        member += ",\n\t\t" + f"{child.name}(this)"
+                        header_public.emit(_COLLECTION_MEMBER, NAME=child.name)
+                        member.append(",\n\t\t" + f"{child.name}(this)")
                     else:
-                        child_namespace_list = namespace_list + [child.name]
-                        child_namespace = self.__get_namespace(child_namespace_list)
-                        header_public.write(
-                            f"{child_namespace}::{child.name} {child.name};\n\n"
+                        header_public.emit(
+                            _BRANCH_MEMBER,
+                            NAMESPACE=self.names[child].namespace,
+                            NAME=child.name,
                         )
-                        member += ",\n\t\t" + f'{child.name}("{child.name}", this)'
+                        member.append(",\n\t\t" + f'{child.name}("{child.name}", this)')
 
         self.ctx_header.write("};\n\n")
 
-        self.__gen_footer(namespace_list, node)
+        self.__gen_footer(node)
 
-        relative_header_path = os.path.join(
-            *self.__to_folder_names(namespace_list), f"{node.name}.hpp"
+        self.sink.write(
+            self.names[node].header,
+            self.ctx_header.get_content(MEMBER="".join(member)),
         )
 
-        with open(
-            os.path.join(self.root_path, relative_header_path),
-            "w",
-            encoding="utf-8",
-        ) as file:
-            file.write(self.ctx_header.get_content().replace("%MEMBER%", member))
-
         self.ctx_header.reset()
+        if self.release_payloads:
+            self.__release_payloads(node)
 
     def __gen_instances(self, node: VSSNode) -> list[tuple[str, list]]:
-        assert node.instances is not None
-        instances = node.instances
-
-        reg_ex = r"\w+\[\d+,(\d+)\]"
-
         result: list[tuple[str, list]] = []
-
-        complex_list = False
-        for i in instances:
-            if isinstance(i, list) or re.match(reg_ex, i):
-                complex_list = True
-
-        if complex_list:
-            for i in instances:
-                result.append(self.__parse_instances(reg_ex, i))
-        else:
-            result.append(self.__parse_instances(reg_ex, instances))
-
+        for spec in self.names[node].instances:
+            if spec.bounds is not None:
+                lower_bound, upper_bound = spec.bounds
+                result.append(("NamedRange", [spec.name, lower_bound, upper_bound]))
+            else:
+                result.append(("Choice", list(spec.elements)))
         return result
 
-    def __parse_instances(self, reg_ex, i) -> tuple[str, list]:
-        # parse string instantiation elements (e.g. Row[1,5])
-        if isinstance(i, str):
-            if re.match(reg_ex, i):
-                inst_range_arr = re.split(r"\[+|,+|\]", i)
-                range_name = inst_range_arr[0]
-                lower_bound = int(inst_range_arr[1])
-                upper_bound = int(inst_range_arr[2])
-                return ("NamedRange", [range_name, lower_bound, upper_bound])
-
-            raise ValueError("", "", "instantiation type not supported")
-
-        # Use list elements for instances (e.g. ["LEFT","RIGHT"])
-        if isinstance(i, list):
-            return ("Choice", i)
-
-        raise ValueError("", "", f"is of type {type(i)} which is unsupported")
-
     def __get_data_type(self, data_type: str) -> str:
         if data_type[-1] == "]":
             return data_type[0].upper() + data_type[1:-2] + "Array"
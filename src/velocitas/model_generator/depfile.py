@@ -0,0 +1,54 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Makefile dependency files, as understood by Make, Ninja and CMake."""
+
+import os
+from typing import List
+
+
+def _escape(path: str) -> str:
+    return path.replace("\\", "/").replace("$", "$$").replace(" ", "\\ ")
+
+
+def list_files(folder: str) -> List[str]:
+    """List all files below the folder in a stable order."""
+    files: List[str] = []
+    for dir_path, dir_names, file_names in os.walk(folder):
+        dir_names.sort()
+        files.extend(os.path.join(dir_path, f) for f in sorted(file_names))
+    return files
+
+
+def write_depfile(depfile: str, targets: List[str], dependencies: List[str]):
+    """Write a dependency file like gcc -MD -MP does.
+
+    Every dependency additionally gets an empty rule, so build tools don't
+    fail when an included file is removed from the specification.
+
+    Args:
+        depfile (str): The path of the dependency file
+        targets (List[str]): The targets depending on the dependencies
+        dependencies (List[str]): The files the targets depend on
+    """
+    dependencies = list(dict.fromkeys(os.path.normpath(d) for d in dependencies))
+    lines = [" \\\n  ".join([_escape(t) for t in targets]) + ":"]
+    lines[0] += "".join(f" \\\n  {_escape(d)}" for d in dependencies)
+    lines.extend(f"\n{_escape(d)}:" for d in dependencies)
+
+    depfile_dir = os.path.dirname(depfile)
+    if depfile_dir:
+        os.makedirs(depfile_dir, exist_ok=True)
+    with open(depfile, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
@@ -0,0 +1,386 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compact binary descriptor of the signals of a model.
+
+The descriptor holds the metadata of all nodes in fixed size little-endian
+tables, meant to be memory-mapped read-only: apps on the same machine then
+share one copy of it through the page cache instead of each building it in
+heap objects. ModelDescriptor reads it with mmap and decodes strings only
+when they are accessed, ``cpp/ModelDescriptor.hpp`` is the header-only C++
+reader. Readers must check the magic and the version.
+
+Layout, all offsets are in bytes from the start of the file::
+
+    header      HEADER, 64 bytes
+    strings     string_count + 1 uint32 offsets into the string data
+    string data UTF-8, string i spans offsets[i] to offsets[i + 1]
+    nodes       node_count NODE records, breadth first, the root is node 0,
+                the children of a node are consecutive
+    levels      level_count LEVEL records, the instance levels of branches
+    lists       list_count uint32 string indices, the allowed values of
+                nodes and the instance names of levels
+
+Absent strings, e.g. the unit of a branch, are NO_STRING. Sections start at
+multiples of 8 bytes.
+"""
+
+import mmap
+import struct
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from velocitas.model_generator.staging import staged_file
+
+MAGIC = b"VSSDESC\0"
+VERSION = 1
+
+# magic, version, header size, node, string, level and list count,
+# offsets of the strings, string data, nodes, levels and lists, file size
+HEADER = struct.Struct("<8s12I8x")
+# parent, first child, child count, name, path, description, comment,
+# datatype, unit, first allowed value, allowed count, first level, level
+# count, kind, flags (HAS_MIN, HAS_MAX), min, max
+NODE = struct.Struct("<iIIIIIIIIIIIIBBxxdd")
+# name, first instance name, instance count, is range, lower, upper bound
+LEVEL = struct.Struct("<IIIB3xii")
+LIST_ENTRY = struct.Struct("<I")
+
+NO_STRING = 0xFFFFFFFF
+HAS_MIN = 1
+HAS_MAX = 2
+
+# the kind of a node is its index in KINDS
+KINDS = ["branch", "attribute", "sensor", "actuator", "struct", "property"]
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class _StringTable:
+    """Deduplicates the strings of a descriptor."""
+
+    def __init__(self) -> None:
+        self.indices: Dict[str, int] = {}
+        self.strings: List[bytes] = []
+
+    def add(self, text: Optional[str]) -> int:
+        if text is None:
+            return NO_STRING
+        index = self.indices.get(text)
+        if index is None:
+            index = self.indices[text] = len(self.strings)
+            self.strings.append(text.encode("utf-8"))
+        return index
+
+
+def build_descriptor(root_node) -> bytes:
+    """Serialize a tree of VSSNodes into a descriptor."""
+    # the readers must not depend on vss-tools, which naming imports
+    from velocitas.model_generator.naming import parse_instances
+
+    strings = _StringTable()
+    nodes: List[bytes] = []
+    levels: List[bytes] = []
+    lists: List[int] = []
+
+    # breadth first, so the children of a node get consecutive indices
+    queue: List[Tuple[object, int, str]] = [(root_node, -1, root_node.name)]
+    next_child = 1
+    for index, (node, parent, path) in enumerate(queue):
+        children = node.children  # type: ignore
+        for child in children:
+            queue.append((child, index, f"{path}.{child.name}"))
+
+        allowed_first = len(lists)
+        allowed = getattr(node, "allowed", None) or []
+        lists.extend(strings.add(f"{value}") for value in allowed)
+
+        level_first = len(levels)
+        instances = getattr(node, "instances", None)
+        for spec in parse_instances(instances) if instances else ():
+            lower, upper = spec.bounds if spec.bounds is not None else (0, 0)
+            levels.append(
+                LEVEL.pack(
+                    strings.add(spec.name),
+                    len(lists),
+                    len(spec.elements),
+                    spec.is_range,
+                    lower,
+                    upper,
+                )
+            )
+            lists.extend(strings.add(element) for element in spec.elements)
+
+        flags = 0
+        node_min = getattr(node, "min", "")
+        node_max = getattr(node, "max", "")
+        if not isinstance(node_min, str):
+            flags |= HAS_MIN
+        if not isinstance(node_max, str):
+            flags |= HAS_MAX
+        datatype = getattr(node, "datatype", None)
+        unit = getattr(node, "unit", None)
+        nodes.append(
+            NODE.pack(
+                parent,
+                next_child if children else 0,
+                len(children),
+                strings.add(node.name),  # type: ignore
+                strings.add(path),
+                strings.add(f"{node.description}"),  # type: ignore
+                strings.add(getattr(node, "comment", "") or ""),
+                strings.add(datatype.value if datatype is not None else None),
+                strings.add(f"{unit}" if unit is not None else None),
+                allowed_first,
+                len(allowed),
+                level_first,
+                len(levels) - level_first,
+                KINDS.index(node.type.value),  # type: ignore
+                flags,
+                float(node_min) if flags & HAS_MIN else 0.0,
+                float(node_max) if flags & HAS_MAX else 0.0,
+            )
+        )
+        next_child += len(children)
+
+    offsets = [0]
+    for data in strings.strings:
+        offsets.append(offsets[-1] + len(data))
+
+    strings_offset = HEADER.size
+    string_data_offset = _align(strings_offset + 4 * len(offsets))
+    nodes_offset = _align(string_data_offset + offsets[-1])
+    levels_offset = nodes_offset + NODE.size * len(nodes)
+    lists_offset = levels_offset + LEVEL.size * len(levels)
+    file_size = lists_offset + LIST_ENTRY.size * len(lists)
+
+    buffer = bytearray(file_size)
+    HEADER.pack_into(
+        buffer,
+        0,
+        MAGIC,
+        VERSION,
+        HEADER.size,
+        len(nodes),
+        len(strings.strings),
+        len(levels),
+        len(lists),
+        strings_offset,
+        string_data_offset,
+        nodes_offset,
+        levels_offset,
+        lists_offset,
+        file_size,
+    )
+    struct.pack_into(f"<{len(offsets)}I", buffer, strings_offset, *offsets)
+    buffer[string_data_offset : string_data_offset + offsets[-1]] = b"".join(
+        strings.strings
+    )
+    buffer[nodes_offset:levels_offset] = b"".join(nodes)
+    buffer[levels_offset:lists_offset] = b"".join(levels)
+    struct.pack_into(f"<{len(lists)}I", buffer, lists_offset, *lists)
+    return bytes(buffer)
+
+
+def write_descriptor(root_node, path: str):
+    """Write the descriptor of a tree to a file.
+
+    The file is replaced atomically, apps which mapped the previous one keep
+    reading it until they map the file again.
+    """
+    content = build_descriptor(root_node)
+    with staged_file(path) as staging:
+        with open(staging, "wb") as file:
+            file.write(content)
+
+
+class DescriptorNode:
+    """A node of a mapped descriptor, its fields are read on access."""
+
+    def __init__(self, descriptor: "ModelDescriptor", index: int):
+        """Create the view of node index of the descriptor."""
+        self.descriptor = descriptor
+        self.index = index
+        self.fields = NODE.unpack_from(
+            descriptor.view, descriptor.nodes_offset + NODE.size * index
+        )
+
+    @property
+    def parent(self) -> Optional["DescriptorNode"]:
+        parent = self.fields[0]
+        return None if parent < 0 else self.descriptor.node(parent)
+
+    @property
+    def children(self) -> List["DescriptorNode"]:
+        first, count = self.fields[1], self.fields[2]
+        return [self.descriptor.node(i) for i in range(first, first + count)]
+
+    @property
+    def name(self) -> str:
+        return self.descriptor.string(self.fields[3])
+
+    @property
+    def path(self) -> str:
+        return self.descriptor.string(self.fields[4])
+
+    @property
+    def description(self) -> str:
+        return self.descriptor.string(self.fields[5])
+
+    @property
+    def comment(self) -> str:
+        return self.descriptor.string(self.fields[6])
+
+    @property
+    def datatype(self) -> Optional[str]:
+        return self.descriptor.optional_string(self.fields[7])
+
+    @property
+    def unit(self) -> Optional[str]:
+        return self.descriptor.optional_string(self.fields[8])
+
+    @property
+    def allowed(self) -> List[str]:
+        return self.descriptor.string_list(self.fields[9], self.fields[10])
+
+    @property
+    def instances(self) -> List[Tuple[str, List[str]]]:
+        """The instance levels, the name of each and its instance names."""
+        levels = []
+        first = self.fields[11]
+        for index in range(first, first + self.fields[12]):
+            name, list_first, count, _, _, _ = LEVEL.unpack_from(
+                self.descriptor.view,
+                self.descriptor.levels_offset + LEVEL.size * index,
+            )
+            levels.append(
+                (
+                    self.descriptor.string(name),
+                    self.descriptor.string_list(list_first, count),
+                )
+            )
+        return levels
+
+    @property
+    def kind(self) -> str:
+        return KINDS[self.fields[13]]
+
+    @property
+    def min(self) -> Optional[float]:
+        return self.fields[15] if self.fields[14] & HAS_MIN else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self.fields[16] if self.fields[14] & HAS_MAX else None
+
+
+class ModelDescriptor:
+    """Reads a descriptor mapped read-only into memory.
+
+    Use it as context manager or close it, nodes and strings can not be read
+    afterwards.
+    """
+
+    def __init__(self, path: str):
+        """Map the descriptor file.
+
+        Raises:
+            ValueError: If the file is not a descriptor of a supported version
+        """
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mmap)
+        try:
+            if len(self.view) < HEADER.size:
+                raise ValueError(f"{path} is not a model descriptor")
+            header = HEADER.unpack_from(self.view, 0)
+            if header[0] != MAGIC:
+                raise ValueError(f"{path} is not a model descriptor")
+            if header[1] != VERSION:
+                raise ValueError(f"Descriptor version {header[1]} is not supported")
+        except ValueError:
+            self.close()
+            raise
+        (
+            self.node_count,
+            self.string_count,
+            self.level_count,
+            self.list_count,
+            self.strings_offset,
+            self.string_data_offset,
+            self.nodes_offset,
+            self.levels_offset,
+            self.lists_offset,
+        ) = header[3:12]
+
+    def close(self):
+        """Unmap the descriptor."""
+        self.view.release()
+        self.mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def string(self, index: int) -> str:
+        """Decode a string of the string table."""
+        start, end = struct.unpack_from(
+            "<2I", self.view, self.strings_offset + 4 * index
+        )
+        offset = self.string_data_offset
+        return str(self.view[offset + start : offset + end], "utf-8")
+
+    def optional_string(self, index: int) -> Optional[str]:
+        return None if index == NO_STRING else self.string(index)
+
+    def string_list(self, first: int, count: int) -> List[str]:
+        indices = struct.unpack_from(
+            f"<{count}I", self.view, self.lists_offset + LIST_ENTRY.size * first
+        )
+        return [self.string(index) for index in indices]
+
+    def node(self, index: int) -> DescriptorNode:
+        """Return a node by its index, the root is 0."""
+        if not 0 <= index < self.node_count:
+            raise IndexError(f"Node {index} is out of range")
+        return DescriptorNode(self, index)
+
+    @property
+    def root(self) -> DescriptorNode:
+        return self.node(0)
+
+    def __iter__(self) -> Iterator[DescriptorNode]:
+        """Iterate all nodes breadth first."""
+        return (DescriptorNode(self, index) for index in range(self.node_count))
+
+    def __len__(self) -> int:
+        return self.node_count
+
+    def find(self, path: str) -> Optional[DescriptorNode]:
+        """Return the node of a VSS path, e.g. Vehicle.Cabin.Door."""
+        names = path.split(".")
+        node = self.root
+        if node.name != names[0]:
+            return None
+        for name in names[1:]:
+            for child in node.children:
+                if child.name == name:
+                    node = child
+                    break
+            else:
+                return None
+        return node
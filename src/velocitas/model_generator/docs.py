@@ -0,0 +1,76 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Where the documentation of the signals of a model is written to.
+
+With ``full`` documentation, the default, every generated file documents the
+description, comment, value range, unit and allowed values of its members.
+``minimal`` only keeps the name and type of each member. ``external`` does
+the same and additionally writes the documentation of all nodes once into
+``model-docs.json``, keyed by VSS path.
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from vspec.model.vsstree import VSSNode  # type: ignore
+
+DOCS_MODES = ["full", "minimal", "external"]
+DOCS_FILE = "model-docs.json"
+
+
+def member_type(node: "VSSNode") -> str:
+    """The type of a member as documented, e.g. attribute (string)."""
+    # compared by value, the cli imports this module without vss-tools
+    if node.type.value == "attribute":
+        assert node.datatype is not None
+        return f"{node.type.value} ({node.datatype.value})"
+    return node.type.value
+
+
+def document_node(node: "VSSNode") -> Dict[str, Any]:
+    """The documentation of a node, with the details it has."""
+    doc: Dict[str, Any] = {"type": node.type.value}
+    datatype = getattr(node, "datatype", None)
+    if datatype is not None:
+        doc["datatype"] = datatype.value
+    doc["description"] = f"{node.description}"
+    if len(node.comment) > 0:
+        doc["comment"] = f"{node.comment}"
+    if not isinstance(node.min, str):
+        doc["min"] = node.min
+    if not isinstance(node.max, str):
+        doc["max"] = node.max
+    unit = getattr(node, "unit", None)
+    if unit is not None:
+        doc["unit"] = f"{unit}"
+    if len(node.allowed) > 0:
+        doc["allowed"] = list(node.allowed)
+    return doc
+
+
+def docs_index(root_node: "VSSNode") -> str:
+    """The documentation of all nodes of a tree as JSON, keyed by VSS path.
+
+    The nodes are listed in the order of the tree.
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    stack = [(root_node, root_node.name)]
+    while stack:
+        node, path = stack.pop()
+        index[path] = document_node(node)
+        for child in reversed(node.children):
+            stack.append((child, f"{path}.{child.name}"))
+    return json.dumps(index, indent=2, default=str) + "\n"
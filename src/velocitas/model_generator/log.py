@@ -0,0 +1,52 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Messages of the generator.
+
+All modules log through children of the package logger. Per collection
+details of the Python generator are debug messages. The records propagate to
+the handlers of the application embedding the generator, gen-model and the
+generation server call configure_logging to print them to stdout instead.
+"""
+
+import logging
+import sys
+
+logger = logging.getLogger("velocitas.model_generator")
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Writes to the current sys.stdout, e.g. as redirected by the server."""
+
+    @property  # type: ignore[override]
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def configure_logging(level: int = logging.INFO):
+    """Print the messages of the given level and above to stdout."""
+    handler = _StdoutHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.handlers = [handler]
+    logger.setLevel(level)
+    # the messages are printed once, not again by handlers of the application
+    logger.propagate = False
+
+
+# nothing is printed unless the application or configure_logging handles it
+logger.addHandler(logging.NullHandler())
@@ -0,0 +1,132 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Manifest of the content hashes of a generated model.
+
+Every model contains a ``model-manifest.json`` listing the SHA-256 of each
+generated file, a hash over all of them, the hashes of the input files and
+the options of the generation. The generated files only depend on these, so
+build caches can key on the tree hash of the manifest. Like the cache keys,
+input files are identified by their content, not their location.
+"""
+
+import hashlib
+import json
+from typing import Dict, List
+
+from velocitas.model_generator.sinks import OutputSink
+
+MANIFEST_FILE = "model-manifest.json"
+
+
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _generator_version() -> str:
+    from importlib import metadata
+
+    try:
+        return metadata.version("velocitas_model_generator")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class ModelManifest:
+    """Collects the hashes of a model while it is generated."""
+
+    def __init__(
+        self,
+        input_files: List[str],
+        language: str,
+        name: str,
+        strict: bool,
+        ext_attributes_list: List[str],
+        options: List[str] = [],
+        docs: str = "full",
+        stubs: bool = False,
+    ):
+        """Initialize the manifest, see ModelCache.key for the arguments.
+
+        docs is the documentation mode, see DOCS_MODES, stubs whether type
+        stubs are generated.
+        """
+        self.inputs = []
+        for input_file in input_files:
+            with open(input_file, "rb") as file:
+                self.inputs.append(_sha256(file.read()))
+        self.options = {
+            "language": language,
+            "name": name,
+            "strict": strict,
+            "extended_attributes": [a for a in ext_attributes_list if a],
+            "signal_filter": list(options),
+            "docs": docs,
+            "stubs": stubs,
+        }
+        self.files: Dict[str, str] = {}
+
+    def add(self, path: str, content: str):
+        """Add a generated file, path as passed to the sinks."""
+        self.files[path] = _sha256(content.encode("utf-8"))
+
+    def remove(self, path: str):
+        """Remove a file or a folder of the model added before."""
+        for file_path in list(self.files):
+            if file_path == path or file_path.startswith(path + "/"):
+                del self.files[file_path]
+
+    def tree_hash(self) -> str:
+        """The hash over the paths and hashes of all files."""
+        digest = hashlib.sha256()
+        for path in sorted(self.files):
+            digest.update(f"{path}\0{self.files[path]}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def dumps(self) -> str:
+        """The manifest as JSON, the same for the same model."""
+        manifest = {
+            "generator": _generator_version(),
+            "options": self.options,
+            "inputs": self.inputs,
+            "files": dict(sorted(self.files.items())),
+            "tree": self.tree_hash(),
+        }
+        return json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+
+    def write(self, sink: OutputSink):
+        """Write the manifest into the model."""
+        sink.write(MANIFEST_FILE, self.dumps())
+
+
+class ManifestSink(OutputSink):
+    """Passes the files on to another sink, adding them to a manifest."""
+
+    def __init__(self, sink: OutputSink, manifest: ModelManifest):
+        """Initialize the sink with the sink to write to and the manifest."""
+        super().__init__()
+        self.sink = sink
+        self.manifest = manifest
+
+    def write(self, path: str, content: str):
+        self.paths.append(path)
+        self.manifest.add(path, content)
+        self.sink.write(path, content)
+
+    def remove(self, path: str):
+        self.manifest.remove(path)
+        self.sink.remove(path)
+
+    def flush(self):
+        self.sink.flush()
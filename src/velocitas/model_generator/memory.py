@@ -0,0 +1,74 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Memory handling for generating very large trees.
+
+Loading a tree allocates millions of objects which all stay alive until the
+model is rendered, yet the cyclic garbage collector traverses them again and
+again while the tree grows. gc_paused suspends it for such phases.
+
+A generator releasing payloads drops the documentation of a node as soon as
+the file documenting it is written, see release_payload, so the memory of
+the loaded tree shrinks while the model is rendered.
+"""
+
+import contextlib
+import gc
+import threading
+from typing import Iterator
+
+_lock = threading.Lock()
+_paused = 0
+_was_enabled = False
+
+# the attributes of a VSSNode only read to document it
+_PAYLOAD = ("description", "comment", "uuid")
+
+
+@contextlib.contextmanager
+def gc_paused() -> Iterator[None]:
+    """Suspend the cyclic garbage collector while the block runs.
+
+    The collector is process wide, concurrent blocks, e.g. of the generations
+    of a server, enable it again when the last one ends, if it was enabled.
+    Objects are still freed when their last reference goes away.
+    """
+    global _paused, _was_enabled
+    with _lock:
+        if _paused == 0:
+            _was_enabled = gc.isenabled()
+            gc.disable()
+        _paused += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _paused -= 1
+            if _paused == 0 and _was_enabled:
+                gc.enable()
+
+
+def release_payload(node):
+    """Drop the documentation of a rendered node, keeping what names it.
+
+    Afterwards the description and comment of the node read as the defaults
+    of VSSNode, its source dict and extended attributes are empty. The tree
+    must not be rendered, merged or copied again.
+    """
+    attributes = node.__dict__
+    for key in _PAYLOAD:
+        attributes.pop(key, None)
+    # holds the same strings, for JSON input the dicts of all descendants
+    attributes["source_dict"] = {}
+    attributes["extended_attributes"] = {}
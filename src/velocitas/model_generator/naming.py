@@ -0,0 +1,231 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Names, paths and instances of the branches of a tree.
+
+Both generators derive the same data from every branch: its VSS path, the
+package or namespace it is generated into, the folder names of that and its
+parsed instances. ModelNames computes them in one pass over the tree. The
+conversion of a single name and the parsing of instances are memoised for
+all trees, VSS trees repeat the same names many times.
+"""
+
+import functools
+import os
+import re
+from typing import Dict, List, Optional, Tuple, Union
+
+# Until vsspec issue will be fixed: https://github.com/COVESA/vss-tools/issues/208
+from vspec.model.constants import VSSType  # type: ignore
+from vspec.model.vsstree import VSSNode  # type: ignore
+
+from velocitas.model_generator.cpp.cpp_keywords import cpp_keywords
+from velocitas.model_generator.utils import camel_to_snake_case
+
+_RANGE_REG_EX = re.compile(r"\w+\[\d+,(\d+)\]")
+_RANGE_SEPARATORS = re.compile(r"\[+|,+|\]")
+_CPP_KEYWORDS = frozenset(cpp_keywords)
+
+DEFAULT_RANGE_NAME = "element"
+
+
+@functools.lru_cache(maxsize=None)
+def cpp_namespace_name(name: str) -> str:
+    """Return the snake_case namespace and folder name of a VSS name."""
+    namespace = camel_to_snake_case(name)
+    if namespace in _CPP_KEYWORDS:
+        namespace += "_"
+    return namespace
+
+
+class InstanceSpec:
+    """One level of the instances of a branch.
+
+    Either a named range, e.g. Row[1,4], or a choice, e.g. ["Left", "Right"].
+    """
+
+    def __init__(
+        self, name: str, elements: Tuple[str, ...], bounds: Optional[Tuple[int, int]]
+    ):
+        """Create a level of instances.
+
+        Args:
+            name (str): The name of the range, DEFAULT_RANGE_NAME for a choice
+            elements (Tuple[str, ...]): The names of the instances, e.g. Row1 to Row4
+            bounds (Optional[Tuple[int, int]]): The bounds of a range, None for
+                a choice
+        """
+        self.name = name
+        self.elements = elements
+        self.bounds = bounds
+
+    @property
+    def is_range(self) -> bool:
+        """Whether the instances are a named range."""
+        return self.bounds is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_instance(instance: Union[str, Tuple]) -> InstanceSpec:
+    # parse string instantiation elements (e.g. Row[1,5])
+    if isinstance(instance, str):
+        if _RANGE_REG_EX.match(instance):
+            inst_range_arr = _RANGE_SEPARATORS.split(instance)
+            range_name = inst_range_arr[0]
+            lower_bound = int(inst_range_arr[1])
+            upper_bound = int(inst_range_arr[2])
+            return InstanceSpec(
+                range_name,
+                tuple(
+                    f"{range_name}{element}"
+                    for element in range(lower_bound, upper_bound + 1)
+                ),
+                (lower_bound, upper_bound),
+            )
+
+        raise ValueError("", "", f"instantiation type {instance} not supported")
+
+    # Use list elements for instances (e.g. ["LEFT","RIGHT"])
+    return InstanceSpec(
+        DEFAULT_RANGE_NAME, tuple(f"{element}" for element in instance), None
+    )
+
+
+def parse_instance(instance) -> InstanceSpec:
+    """Parse a single level of instances, e.g. Row[1,4] or ["Left", "Right"]."""
+    if isinstance(instance, list):
+        return _parse_instance(tuple(instance))
+    if isinstance(instance, str):
+        return _parse_instance(instance)
+    raise ValueError("", "", f"is of type {type(instance)} which is unsupported")
+
+
+def parse_instances(instances) -> Tuple[InstanceSpec, ...]:
+    """Parse the instances of a branch into its levels.
+
+    A list containing ranges or lists has a level per element, e.g.
+    ["Row[1,2]", ["Left", "Right"]], any other list is a single choice.
+    """
+    complex_list = False
+    for instance in instances:
+        if isinstance(instance, list) or _RANGE_REG_EX.match(instance):
+            complex_list = True
+
+    if complex_list:
+        return tuple(parse_instance(instance) for instance in instances)
+    return (parse_instance(instances),)
+
+
+class BranchNames:
+    """The names of a branch in the generated model."""
+
+    def __init__(
+        self,
+        node: VSSNode,
+        path: str,
+        package: List[str],
+        folders: List[str],
+    ):
+        """Create the names of a branch.
+
+        Args:
+            node (VSSNode): The branch
+            path (str): The VSS path of the branch, e.g. Vehicle.Cabin.Door
+            package (List[str]): The package or namespace the branch is
+                generated into, the root package followed by the VSS names
+                below the root, e.g. ["vehicle", "Cabin", "Door"]
+            folders (List[str]): The snake_case folder names of the package
+        """
+        self.name = node.name
+        self.path = path
+        self.package = package
+        self.folders = folders
+        self.instances: Tuple[InstanceSpec, ...] = (
+            parse_instances(node.instances) if node.instances else ()
+        )
+
+    @functools.cached_property
+    def namespace(self) -> str:
+        """The qualified C++ namespace, e.g. vehicle::cabin::door."""
+        return "::".join(self.folders)
+
+    @functools.cached_property
+    def include(self) -> str:
+        """The C++ header to include without extension."""
+        return os.path.join(*self.folders, self.name)
+
+    @functools.cached_property
+    def header(self) -> str:
+        """The path of the C++ header."""
+        return "/".join(["include"] + self.folders + [f"{self.name}.hpp"])
+
+    @functools.cached_property
+    def guard(self) -> str:
+        """The include guard of the C++ header."""
+        return "_".join([f.upper() for f in self.folders] + [self.name.upper()]) + "_H"
+
+    @functools.cached_property
+    def module(self) -> str:
+        """The qualified Python module, e.g. vehicle.Cabin.Door."""
+        return ".".join(self.package)
+
+    @functools.cached_property
+    def init_file(self) -> str:
+        """The path of the __init__.py of the Python package."""
+        return "/".join(self.package + ["__init__.py"])
+
+    @functools.cached_property
+    def stub_file(self) -> str:
+        """The path of the type stub of the Python package."""
+        return "/".join(self.package + ["__init__.pyi"])
+
+
+class ModelNames:
+    """The names of all branches of a tree, computed in one pass."""
+
+    def __init__(self, root_node: VSSNode, root_package: List[str]):
+        """Compute the names of all branches.
+
+        Args:
+            root_node (VSSNode): The root node of the VSS tree
+            root_package (List[str]): The root package or namespace, the
+                root node is generated into it
+        """
+        self.__branches: Dict[VSSNode, BranchNames] = {}
+        root_folders = [cpp_namespace_name(n) for n in root_package]
+        root = BranchNames(root_node, root_node.name, root_package, root_folders)
+        self.__branches[root_node] = root
+
+        stack = [(root_node, root)]
+        while stack:
+            node, names = stack.pop()
+            for child in node.children:
+                if child.type != VSSType.BRANCH:
+                    continue
+                child_names = BranchNames(
+                    child,
+                    f"{names.path}.{child.name}",
+                    names.package + [child.name],
+                    names.folders + [cpp_namespace_name(child.name)],
+                )
+                self.__branches[child] = child_names
+                stack.append((child, child_names))
+
+    def __getitem__(self, node: VSSNode) -> BranchNames:
+        """Return the names of a branch."""
+        return self.__branches[node]
+
+    def release(self, node: VSSNode):
+        """Forget the names of a branch, e.g. once its files are written."""
+        del self.__branches[node]
@@ -0,0 +1,109 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Report the progress of a generation as events.
+
+Generations call a function with a ProgressEvent for each step. A
+ProgressStream turns these calls into an async iterator for code running in
+an asyncio event loop, while the generation runs in another thread.
+JsonLinesEvents writes them to a file, e.g. to monitor long generations.
+"""
+
+import dataclasses
+import json
+import time
+from typing import IO, Optional
+
+
+@dataclasses.dataclass
+class ProgressEvent:
+    """A step of a generation.
+
+    stage is one of "restore" (from the cache), "load", "render", "write"
+    and "done". Render events carry the number of nodes rendered, write
+    events the path of the file relative to the model and its size in bytes.
+    """
+
+    stage: str
+    path: Optional[str] = None
+    size: int = 0
+    nodes: int = 0
+
+
+class ProgressStream:
+    """Iterate the events of a generation in an event loop.
+
+    Create the stream in the event loop which iterates it. Iteration ends
+    when the generation finished, failed or was cancelled.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stream for the running event loop."""
+        import asyncio
+
+        self.__loop = asyncio.get_running_loop()
+        self.__events: "asyncio.Queue[Optional[ProgressEvent]]" = asyncio.Queue()
+
+    def emit(self, event: ProgressEvent):
+        """Pass an event to the iterating coroutine, from any thread."""
+        self.__loop.call_soon_threadsafe(self.__events.put_nowait, event)
+
+    def close(self):
+        """End the iteration after the events emitted so far."""
+        self.__loop.call_soon_threadsafe(self.__events.put_nowait, None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> ProgressEvent:
+        event = await self.__events.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+
+class JsonLinesEvents:
+    """Writes the events of a generation as JSON lines.
+
+    Every line has the stage and the seconds since the start of the
+    generation. The line of the done event sums up the nodes visited, the
+    files written, the bytes emitted and the throughput in bytes per second.
+    """
+
+    def __init__(self, file: IO[str]):
+        """Initialize the writer with a text file to write the lines to."""
+        self.file = file
+        self.start = time.perf_counter()
+        self.nodes = 0
+        self.files = 0
+        self.bytes = 0
+
+    def __call__(self, event: ProgressEvent):
+        seconds = time.perf_counter() - self.start
+        line = {"event": event.stage, "time": round(seconds, 6)}
+        if event.stage == "render":
+            self.nodes += event.nodes
+            line["nodes"] = event.nodes
+        elif event.stage == "write":
+            self.files += 1
+            self.bytes += event.size
+            line["path"] = event.path
+            line["bytes"] = event.size
+        elif event.stage == "done":
+            line["nodes"] = self.nodes
+            line["files"] = self.files
+            line["bytes"] = self.bytes
+            line["bytes_per_second"] = round(self.bytes / seconds) if seconds else 0
+        self.file.write(json.dumps(line) + "\n")
+        self.file.flush()
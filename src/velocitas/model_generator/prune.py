@@ -0,0 +1,174 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Prune the loaded tree to the signals an app actually uses.
+
+Signals are selected with glob patterns over their paths, e.g.
+``Vehicle.Cabin.Seat.*`` or ``Vehicle.Speed``. A selected branch keeps its
+whole subtree, and all ancestors of selected nodes are kept so the retained
+paths stay the same as in the full model. Paths may name instances, e.g.
+``Vehicle.Cabin.Door.Row1.DriverSide.IsOpen`` selects ``IsOpen`` of the
+instantiated ``Door`` branch. All instances of a kept branch are generated,
+as the collection types of the model always contain every instance.
+"""
+
+import fnmatch
+import itertools
+import json
+import re
+from typing import List
+
+from vspec.model.vsstree import VSSNode  # type: ignore
+
+_RANGE_REG_EX = r"(\w+)\[(\d+),(\d+)\]"
+
+# the interface of velocitas app manifests listing the used signals
+_SIGNAL_INTERFACE = "vehicle-signal-interface"
+
+
+def _instance_levels(instances) -> List[List[str]]:
+    """Names of the instances of a branch, one list per instance level."""
+    if isinstance(instances, str):
+        instances = [instances]
+    if not any(
+        isinstance(level, list) or re.fullmatch(_RANGE_REG_EX, level)
+        for level in instances
+    ):
+        # a single level of named instances, e.g. ['Low', 'High']
+        return [list(instances)]
+
+    levels = []
+    for level in instances:
+        names: List[str] = []
+        for element in level if isinstance(level, list) else [level]:
+            match = re.fullmatch(_RANGE_REG_EX, element)
+            if match:
+                lower, upper = int(match.group(2)), int(match.group(3))
+                names.extend(f"{match.group(1)}{i}" for i in range(lower, upper + 1))
+            else:
+                names.append(element)
+        levels.append(names)
+    return levels
+
+
+def _instance_paths(node: VSSNode) -> List[str]:
+    instances = getattr(node, "instances", None)
+    if not instances:
+        return []
+    return [".".join(path) for path in itertools.product(*_instance_levels(instances))]
+
+
+def read_signals_file(path: str) -> List[str]:
+    """Read the signal paths used by an app.
+
+    The file is either a velocitas app manifest (JSON) with a vehicle signal
+    interface or a text file with one path or pattern per line. Empty lines
+    and lines starting with # are ignored.
+    """
+    with open(path, encoding="utf-8") as file:
+        content = file.read()
+
+    if content.lstrip().startswith("{"):
+        manifest = json.loads(content)
+        signals = []
+        for interface in manifest.get("interfaces", []):
+            if interface.get("type") != _SIGNAL_INTERFACE:
+                continue
+            datapoints = interface.get("config", {}).get("datapoints", {})
+            for datapoint in datapoints.get("required", []) + datapoints.get(
+                "optional", []
+            ):
+                signals.append(datapoint["path"])
+        return signals
+
+    return [
+        line.strip()
+        for line in content.splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+
+class SignalFilter:
+    """Selects the nodes of a tree to generate."""
+
+    def __init__(
+        self,
+        include: List[str] = [],
+        exclude: List[str] = [],
+        signals_files: List[str] = [],
+    ):
+        """Create a filter.
+
+        Args:
+            include (List[str]): Glob patterns of the paths to keep, all paths
+                are kept if neither these nor signal files are given
+            exclude (List[str]): Glob patterns of the paths to remove, these
+                take precedence over the included paths
+            signals_files (List[str]): Files listing further paths to keep,
+                see read_signals_file
+        """
+        self.include = list(include)
+        for signals_file in signals_files:
+            self.include.extend(read_signals_file(signals_file))
+        self.exclude = list(exclude)
+        self.signals_files = list(signals_files)
+
+    def is_active(self) -> bool:
+        """Return whether the filter removes anything at all."""
+        return len(self.include) > 0 or len(self.exclude) > 0
+
+    def options(self) -> List[str]:
+        """The selected patterns, e.g. to tell apart cached models."""
+        return [f"+{p}" for p in self.include] + [f"-{p}" for p in self.exclude]
+
+    def __matches(self, names: List[str], patterns: List[str]) -> bool:
+        return any(
+            fnmatch.fnmatchcase(name, pattern) for pattern in patterns for name in names
+        )
+
+    def __is_excluded(self, names: List[str]) -> bool:
+        # names[0] is the path without instances, a node is only removed if
+        # it is excluded in all instances as collections contain all of them
+        return self.__matches(names[:1], self.exclude) or (
+            len(names) > 1
+            and all(self.__matches([name], self.exclude) for name in names[1:])
+        )
+
+    def __prune(self, node: VSSNode, names: List[str], included: bool) -> bool:
+        """Remove all unselected children of the node.
+
+        Returns:
+            bool: True if the node is to be kept
+        """
+        # instance paths address the branch itself as well as its children
+        instance_paths = _instance_paths(node)
+        names = names + [f"{n}.{i}" for n in names for i in instance_paths]
+        if self.__is_excluded(names):
+            return False
+
+        included = included or not self.include or self.__matches(names, self.include)
+        for child in list(node.children):
+            child_names = [f"{name}.{child.name}" for name in names]
+            if not self.__prune(child, child_names, included):
+                child.parent = None
+        return included or len(node.children) > 0
+
+    def prune(self, tree: VSSNode) -> VSSNode:
+        """Remove all nodes not selected by the filter from the tree.
+
+        The root is always kept, even if nothing is selected.
+        """
+        if self.is_active():
+            self.__prune(tree, [tree.name], False)
+        return tree
@@ -14,29 +14,99 @@
 
 """VehicleModelPythonGenerator."""
 
-import os
-from typing import List, Set
+import functools
+from typing import List, Optional, Set
 
 # Until vsspec issue will be fixed: https://github.com/COVESA/vss-tools/issues/208
 from vspec.model.constants import VSSType  # type: ignore
 from vspec.model.vsstree import VSSNode  # type: ignore
 
+from velocitas.model_generator.docs import DOCS_FILE, docs_index, member_type
+from velocitas.model_generator.memory import release_payload
+from velocitas.model_generator.naming import ModelNames
 from velocitas.model_generator.python.vss_collection import VssCollection
-from velocitas.model_generator.utils import CodeGeneratorContext
+from velocitas.model_generator.sinks import FileSystemSink, OutputSink
+from velocitas.model_generator.utils import CodeGeneratorContext, Template
+
+_HEADER = Template(
+    "#!/usr/bin/env python3\n\n"
+    '"""%NAME% model."""\n\n'
+    "# pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235\n\n\n"
+)
+_RUNTIME_HEADER = Template(
+    "#!/usr/bin/env python3\n\n"
+    "# pylint: disable=C0103,C0114,C0115,C0116,R0801,R0902,R0915,C0301,W0235\n\n\n"
+)
+_STUB_HEADER = Template('"""%NAME% model."""\n\n')
+_SETUP = Template(
+    "from setuptools import find_packages, setup  # type: ignore\n\n"
+    "setup(\n"
+    '    name="%NAME%",\n'
+    '    version="0.1.0",\n'
+    '    description="Vehicle Model",\n'
+    "    packages=find_packages(),\n"
+    "    zip_safe=False,\n"
+    "%PACKAGE_DATA%"
+    ")\n"
+)
+_STUB_PACKAGE_DATA = '    package_data={"": ["*.pyi", "py.typed"]},\n'
+
+_MEMBER = Template('self.%NAME% = %TYPE%("%NAME%", self)\n')
+_MEMBER_NAME = Template("%NAME%: %TYPE%\n")
+_STUB_MEMBER = Template("%NAME%: %TYPE%\n")
+
+
+@functools.lru_cache(maxsize=None)
+def _member_doc(comment: bool, value_range: bool, unit: bool, allowed: bool):
+    """Return the template documenting a member with the given details."""
+    text = "%NAME%: %TYPE%\n    %DESCRIPTION%\n\n"
+    if comment:
+        text += "    %COMMENT%\n\n"
+    if value_range:
+        text += "    Value range: [%MIN%, %MAX%]\n"
+    if unit:
+        text += "    Unit: %UNIT%\n"
+    if allowed:
+        text += "    Allowed values: %ALLOWED%\n"
+    return Template(text)
 
 
 class VehicleModelPythonGenerator:
     """Generate python code for vehicle model."""
 
-    def __init__(self, root_node: VSSNode, target_folder: str, root_package: str):
+    def __init__(
+        self,
+        root_node: VSSNode,
+        target_folder: str,
+        root_package: str,
+        sink: Optional[OutputSink] = None,
+        docs: str = "full",
+        stubs: bool = False,
+        release_payloads: bool = False,
+    ):
         """Initialize the python generator.
 
         Args:
             root (_type_): the vspec tree root node.
+            sink (Optional[OutputSink]): where the files are written to,
+                defaults to the target folder.
+            docs (str): how the members are documented, see DOCS_MODES.
+            stubs (bool): also generate a .pyi type stub for every module,
+                which then carries the documentation. The modules are
+                generated without any docstrings.
+            release_payloads (bool): drop the documentation of the nodes of
+                each branch once its module is written, see release_payload.
+                Ignored for external docs, which need all of it at the end.
         """
         self.root_node = root_node
         self.target_folder = target_folder
+        self.sink = sink if sink is not None else FileSystemSink(target_folder)
+        self.docs = docs
+        self.stubs = stubs
+        self.release_payloads = release_payloads and docs != "external"
+        self.branches: Optional[Set[str]] = None
         self.ctx = CodeGeneratorContext()
+        self.stub_ctx = CodeGeneratorContext()
         self.imports: Set[str] = set()
         self.model_imports: Set[str] = set()
         self.collections: List[VssCollection] = []
@@ -46,130 +116,162 @@ def __init__(self, root_node: VSSNode, target_folder: str, root_package: str):
             self.root_package_list = root_package.split("/")
         else:
             self.root_package_list = [root_package]
+        self.names = ModelNames(root_node, self.root_package_list)
 
-    def generate(self):
-        """Generate python code for vehicle model."""
-        self.root_path = self.target_folder
+    def generate(self, branches: Optional[Set[str]] = None):
+        """Generate python code for vehicle model.
 
-        path = os.path.join(self.root_path, *self.root_package_list)
-        os.makedirs(path)
-
-        self.__gen_model(self.root_node, self.root_package_list, is_root=True)
-        self.__visit_nodes(self.root_node, self.root_package_list)
-
-        self.__gen_package()
-
-    def __gen_package(self):
-        self.ctx.reset()
-        self.ctx.write(
-            "from setuptools import find_packages, setup  # type: ignore\n\n"
+        Args:
+            branches (Optional[Set[str]]): Qualified names of the branches to
+                render into an existing model, all branches if None.
+        """
+        self.branches = branches
+
+        if self.__is_selected(self.root_node):
+            self.__gen_model(self.root_node, is_root=True)
+        self.__visit_nodes(self.root_node)
+
+        if branches is None:
+            self.generate_package()
+        if self.docs == "external":
+            self.sink.write(DOCS_FILE, docs_index(self.root_node))
+        self.sink.flush()
+
+    def remove_branch(self, qualified_name: str):
+        """Remove the package of a branch and of all its sub branches."""
+        self.sink.remove(
+            "/".join(self.root_package_list + qualified_name.split(".")[1:])
         )
-        self.ctx.write("setup(\n")
-        self.ctx.indent()
-        self.ctx.write(f'name="{".".join(self.root_package_list)}",\n')
-        self.ctx.write('version="0.1.0",\n')
-        self.ctx.write('description="Vehicle Model",\n')
-        self.ctx.write("packages=find_packages(),\n")
-        self.ctx.write("zip_safe=False,\n")
-        self.ctx.dedent()
-        self.ctx.write(")\n")
-
-        path = os.path.join(self.target_folder, "setup.py")
-        with open(path, "w", encoding="utf-8") as file:
-            file.write(self.ctx.get_content())
 
-    def __visit_nodes(self, node: VSSNode, parent_package_list: List[str]):
-        """Recursively render nodes."""
+    def __is_selected(self, node: VSSNode) -> bool:
+        return self.branches is None or self.names[node].path in self.branches
+
+    def generate_package(self):
+        """Write the files of the package around the modules."""
+        self.sink.write(
+            "setup.py",
+            _SETUP.fill(
+                NAME=".".join(self.root_package_list),
+                PACKAGE_DATA=_STUB_PACKAGE_DATA if self.stubs else "",
+            ),
+        )
+        if self.stubs:
+            self.sink.write("/".join(self.root_package_list + ["py.typed"]), "")
+
+    @staticmethod
+    def __branches(node: VSSNode) -> List[VSSNode]:
+        """The branches below the node, in reverse order for a stack."""
+        return [
+            child
+            for child in reversed(node.children)
+            if child.type.value == VSSType.BRANCH.value
+        ]
+
+    def __visit_nodes(self, node: VSSNode):
+        """Render the branches below the node in pre-order.
+
+        Uses an explicit stack, deep trees do not hit the recursion limit.
+        """
+        stack = self.__branches(node)
+        while stack:
+            branch = stack.pop()
+            if self.__is_selected(branch):
+                self.__gen_model(branch)
+            stack.extend(self.__branches(branch))
+
+    def __release_payloads(self, node: VSSNode):
+        # the parent module documenting the node was written before
+        release_payload(node)
+        self.names.release(node)
         for child in node.children:
-            child_package_list = parent_package_list + [child.name]
-            child_path = os.path.join(self.root_path, *child_package_list)
-
-            if child.type.value == VSSType.BRANCH.value:
-                if not os.path.exists(child_path):
-                    os.makedirs(child_path)
-                self.__gen_model(child, child_package_list)
-                self.__visit_nodes(child, child_package_list)
+            if child.type.value != VSSType.BRANCH.value:
+                release_payload(child)
 
     def __gen_header(self, node: VSSNode):
-        self.ctx.write(
-            f"""#!/usr/bin/env python3
-
-        ""\"{node.name} model.""\"
-
-        # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235\n\n\n""",
-            strip_lines=True,
-        )
+        if self.stubs:
+            self.ctx.emit(_RUNTIME_HEADER)
+            self.stub_ctx.emit(_STUB_HEADER, NAME=node.name)
+        else:
+            self.ctx.emit(_HEADER, NAME=node.name)
 
-    def __gen_imports(self):
-        self.model_imports.add("Model")
-        self.ctx.write("from velocitas_sdk.model import (\n")
-        self.ctx.indent()
+    def __gen_imports(self, ctx: CodeGeneratorContext):
+        ctx.write("from velocitas_sdk.model import (\n")
+        ctx.indent()
         for imp in sorted(self.model_imports):
-            self.ctx.write(f"{imp},\n")
+            ctx.write(f"{imp},\n")
 
-        self.ctx.dedent()
-        self.ctx.write(")\n\n")
+        ctx.dedent()
+        ctx.write(")\n\n")
 
         for imp in sorted(self.imports):
             if imp[0] == ".":
                 imp = imp[2:]
             path = imp.split(".")
-            self.ctx.write(f"from {imp} import {path[-1]}\n")
+            ctx.write(f"from {imp} import {path[-1]}\n")
 
         if len(self.imports) == 0:
-            self.ctx.write("\n")
+            ctx.write("\n")
         else:
-            self.ctx.write("\n\n")
-        self.imports.clear()
-        self.model_imports.clear()
+            ctx.write("\n\n")
 
     def __write_collections(self):
         for collection in self.collections:
             self.ctx.write(collection.ctx.get_content())
             self.ctx.write(self.ctx.line_break)
+            if collection.stub_ctx is not None:
+                self.stub_ctx.write(collection.stub_ctx.get_content())
+                self.stub_ctx.write(self.stub_ctx.line_break)
 
         self.collections.clear()
 
-    def __gen_model_docstring(self, node: VSSNode):
-        self.ctx.write(f'"""{node.name} model.')
+    def __gen_model_docstring(self, node: VSSNode, ctx: CodeGeneratorContext):
+        ctx.write(f'"""{node.name} model.')
         if node.children:
-            self.ctx.write("\n\nAttributes\n")
-            self.ctx.write("----------\n")
+            ctx.write("\n\nAttributes\n")
+            ctx.write("----------\n")
             for i in node.children:
-                if i.type.value == VSSType.ATTRIBUTE.value:
-                    self.ctx.write(f"{i.name}: {i.type.value} ({i.datatype.value})\n")
-                else:
-                    self.ctx.write(f"{i.name}: {i.type.value}\n")
-
-                self.ctx.indent()
-                self.ctx.write(f"{i.description}\n")
-                self.ctx.write("\n")
-                if len(i.comment) > 0:
-                    self.ctx.write(f"{i.comment}\n")
-                    self.ctx.write("\n")
-
-                if not isinstance(i.min, str) or not isinstance(i.max, str):
-                    self.ctx.write(f"Value range: [{i.min}, {i.max}]\n")
-                if hasattr(i, "unit"):
-                    self.ctx.write(f"Unit: {i.unit}\n")
-                if len(i.allowed) > 0:
-                    allowed_values = ", ".join(i.allowed)
-                    self.ctx.write(f"Allowed values: {allowed_values}\n")
-                self.ctx.dedent()
-        self.ctx.write('"""\n\n')
-
-    def __gen_model(self, node: VSSNode, package_list: List[str], is_root=False):
+                if self.docs != "full":
+                    ctx.emit(_MEMBER_NAME, NAME=i.name, TYPE=member_type(i))
+                    continue
+                doc = {
+                    "NAME": i.name,
+                    "TYPE": member_type(i),
+                    "DESCRIPTION": f"{i.description}",
+                }
+
+                comment = len(i.comment) > 0
+                if comment:
+                    doc["COMMENT"] = f"{i.comment}"
+                value_range = not isinstance(i.min, str) or not isinstance(i.max, str)
+                if value_range:
+                    doc["MIN"] = f"{i.min}"
+                    doc["MAX"] = f"{i.max}"
+                unit = hasattr(i, "unit")
+                if unit:
+                    doc["UNIT"] = f"{i.unit}"
+                allowed = len(i.allowed) > 0
+                if allowed:
+                    doc["ALLOWED"] = ", ".join(i.allowed)
+                ctx.emit(_member_doc(comment, value_range, unit, allowed), **doc)
+        ctx.write('"""\n\n')
+
+    def __gen_model(self, node: VSSNode, is_root=False):
         self.ctx.write(f"class {node.name}(Model):\n")
         self.ctx.indent()
-
-        self.__gen_model_docstring(node)
+        if self.stubs:
+            self.stub_ctx.write(f"class {node.name}(Model):\n")
+            self.stub_ctx.indent()
+            self.__gen_model_docstring(node, self.stub_ctx)
+        else:
+            self.__gen_model_docstring(node, self.ctx)
 
         if is_root:
             self.ctx.write("def __init__(self, name):\n")
         else:
             self.ctx.write("def __init__(self, name, parent):\n")
         self.ctx.indent()
-        self.ctx.write(f'"""Create a new {node.name} model."""\n')
+        if not self.stubs:
+            self.ctx.write(f'"""Create a new {node.name} model."""\n')
         if is_root:
             self.ctx.write("super().__init__()\n")
         else:
@@ -185,49 +287,74 @@ def __gen_model(self, node: VSSNode, package_list: List[str], is_root=False):
             if child.type.value == VSSType.BRANCH.value:
                 # if has instances, a collection will be created
                 if child.instances:
-                    collection = VssCollection(child)
-                    self.collections.append(collection)
-                    self.ctx.write(
-                        f'self.{child.name} = {collection.name}("{child.name}", self)\n'
+                    collection = VssCollection(
+                        child, self.names[child].instances, self.stubs
                     )
+                    self.collections.append(collection)
+                    member_type_name = collection.name
                 else:
                     # add simple branch member
-                    self.ctx.write(
-                        f'self.{child.name} = {child.name}("{child.name}", self)\n'
+                    member_type_name = child.name
+                self.ctx.emit(_MEMBER, NAME=child.name, TYPE=member_type_name)
+                if self.stubs:
+                    self.stub_ctx.emit(
+                        _STUB_MEMBER, NAME=child.name, TYPE=member_type_name
                     )
-                self.imports.add(".".join(package_list + [child.name]))
+                self.imports.add(self.names[child].module)
             # else (ATTRIBUTE, SENSOR, ACTUATOR)
             elif child.type.value in (
                 VSSType.ATTRIBUTE.value,
                 VSSType.SENSOR.value,
                 VSSType.ACTUATOR.value,
             ):
-                self.ctx.write(
-                    f"self.{child.name} = "
-                    f"DataPoint{self.__get_datatype(child.datatype.value)}"
-                    f'("{child.name}", self)\n'
-                )
-                self.model_imports.add(
-                    f"DataPoint{self.__get_datatype(child.datatype.value)}"
-                )
+                data_point = f"DataPoint{self.__get_datatype(child.datatype.value)}"
+                self.ctx.emit(_MEMBER, NAME=child.name, TYPE=data_point)
+                if self.stubs:
+                    self.stub_ctx.emit(_STUB_MEMBER, NAME=child.name, TYPE=data_point)
+                self.model_imports.add(data_point)
 
         self.ctx.dedent()
         self.ctx.dedent()
+        if self.stubs:
+            self.__gen_stub_init(node, is_root)
 
         self.__write_collections()
 
         if is_root:
             self.ctx.write('\n\nvehicle = Vehicle("Vehicle")\n')
+            if self.stubs:
+                self.stub_ctx.write("\n\nvehicle: Vehicle\n")
 
+        self.model_imports.add("Model")
         self.ctx.set_position(0)
+        self.stub_ctx.set_position(0)
         self.__gen_header(node)
-        self.__gen_imports()
+        self.__gen_imports(self.ctx)
+        if self.stubs:
+            self.__gen_imports(self.stub_ctx)
+        self.imports.clear()
+        self.model_imports.clear()
 
-        path = os.path.join(self.root_path, *package_list)
-        with open(os.path.join(path, "__init__.py"), "w", encoding="utf-8") as file:
-            file.write(self.ctx.get_content())
+        names = self.names[node]
+        self.sink.write(names.init_file, self.ctx.get_content())
+        if self.stubs:
+            self.sink.write(names.stub_file, self.stub_ctx.get_content())
 
         self.ctx.reset()
+        self.stub_ctx.reset()
+        if self.release_payloads:
+            self.__release_payloads(node)
+
+    def __gen_stub_init(self, node: VSSNode, is_root: bool):
+        if node.children:
+            self.stub_ctx.write("\n")
+        if is_root:
+            self.stub_ctx.write("def __init__(self, name: str) -> None: ...\n")
+        else:
+            self.stub_ctx.write(
+                "def __init__(self, name: str, parent: Model) -> None: ...\n"
+            )
+        self.stub_ctx.dedent()
 
     def __get_datatype(self, datatype):
         if datatype[-1] == "]":
@@ -14,51 +14,47 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import re
-from typing import List
+import logging
+from typing import Optional, Sequence
 
 # Until vsspec issue will be fixed: https://github.com/COVESA/vss-tools/issues/208
 from vspec.model.vsstree import VSSNode  # type: ignore
 
+from velocitas.model_generator.naming import InstanceSpec
 from velocitas.model_generator.utils import CodeGeneratorContext
 
+logger = logging.getLogger(__name__)
+
 _COLLECTION_SUFFIX = "Collection"
-_COLLECTION_REG_EX = r"\w+\[\d+,(\d+)\]"
 
 _TYPE_SUFFIX = "Type"
-_DEFAULT_RANGE_NAME = "element"
 
 """VSS Collection helper."""
 
 
-class VssInstance:
-    """VSS Instance Model."""
-
-    def __init__(self, name: str, content: List[str], is_range: bool):
-        """Construct of new insntance object."""
-        # Content List
-        self.content = content
-
-        # The name of the Instance
-        self.name = name
-
-        # Is a named range flag that will be used to generate
-        # getter function for element by index.
-        self.is_range = is_range
-
-
 class VssCollection:
     """VSS Collection Object."""
 
-    def __init__(self, node: VSSNode):
-        """Construct of new collection object."""
+    def __init__(
+        self, node: VSSNode, instances: Sequence[InstanceSpec], stub: bool = False
+    ):
+        """Construct of new collection object.
+
+        Args:
+            node (VSSNode): The branch with instances
+            instances (Sequence[InstanceSpec]): The parsed instances of the branch
+            stub (bool): Also generate the type stub of the collection
+        """
         self.ctx = CodeGeneratorContext()
+        self.stub_ctx: Optional[CodeGeneratorContext] = None
         self.name = f"{node.name}{_COLLECTION_SUFFIX}"
-        self.__gen_collection(node)
+        self.__gen_collection(node, instances)
+        if stub:
+            self.stub_ctx = CodeGeneratorContext()
+            self.__gen_stub(node, instances, self.stub_ctx)
 
-    def __gen_collection(self, node: VSSNode):
-        print(f"- {self.name:30}{node.instances}")
-        assert node.instances is not None
+    def __gen_collection(self, node: VSSNode, instances: Sequence[InstanceSpec]):
+        logger.debug("- %-30s%s", self.name, node.instances)
         self.ctx.write(self.ctx.line_break)
         self.ctx.write(f"class {self.name}(Model):\n")
         with self.ctx as def_ctx:
@@ -67,41 +63,20 @@ def __gen_collection(self, node: VSSNode):
                 body_ctx.write("super().__init__(parent)\n")
                 body_ctx.write("self.name = name\n")
 
-                complex_list = False
-                for instance in node.instances:
-                    if isinstance(instance, list) or re.match(
-                        _COLLECTION_REG_EX, instance
-                    ):
-                        complex_list = True
-
-                vss_instance = None
-                instance_list_len = len(node.instances)
+                vss_instance = instances[0]
                 instance_type = f"{node.name}"
                 has_inner_types = False
-                if complex_list:
-                    # Complex Instances collection
-                    vss_instance = self.__parse_instances(
-                        _COLLECTION_REG_EX, node.instances[0]
-                    )
-
-                    # if instance_list_len = 1:
-                    #   -> Flat instance type (list of single instance type).
-                    # # E.g ['Sensor[1,8]']
-                    # if instance_list_len > 1
-                    #   -> Multi-level (nested) instance type.
-                    # E.g ['Row[1,2]', ['Left', 'Right']]
-                    if instance_list_len > 1:
-                        instance_type = f"{vss_instance.name}{_TYPE_SUFFIX}"
-                        has_inner_types = True
-
-                else:
-                    # Simple instance type (list object).
-                    # E.g. Row[1,4] or ['Low', 'High']
-                    vss_instance = self.__parse_instances(
-                        _COLLECTION_REG_EX, node.instances
-                    )
-
-                instance_list = vss_instance.content
+                # if there is one level of instances:
+                #   -> Flat instance type (list of single instance type).
+                # E.g ['Sensor[1,8]'], Row[1,4] or ['Low', 'High']
+                # if there are more levels:
+                #   -> Multi-level (nested) instance type.
+                # E.g ['Row[1,2]', ['Left', 'Right']]
+                if len(instances) > 1:
+                    instance_type = f"{vss_instance.name}{_TYPE_SUFFIX}"
+                    has_inner_types = True
+
+                instance_list = vss_instance.elements
 
                 # check if self needs to be added due to the internal type.
                 prefix = "self." if has_inner_types else ""
@@ -118,24 +93,17 @@ def __gen_collection(self, node: VSSNode):
         if has_inner_types:
             self.ctx.write(self.ctx.line_break)
             # add inner types
-            inner_instances = self.__parse_instances(
-                _COLLECTION_REG_EX, node.instances[1]
-            )
+            inner_instances = instances[1]
             self.__gen_collection_types(node.name, instance_type, inner_instances)
-            # add getter
+            # add getter, named after the range or DEFAULT_RANGE_NAME for a choice
             self.ctx.indent()
             with self.ctx as getter_ctx:
-                if inner_instances.is_range:
-                    self.__gen_getter(
-                        inner_instances.name, inner_instances.content, getter_ctx
-                    )
-                else:
-                    self.__gen_getter(
-                        _DEFAULT_RANGE_NAME, inner_instances.content, getter_ctx
-                    )
+                self.__gen_getter(
+                    inner_instances.name, inner_instances.elements, getter_ctx
+                )
 
-    def __gen_collection_types(self, name, type_name, vss_instance: VssInstance):
-        print(f"{' ' * 5}- {type_name:25}{vss_instance.content}")
+    def __gen_collection_types(self, name, type_name, vss_instance: InstanceSpec):
+        logger.debug("     - %-25s%s", type_name, list(vss_instance.elements))
         with self.ctx as type_ctx:
             type_ctx.write(self.ctx.line_break)
             type_ctx.write(f"class {type_name}(Model):\n")
@@ -145,7 +113,7 @@ def __gen_collection_types(self, name, type_name, vss_instance: VssInstance):
                     body_ctx.write("super().__init__(parent)\n")
                     body_ctx.write("self.name = name\n")
 
-                    for instance in vss_instance.content:
+                    for instance in vss_instance.elements:
                         body_ctx.write(
                             f'self.{instance} = {name}("{instance}", self)\n'
                         )
@@ -171,28 +139,34 @@ def __gen_getter(self, name, instances, base_ctx):
             body_ctx.write("}\n")
             body_ctx.write("return _options.get(index)")
 
-    def __parse_instances(self, reg_ex, instance) -> VssInstance:
-        result = []
-
-        # parse string instantiation elements (e.g. Row[1,5])
-        range_name = _DEFAULT_RANGE_NAME
-        if isinstance(instance, str):
-            if re.match(reg_ex, instance):
-                inst_range_arr = re.split(r"\[+|,+|\]", instance)
-                range_name = inst_range_arr[0]
-                lower_bound = int(inst_range_arr[1])
-                upper_bound = int(inst_range_arr[2])
-                for element in range(lower_bound, upper_bound + 1):
-                    result.append(f"{range_name}{element}")
-
-                return VssInstance(range_name, result, True)
-
-            raise ValueError("", "", f"instantiation type {instance} not supported")
-
-        # Use list elements for instances (e.g. ["LEFT","RIGHT"])
-        if isinstance(instance, list):
-            for element in instance:
-                result.append(f"{element}")
-            return VssInstance(range_name, result, False)
-
-        raise ValueError("", "", f"is of type {type(instance)} which is unsupported")
+    def __gen_stub(
+        self,
+        node: VSSNode,
+        instances: Sequence[InstanceSpec],
+        stub_ctx: CodeGeneratorContext,
+    ):
+        vss_instance = instances[0]
+        instance_type = node.name
+        if len(instances) > 1:
+            instance_type = f"{self.name}.{vss_instance.name}{_TYPE_SUFFIX}"
+
+        stub_ctx.write(stub_ctx.line_break)
+        stub_ctx.write(f"class {self.name}(Model):\n")
+        with stub_ctx as body_ctx:
+            self.__gen_stub_members(vss_instance, instance_type, body_ctx)
+            if len(instances) > 1:
+                body_ctx.write(body_ctx.line_break)
+                body_ctx.write(f"class {vss_instance.name}{_TYPE_SUFFIX}(Model):\n")
+                with body_ctx as type_ctx:
+                    self.__gen_stub_members(instances[1], node.name, type_ctx)
+
+    def __gen_stub_members(
+        self, vss_instance: InstanceSpec, instance_type: str, base_ctx
+    ):
+        for instance in vss_instance.elements:
+            base_ctx.write(f"{instance}: {instance_type}\n")
+        base_ctx.write(base_ctx.line_break)
+        base_ctx.write("def __init__(self, name: str, parent: Model) -> None: ...\n")
+        base_ctx.write(
+            f"def {vss_instance.name}(self, index: int) -> {instance_type}: ...\n"
+        )
@@ -0,0 +1,266 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Long running generator process serving requests over a local socket.
+
+The server keeps vss-tools imported and the most recently loaded trees in
+memory, so a request only pays for rendering the model. Requests and responses
+are single lines of JSON::
+
+    {"command": "generate", "args": {<keyword arguments of generate_model>}}
+    {"command": "ping"}
+    {"command": "shutdown"}
+
+Every response carries the ``exit_code`` and the ``output`` of the request,
+invalid and unknown requests are answered with exit code 2.
+
+A request can write and replace any folder the server can, so only the user
+running the server may connect: the socket is created with mode 0600.
+"""
+
+import contextlib
+import copy
+import getpass
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+import vspec  # type: ignore
+from vspec.model.vsstree import VSSNode  # type: ignore
+
+from velocitas.model_generator import _generate
+from velocitas.model_generator.cache import DEFAULT_CACHE_MAX_SIZE, ModelCache
+from velocitas.model_generator.log import configure_logging
+from velocitas.model_generator.prune import SignalFilter
+from velocitas.model_generator.tree_generator.file_import import (
+    FileImport,
+    UnsupportedFileFormat,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET = os.environ.get(
+    "VELOCITAS_MODEL_GENERATOR_SOCKET",
+    os.path.join(
+        tempfile.gettempdir(), f"velocitas-model-generator-{getpass.getuser()}.sock"
+    ),
+)
+DEFAULT_MAX_TREES = 8
+
+
+class GenerationServer:
+    """Handles requests, keeping the recently loaded trees in an LRU."""
+
+    def __init__(self, max_trees: int = DEFAULT_MAX_TREES):
+        """Initialize the server.
+
+        Args:
+            max_trees (int): The number of loaded trees kept in memory
+        """
+        self.max_trees = max_trees
+        self.trees: OrderedDict[Tuple, Any] = OrderedDict()
+        # vss-tools and the redirected stdout are process global
+        self.lock = threading.Lock()
+
+    def __load_tree(self, file_import: FileImport):
+        # a tree is reused as long as none of the files it was read from changed,
+        # this runs in the vss-tools state of the request, see vss_tools_state
+        stats = []
+        for input_file in file_import.input_files():
+            stat = os.stat(input_file)
+            stats.append((input_file, stat.st_mtime_ns, stat.st_size))
+        key = (
+            tuple(stats),
+            file_import.strict,
+            tuple(file_import.overlays),
+            tuple(VSSNode.whitelisted_extended_attributes),
+        )
+
+        tree = self.trees.get(key)
+        if tree is not None:
+            self.trees.move_to_end(key)
+            logger.info("Reusing loaded tree.")
+            return tree
+
+        tree = file_import.load_tree()
+        self.trees[key] = tree
+        if len(self.trees) > self.max_trees:
+            self.trees.popitem(last=False)
+        return tree
+
+    def generate(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a model, args are the keyword arguments of generate_model."""
+        output = io.StringIO()
+        exit_code = 0
+        with self.lock, contextlib.redirect_stdout(output):
+            try:
+                ext_attributes_list = args.get("ext_attributes_list", [])
+                if len(ext_attributes_list) > 0:
+                    logger.info(
+                        "Known extended attributes: %s", ", ".join(ext_attributes_list)
+                    )
+
+                strict = args.get("strict", True)
+                cache = None
+                if args.get("cache_dir"):
+                    cache = ModelCache(
+                        args["cache_dir"],
+                        args.get("cache_max_size", DEFAULT_CACHE_MAX_SIZE),
+                        args.get("cache_hard_link", False),
+                    )
+                signal_filter = SignalFilter(
+                    args.get("include", []),
+                    args.get("exclude", []),
+                    args.get("signals_files", []),
+                )
+                load_tree = self.__load_tree
+                if signal_filter.is_active():
+                    # pruning modifies the tree, keep the loaded one intact
+                    def load_tree(file_import: FileImport):
+                        tree = self.__load_tree(file_import)
+                        file_import.load_units()
+                        return copy.deepcopy(tree)
+
+                _generate(
+                    FileImport(
+                        args["input_file_path"],
+                        args.get("input_unit_file_path_list", []),
+                        ["."] + args.get("include_dir", []),
+                        strict,
+                        args.get("overlays", []),
+                    ),
+                    args["language"],
+                    args.get("target_folder", "./gen_model"),
+                    args.get("name", "vehicle"),
+                    strict,
+                    ext_attributes_list,
+                    cache,
+                    args.get("depfile"),
+                    args.get("depfile_target"),
+                    signal_filter,
+                    load_tree=load_tree,
+                    docs=args.get("docs", "full"),
+                    stubs=args.get("stubs", False),
+                    descriptor=args.get("descriptor"),
+                    catalog=args.get("catalog"),
+                )
+            except (vspec.VSpecError, UnsupportedFileFormat) as e:
+                logger.error("Error: %s", e)
+                exit_code = 255
+            except SystemExit as e:
+                # vss-tools exits on invalid specifications
+                exit_code = e.code if isinstance(e.code, int) else 255
+            except Exception as e:
+                logger.error("Error: %r", e)
+                exit_code = 1
+        return {"exit_code": exit_code, "output": output.getvalue()}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            if not isinstance(request, dict):
+                raise ValueError("a request is a JSON object")
+            if request.get("command") == "generate" and not isinstance(
+                request.get("args"), dict
+            ):
+                raise ValueError("generate needs the arguments as a JSON object")
+        except ValueError as e:
+            # also raised for empty, truncated or non UTF-8 requests
+            response = {"exit_code": 2, "output": f"Invalid request: {e}\n"}
+        else:
+            response = self.__response(request)
+        self.wfile.write((json.dumps(response) + "\n").encode())
+
+    def __response(self, request):
+        command = request.get("command")
+        if command == "generate":
+            response = self.server.generation_server.generate(request["args"])
+        elif command == "ping":
+            response = {"exit_code": 0, "output": ""}
+        elif command == "shutdown":
+            # serve_forever runs in another thread, so this does not deadlock
+            threading.Thread(target=self.server.shutdown).start()
+            response = {"exit_code": 0, "output": "Shutting down.\n"}
+        else:
+            response = {"exit_code": 2, "output": f"Unknown command {command}\n"}
+        return response
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        # bound in a private folder and moved into place once only the owner
+        # can connect, the umask of the process is left alone
+        folder = tempfile.mkdtemp(dir=os.path.dirname(self.server_address))
+        try:
+            path = os.path.join(folder, "socket")
+            self.socket.bind(path)
+            os.chmod(path, 0o600)
+            os.rename(path, self.server_address)
+        finally:
+            os.rmdir(folder)
+
+
+def _connect(socket_path: str) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(socket_path)
+    return sock
+
+
+def create_server(
+    socket_path: str = DEFAULT_SOCKET,
+    max_trees: int = DEFAULT_MAX_TREES,
+) -> socketserver.BaseServer:
+    """Create a server listening on a Unix socket only its user can connect to.
+
+    Args:
+        socket_path (str): The path of the Unix socket
+        max_trees (int): The number of loaded trees kept in memory
+
+    Returns:
+        socketserver.BaseServer: The server, call serve_forever() to run it
+    """
+    # the messages of a request are printed to its redirected stdout
+    configure_logging()
+    socket_path = os.path.abspath(socket_path)
+    if os.path.exists(socket_path):
+        try:
+            _connect(socket_path).close()
+            raise RuntimeError(f"A server is already listening on {socket_path}")
+        except ConnectionRefusedError:
+            # left over by a server which did not shut down cleanly
+            os.remove(socket_path)
+    server = _UnixServer(socket_path, _RequestHandler)
+    server.generation_server = GenerationServer(max_trees)  # type: ignore
+    return server
+
+
+def send_request(
+    request: Dict[str, Any], socket_path: str = DEFAULT_SOCKET
+) -> Dict[str, Any]:
+    """Send a request to a running server and return its response."""
+    with _connect(socket_path) as sock:
+        sock.sendall((json.dumps(request) + "\n").encode())
+        with sock.makefile("rb") as response:
+            return json.loads(response.readline())
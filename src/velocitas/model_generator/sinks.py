@@ -0,0 +1,307 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Destinations the generators write the files of a model to.
+
+Paths passed to a sink are relative to the root of the model and always use
+``/`` as separator, e.g. ``vehicle/Cabin/__init__.py``.
+"""
+
+import abc
+import gzip
+import io
+import os
+import shutil
+import tarfile
+import time
+import zipfile
+from typing import IO, Callable, Dict, List, Optional, Set, Tuple
+
+ARCHIVE_FORMATS = ["tar", "tar.gz", "zip"]
+
+
+class OutputSink(abc.ABC):
+    """Receives the files of a generated model."""
+
+    def __init__(self) -> None:
+        """Initialize the sink."""
+        # the paths of all written files, as reported by e.g. depfiles
+        self.paths: List[str] = []
+
+    @abc.abstractmethod
+    def write(self, path: str, content: str):
+        """Write a file of the model."""
+        pass
+
+    def remove(self, path: str):
+        """Remove a file or a folder of the model written before."""
+        raise NotImplementedError(f"{type(self).__name__} cannot remove files")
+
+    def flush(self):
+        """Make sure all files written so far reached their destination."""
+        pass
+
+    def close(self):
+        """Flush and release the sink, no files can be written afterwards."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+class FileSystemSink(OutputSink):
+    """Writes the model into a folder.
+
+    Files are buffered and written in batches by a pool of threads, so the
+    latency of many small writes overlaps, e.g. on network file systems.
+    """
+
+    def __init__(
+        self,
+        target_folder: str,
+        batch_size: int = 4 * 1024 * 1024,
+        max_workers: int = 8,
+    ):
+        """Initialize the sink.
+
+        Args:
+            target_folder (str): The folder the model is written to
+            batch_size (int): The number of buffered bytes triggering a flush
+            max_workers (int): The number of threads writing files
+        """
+        super().__init__()
+        self.target_folder = target_folder
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.pending: List[Tuple[str, str]] = []
+        self.pending_size = 0
+        self.created_folders: Set[str] = set()
+
+    def write(self, path: str, content: str):
+        full_path = os.path.join(self.target_folder, *path.split("/"))
+        self.paths.append(full_path)
+        self.pending.append((full_path, content))
+        self.pending_size += len(content)
+        if self.pending_size >= self.batch_size:
+            self.flush()
+
+    def remove(self, path: str):
+        # files of the removed folder might still be pending
+        self.flush()
+        full_path = os.path.join(self.target_folder, *path.split("/"))
+        if os.path.isdir(full_path):
+            shutil.rmtree(full_path)
+            self.created_folders = {
+                f
+                for f in self.created_folders
+                if f != full_path and not f.startswith(full_path + os.sep)
+            }
+        elif os.path.exists(full_path):
+            os.remove(full_path)
+
+    @staticmethod
+    def __write_file(path: str, content: str):
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+
+    def flush(self):
+        if not self.pending:
+            return
+        for folder in sorted({os.path.dirname(p) for p, _ in self.pending}):
+            if folder not in self.created_folders:
+                os.makedirs(folder, exist_ok=True)
+                self.created_folders.add(folder)
+
+        if len(self.pending) == 1 or self.max_workers <= 1:
+            for path, content in self.pending:
+                self.__write_file(path, content)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                # consume the results to raise errors of the writes
+                list(executor.map(lambda f: self.__write_file(*f), self.pending))
+        self.pending = []
+        self.pending_size = 0
+
+
+class MemorySink(OutputSink):
+    """Keeps the model in memory, mapping the paths to the file contents."""
+
+    def __init__(self) -> None:
+        """Initialize the sink."""
+        super().__init__()
+        self.files: Dict[str, str] = {}
+
+    def write(self, path: str, content: str):
+        self.paths.append(path)
+        self.files[path] = content
+
+    def remove(self, path: str):
+        for file_path in list(self.files):
+            if file_path == path or file_path.startswith(path + "/"):
+                del self.files[file_path]
+
+
+# 1980-01-01, the earliest time of a zip entry
+_ZIP_EPOCH = 315532800
+
+
+def _source_date_epoch() -> int:
+    """The timestamp of reproducible builds, SOURCE_DATE_EPOCH or 0."""
+    try:
+        return int(os.environ.get("SOURCE_DATE_EPOCH", 0))
+    except ValueError:
+        return 0
+
+
+class ArchiveSink(OutputSink):
+    """Streams the model into a tar or zip archive.
+
+    The archive is written as the files are generated, so it can be written to
+    a pipe like stdout. All entries carry the time in SOURCE_DATE_EPOCH, or
+    the start of the epoch, so archives of the same model are identical.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        archive_format: str = "tar",
+        prefix: str = "",
+    ):
+        """Initialize the sink.
+
+        Args:
+            fileobj (IO[bytes]): The binary stream the archive is written to
+            archive_format (str): One of ARCHIVE_FORMATS
+            prefix (str): A folder prepended to all paths in the archive
+        """
+        super().__init__()
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Archive format {archive_format} is not supported")
+        self.prefix = prefix.rstrip("/") + "/" if prefix else ""
+        self.tar: Optional[tarfile.TarFile] = None
+        self.gzip: Optional[gzip.GzipFile] = None
+        self.zip: Optional[zipfile.ZipFile] = None
+        self.mtime = _source_date_epoch()
+        if archive_format == "zip":
+            self.zip = zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED)
+        else:
+            if archive_format == "tar.gz":
+                # the gzip header of tarfile holds the current time
+                self.gzip = gzip.GzipFile(
+                    filename="", mode="wb", fileobj=fileobj, mtime=self.mtime
+                )
+                fileobj = self.gzip  # type: ignore
+            # streaming mode, the archive is never seeked
+            self.tar = tarfile.open(fileobj=fileobj, mode="w|")  # type: ignore
+
+    def write(self, path: str, content: str):
+        name = self.prefix + path
+        self.paths.append(name)
+        data = content.encode("utf-8")
+        if self.zip is not None:
+            # zip files cannot date entries before 1980
+            date_time = time.gmtime(max(self.mtime, _ZIP_EPOCH))[:6]
+            zip_info = zipfile.ZipInfo(name, date_time)
+            zip_info.compress_type = zipfile.ZIP_DEFLATED
+            zip_info.external_attr = 0o600 << 16
+            self.zip.writestr(zip_info, data)
+        elif self.tar is not None:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = self.mtime
+            info.mode = 0o644
+            self.tar.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        if self.zip is not None:
+            self.zip.close()
+        if self.tar is not None:
+            self.tar.close()
+        if self.gzip is not None:
+            # closes only the gzip stream, not the file object
+            self.gzip.close()
+
+
+class CountingSink(OutputSink):
+    """Counts the files and bytes of a model without keeping them."""
+
+    def __init__(self) -> None:
+        """Initialize the sink."""
+        super().__init__()
+        self.bytes = 0
+
+    def write(self, path: str, content: str):
+        self.paths.append(path)
+        self.bytes += len(content.encode("utf-8"))
+
+
+class TeeSink(OutputSink):
+    """Writes the model to several sinks at once."""
+
+    def __init__(self, *sinks: OutputSink):
+        """Initialize the sink with the sinks to write to."""
+        super().__init__()
+        self.sinks = sinks
+
+    def write(self, path: str, content: str):
+        self.paths.append(path)
+        for sink in self.sinks:
+            sink.write(path, content)
+
+    def remove(self, path: str):
+        for sink in self.sinks:
+            sink.remove(path)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+
+class ObservedSink(OutputSink):
+    """Passes the files on to another sink, calling a function before each."""
+
+    def __init__(self, sink: OutputSink, on_write: Callable[[str, str], None]):
+        """Initialize the sink with the sink to write to and the function.
+
+        on_write is called with the path and content of each file, it may
+        raise to stop the generation before the file is written.
+        """
+        super().__init__()
+        self.sink = sink
+        self.on_write = on_write
+
+    def write(self, path: str, content: str):
+        self.on_write(path, content)
+        self.paths.append(path)
+        self.sink.write(path, content)
+
+    def remove(self, path: str):
+        self.sink.remove(path)
+
+    def flush(self):
+        self.sink.flush()
+
+
+def archive_format_of(path: str) -> str:
+    """Guess the archive format from the file name, defaults to tar."""
+    if path.endswith((".tar.gz", ".tgz")):
+        return "tar.gz"
+    if path.endswith(".zip"):
+        return "zip"
+    return "tar"
@@ -0,0 +1,257 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Replace the target folder only once the new model is complete.
+
+The model is generated into a staging folder next to the target folder, which
+is swapped in by renaming it. The previous model is removed in the
+background, so neither a failed generation nor the removal of a large tree
+affect the target folder or the duration of the generation. Single files
+written next to the model, like the descriptor, are staged the same way.
+
+A generation locks its staging path, so the next one removes the staging
+paths left behind by crashed or killed generations, but not those still in
+use. The lock is released by the operating system when the process ends.
+"""
+
+import atexit
+import contextlib
+import ctypes
+import glob
+import os
+import secrets
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # e.g. on Windows, staging paths left behind are not removed
+    fcntl = None  # type: ignore
+
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
+# younger staging paths may not be locked by their generation yet
+_STALE_AGE = 60.0
+
+_removals: List[threading.Thread] = []
+
+
+class DiscardStaging(Exception):
+    """Raised in the body of staged_folder to keep the target folder as is."""
+
+
+def _exchange(first: str, second: str) -> bool:
+    """Atomically swap two paths, if the platform supports it."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return False
+    result = renameat2(
+        _AT_FDCWD,
+        os.fsencode(first),
+        _AT_FDCWD,
+        os.fsencode(second),
+        _RENAME_EXCHANGE,
+    )
+    # e.g. file systems not supporting the exchange
+    return result == 0
+
+
+def _create_unique(parent: str, prefix: str, create) -> str:
+    """Create a new path in parent with create(path), return the path.
+
+    Unlike mkdtemp and mkstemp, which create private paths, create passes the
+    usual mode and the umask applies, without reading it by setting it.
+    """
+    while True:
+        path = os.path.join(parent, prefix + secrets.token_hex(6))
+        try:
+            create(path)
+        except FileExistsError:
+            continue
+        return path
+
+
+def _create_file(path: str):
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+
+
+def _lock(path: str) -> Optional[int]:
+    """Lock a staging path, return the descriptor holding the lock.
+
+    Returns None if another generation holds the lock. Closing the descriptor
+    releases it.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _remove_stale_staging(parent: str, name: str):
+    """Remove the staging paths of name which no generation is using."""
+    if fcntl is None:
+        return
+    prefix = f".{name}.staging-"
+    for stale in glob.glob(
+        os.path.join(glob.escape(parent), glob.escape(prefix) + "*")
+    ):
+        try:
+            if time.time() - os.lstat(stale).st_mtime < _STALE_AGE:
+                continue
+            fd = _lock(stale)
+        except OSError:
+            # e.g. removed by another generation in the meantime
+            continue
+        if fd is None:
+            continue
+        try:
+            if os.path.isdir(stale):
+                suffix = os.path.basename(stale)[len(prefix) :]
+                old = os.path.join(parent, f".{name}.old-{suffix}")
+                os.rename(stale, old)
+                remove_in_background(old)
+            else:
+                os.remove(stale)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _finish_removals():
+    """Hand removals still running at exit over to a detached process."""
+    paths = [t.name for t in _removals if t.is_alive()]
+    if paths:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import shutil, sys\n"
+                "for p in sys.argv[1:]: shutil.rmtree(p, ignore_errors=True)",
+                *paths,
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+
+def remove_in_background(path: str):
+    """Remove a folder without waiting for it.
+
+    If the process exits before the removal finished, it is continued by a
+    detached process.
+    """
+    if not _removals:
+        atexit.register(_finish_removals)
+    _removals[:] = [t for t in _removals if t.is_alive()]
+    # the thread is named after the path to continue its removal at exit
+    thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(path,),
+        kwargs={"ignore_errors": True},
+        name=path,
+        daemon=True,
+    )
+    _removals.append(thread)
+    thread.start()
+
+
+@contextlib.contextmanager
+def staged_folder(target_folder: str) -> Iterator[str]:
+    """Yield a staging folder which replaces the target folder on success.
+
+    If the body raises, the staging folder is discarded and the target
+    folder is left untouched.
+    """
+    target_folder = os.path.abspath(target_folder)
+    parent, name = os.path.split(target_folder)
+    os.makedirs(parent, exist_ok=True)
+
+    # previous models whose removal did not complete, e.g. on a crash
+    for stale in glob.glob(os.path.join(parent, f".{name}.old-*")):
+        remove_in_background(stale)
+    _remove_stale_staging(parent, name)
+
+    prefix = f".{name}.staging-"
+    staging = _create_unique(parent, prefix, os.mkdir)
+    lock = _lock(staging) if fcntl is not None else None
+    try:
+        try:
+            yield staging
+        except DiscardStaging:
+            remove_in_background(staging)
+            return
+        except BaseException:
+            remove_in_background(staging)
+            raise
+
+        if not os.path.exists(target_folder):
+            os.rename(staging, target_folder)
+        elif _exchange(staging, target_folder):
+            # the staging path now holds the previous model, unlocked, so
+            # another generation may already be removing it as stale
+            suffix = os.path.basename(staging)[len(prefix) :]
+            old = os.path.join(parent, f".{name}.old-{suffix}")
+            with contextlib.suppress(FileNotFoundError):
+                os.rename(staging, old)
+                remove_in_background(old)
+        else:
+            old = tempfile.mkdtemp(prefix=f".{name}.old-", dir=parent)
+            os.rename(target_folder, os.path.join(old, name))
+            os.rename(staging, target_folder)
+            remove_in_background(old)
+    finally:
+        if lock is not None:
+            os.close(lock)
+
+
+@contextlib.contextmanager
+def staged_file(target_file: str) -> Iterator[str]:
+    """Yield a staging file which replaces the target file on success.
+
+    If the body raises, the staging file is removed and the target file is
+    left untouched. Readers which opened or mapped the previous file keep
+    reading it.
+    """
+    target_file = os.path.abspath(target_file)
+    parent, name = os.path.split(target_file)
+    os.makedirs(parent, exist_ok=True)
+
+    _remove_stale_staging(parent, name)
+    staging = _create_unique(parent, f".{name}.staging-", _create_file)
+    lock = _lock(staging) if fcntl is not None else None
+    try:
+        try:
+            yield staging
+        except BaseException:
+            os.remove(staging)
+            raise
+        os.replace(staging, target_file)
+    finally:
+        if lock is not None:
+            os.close(lock)
@@ -0,0 +1,180 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Statistics of a loaded tree and of the models generated from it.
+
+Used by --dry-run to judge the size of a model, e.g. of an overlay, before
+generating it. Nothing is written. Small models are rendered into a sink
+counting their files, so the sizes are exact, apart from the manifest of the
+model. Of larger models only a sample of the branches is rendered, the files
+are still counted exactly, the bytes are extrapolated from the sample.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from anytree import PreOrderIter  # type: ignore
+from vspec.model.constants import VSSType  # type: ignore
+from vspec.model.vsstree import VSSNode  # type: ignore
+
+from velocitas.model_generator.docs import DOCS_FILE
+from velocitas.model_generator.prune import _instance_paths
+from velocitas.model_generator.sinks import CountingSink, MemorySink, OutputSink
+
+LANGUAGES = ["python", "cpp"]
+
+# the number of branches rendered to estimate the size of a larger model
+SAMPLE_SIZE = 200
+
+
+class TreeStatistics:
+    """Counts of the nodes of a tree and the size of its models."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.branches = 0
+        # leaves by their datatype, e.g. "float" or "string[]"
+        self.leaves: Dict[str, int] = {}
+        # branches with instances and the number of instances they expand to
+        self.collections = 0
+        self.instances = 0
+        self.max_depth = 0
+        self.max_fan_out = 0
+        self.files: Dict[str, int] = {}
+        self.bytes: Dict[str, int] = {}
+        # whether the bytes are extrapolated from a sample of the branches
+        self.estimated = False
+
+
+def analyze_tree(
+    tree: VSSNode,
+    name: str = "vehicle",
+    languages: List[str] = LANGUAGES,
+    docs: str = "full",
+    stubs: bool = False,
+    sample_size: Optional[int] = SAMPLE_SIZE,
+) -> TreeStatistics:
+    """Collect the statistics of a tree and of its models in the languages.
+
+    The models are rendered with docs, one of DOCS_MODES, and stubs like
+    generate_model does. Trees with more than sample_size branches are only
+    rendered for a sample of them, None renders all.
+    """
+    stats = TreeStatistics()
+    # the qualified names of the branches in pre-order and the number of
+    # nodes their files render, the branch and its children
+    branches: List[Tuple[str, int]] = []
+    for node in PreOrderIter(tree):
+        stats.max_depth = max(stats.max_depth, node.depth)
+        stats.max_fan_out = max(stats.max_fan_out, len(node.children))
+        if node.type.value == VSSType.BRANCH.value:
+            stats.branches += 1
+            branches.append((node.qualified_name(), 1 + len(node.children)))
+            instances = len(_instance_paths(node))
+            if instances:
+                stats.collections += 1
+                stats.instances += instances
+        else:
+            datatype = node.data_type_str or "none"
+            stats.leaves[datatype] = stats.leaves.get(datatype, 0) + 1
+
+    stats.estimated = sample_size is not None and len(branches) > sample_size
+    for language in languages:
+        if sample_size is not None and stats.estimated:
+            files, size = _estimate_model(
+                tree, language, name, docs, stubs, branches, sample_size
+            )
+        else:
+            sink = CountingSink()
+            _generator(tree, language, name, sink, docs, stubs).generate()
+            files, size = len(sink.paths), sink.bytes
+        stats.files[language] = files
+        stats.bytes[language] = size
+    return stats
+
+
+def _generator(
+    tree: VSSNode,
+    language: str,
+    name: str,
+    sink: OutputSink,
+    docs: str,
+    stubs: bool,
+):
+    """The generator of the language, it only reads the tree."""
+    if language == "python":
+        from velocitas.model_generator.python.python_generator import (
+            VehicleModelPythonGenerator,
+        )
+
+        return VehicleModelPythonGenerator(tree, "", name, sink, docs, stubs)
+    if language == "cpp":
+        from velocitas.model_generator.cpp.cpp_generator import (
+            VehicleModelCppGenerator,
+        )
+
+        return VehicleModelCppGenerator(tree, "", name, sink, docs)
+    raise ValueError(f"Language {language} is not supported yet.")
+
+
+def _estimate_model(
+    tree: VSSNode,
+    language: str,
+    name: str,
+    docs: str,
+    stubs: bool,
+    branches: List[Tuple[str, int]],
+    sample_size: int,
+) -> Tuple[int, int]:
+    """The files and the estimated bytes of a model, rendering a sample.
+
+    Every branch is rendered into the same number of files, whose size grows
+    with the nodes they render, the package files are rendered as a whole.
+    """
+    sample = branches[:: -(-len(branches) // sample_size)]
+    sink = MemorySink()
+    generator = _generator(tree, language, name, sink, docs, stubs)
+    generator.generate_package()
+    package = set(sink.files)
+    generator.generate({branch for branch, _ in sample})
+
+    files = size = 0
+    sample_files = sample_bytes = 0
+    for path, content in sink.files.items():
+        if path in package or path == DOCS_FILE:
+            files += 1
+            size += len(content.encode("utf-8"))
+        else:
+            sample_files += 1
+            sample_bytes += len(content.encode("utf-8"))
+    nodes = sum(count for _, count in branches)
+    sample_nodes = sum(count for _, count in sample)
+    files += sample_files * len(branches) // len(sample)
+    size += round(sample_bytes * nodes / sample_nodes)
+    return files, size
+
+
+def print_statistics(stats: TreeStatistics):
+    """Print the statistics as a table."""
+    print(f"{'branches':30}{stats.branches:>10}")
+    print(f"{'leaves':30}{sum(stats.leaves.values()):>10}")
+    for datatype, count in sorted(stats.leaves.items()):
+        print(f"{'  ' + datatype:30}{count:>10}")
+    print(f"{'collections':30}{stats.collections:>10}")
+    print(f"{'expanded instances':30}{stats.instances:>10}")
+    print(f"{'max depth':30}{stats.max_depth:>10}")
+    print(f"{'max fan-out':30}{stats.max_fan_out:>10}")
+    estimated = " (estimated)" if stats.estimated else ""
+    for language in stats.files:
+        print(f"{language + ' files':30}{stats.files[language]:>10}")
+        print(f"{language + ' bytes' + estimated:30}{stats.bytes[language]:>10}")
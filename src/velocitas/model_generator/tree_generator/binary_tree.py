@@ -0,0 +1,396 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compact binary file of a loaded VSS tree.
+
+A tree is converted once, e.g. per VSS release, and then loads without
+parsing and validating vspec or JSON again. The file is memory-mapped, the
+nodes are created with their name and type only, the other attributes are
+decoded from the mapping when a node is first asked for one of them.
+
+Layout, all offsets are in bytes from the start of the file::
+
+    header      HEADER, 48 bytes
+    strings     string_count + 1 uint32 offsets into the string data
+    string data UTF-8, string i spans offsets[i] to offsets[i + 1]
+    nodes       node_count NODE records in pre-order, the root is node 0
+    attributes  attribute_count ATTRIBUTE records, the source dict entries
+                of the nodes except children and type, values are JSON
+    units       unit_count UNIT records, the units used by the tree
+
+Sections start at multiples of 8 bytes.
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+import vspec  # type: ignore
+from anytree import Node, PreOrderIter  # type: ignore
+from vspec.model.constants import (  # type: ignore
+    Unit,
+    VSSConstant,
+    VSSDataType,
+    VSSTreeType,
+    VSSType,
+)
+from vspec.model.vsstree import VSSNode  # type: ignore
+
+from velocitas.model_generator.staging import staged_file
+
+MAGIC = b"VSSTREE\0"
+VERSION = 1
+
+# magic, version, node, string, attribute and unit count, offsets of the
+# strings, string data, nodes, attributes and units
+HEADER = struct.Struct("<8s10I")
+# name, type, child count, first attribute, attribute count
+NODE = struct.Struct("<IBxxxIII")
+# key, value
+ATTRIBUTE = struct.Struct("<II")
+# name, label, description, domain
+UNIT = struct.Struct("<IIII")
+
+_TYPES = [vss_type.value for vss_type in VSSType]
+_SIGNAL_TYPES = VSSTreeType.SIGNAL_TREE.available_types()
+# the attributes VSSNode reads from its source dict
+_UNPACKED = [a for a in VSSNode.core_attributes if a not in ("children", "type")]
+
+
+class InvalidBinaryTree(vspec.VSpecError, ValueError):
+    """A file is no complete binary tree of a supported version.
+
+    Handled like the errors vss-tools raises for invalid vspec files.
+    """
+
+    def __init__(self, path: str, message: str):
+        """Create the error for the file."""
+        super().__init__(path, 0, message)
+
+    def __str__(self):
+        return f"{self.file_name}: {self.message}"
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class _StringTable:
+    """Deduplicates the strings of a binary tree."""
+
+    def __init__(self) -> None:
+        self.indices: Dict[str, int] = {}
+        self.strings: List[bytes] = []
+
+    def add(self, text: str) -> int:
+        index = self.indices.get(text)
+        if index is None:
+            index = self.indices[text] = len(self.strings)
+            self.strings.append(text.encode("utf-8"))
+        return index
+
+
+def write_binary_tree(root_node: VSSNode, path: str):
+    """Write a loaded tree into a binary tree file, replacing it atomically."""
+    strings = _StringTable()
+    nodes: List[bytes] = []
+    attributes: List[bytes] = []
+    units: Dict[str, VSSConstant] = {}
+
+    for node in PreOrderIter(root_node):
+        first = len(attributes)
+        for key, value in node.source_dict.items():
+            if key in ("children", "type"):
+                continue
+            if key == "$file_name$":
+                # the location of the sources does not matter for the tree
+                value = ""
+            attributes.append(
+                ATTRIBUTE.pack(
+                    strings.add(key),
+                    strings.add(json.dumps(value, separators=(",", ":"))),
+                )
+            )
+        unit = getattr(node, "unit", None)
+        if unit is not None:
+            units[unit.value] = unit
+        nodes.append(
+            NODE.pack(
+                strings.add(node.name),
+                _TYPES.index(node.type.value),
+                len(node.children),
+                first,
+                len(attributes) - first,
+            )
+        )
+    unit_records = [
+        UNIT.pack(
+            strings.add(name),
+            strings.add(unit.label),
+            strings.add(unit.description or ""),
+            strings.add(unit.domain or ""),
+        )
+        for name, unit in units.items()
+    ]
+
+    offsets = [0]
+    for data in strings.strings:
+        offsets.append(offsets[-1] + len(data))
+    strings_offset = HEADER.size
+    string_data_offset = _align(strings_offset + 4 * len(offsets))
+    nodes_offset = _align(string_data_offset + offsets[-1])
+    attributes_offset = nodes_offset + NODE.size * len(nodes)
+    units_offset = attributes_offset + ATTRIBUTE.size * len(attributes)
+
+    with staged_file(path) as staging:
+        with open(staging, "wb") as file:
+            file.write(
+                HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    len(nodes),
+                    len(strings.strings),
+                    len(attributes),
+                    len(unit_records),
+                    strings_offset,
+                    string_data_offset,
+                    nodes_offset,
+                    attributes_offset,
+                    units_offset,
+                )
+            )
+            file.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            file.write(b"\0" * (string_data_offset - file.tell()))
+            file.write(b"".join(strings.strings))
+            file.write(b"\0" * (nodes_offset - file.tell()))
+            file.write(b"".join(nodes))
+            file.write(b"".join(attributes))
+            file.write(b"".join(unit_records))
+
+
+class _Unpacked:
+    """An attribute of a MappedVSSNode, decoded on first access."""
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, node, owner=None):
+        if node is None:
+            return self
+        attributes = node.__dict__
+        if "source_dict" not in attributes:
+            node.unpack()
+        if self.name in attributes:
+            return attributes[self.name]
+        # not in the source dict, the default of VSSNode, which has none for
+        # the datatype, e.g. of branches
+        return getattr(VSSNode, self.name)
+
+
+class MappedVSSNode(VSSNode):
+    """A node of a binary tree file.
+
+    Behaves like the VSSNode loaded from the sources, but its attributes are
+    only decoded from the mapped file when first read. The file was validated
+    when it was converted, the node is not validated again.
+    """
+
+    source_dict = _Unpacked()
+    extended_attributes = _Unpacked()
+    data_type_str = _Unpacked()
+    datatype = _Unpacked()
+    unit = _Unpacked()
+    description = _Unpacked()
+    comment = _Unpacked()
+    uuid = _Unpacked()
+    min = _Unpacked()
+    max = _Unpacked()
+    allowed = _Unpacked()
+    instantiate = _Unpacked()
+    default = _Unpacked()
+    instances = _Unpacked()
+    deprecation = _Unpacked()
+
+    def __init__(
+        self,
+        tree: "BinaryTree",
+        index: int,
+        name: str,
+        vss_type: VSSType,
+        parent: Optional[VSSNode] = None,
+    ):
+        # VSSNode.__init__ would unpack and validate the source dict
+        Node.__init__(self, name, parent)
+        self.available_types = _SIGNAL_TYPES
+        self.type = vss_type
+        self.tree = tree
+        self.index = index
+
+    def unpack(self, source: Optional[dict] = None):
+        """Decode the attributes like VSSNode.unpack_source_dict does.
+
+        source defaults to the source dict of the node in the file.
+        """
+        attributes = self.__dict__
+        if source is None:
+            source = self.tree.source_dict(self.index)
+            source["type"] = self.type.value
+        attributes["source_dict"] = source
+        extended = dict(source)
+        del extended["type"]
+        for key in _UNPACKED:
+            if key in source:
+                attributes[key] = extended.pop(key)
+        attributes["extended_attributes"] = extended
+
+        datatype = source.get("datatype")
+        if datatype is not None:
+            attributes["data_type_str"] = datatype
+            # struct datatypes are not supported in signal trees
+            attributes["datatype"] = (
+                VSSDataType.from_str(datatype)
+                if datatype in VSSDataType.values()
+                else None
+            )
+        unit = source.get("unit")
+        attributes["unit"] = (
+            self.tree.unit(unit)
+            if unit is not None and attributes.get("datatype") is not None
+            else None
+        )
+
+    def __deepcopy__(self, memo):
+        copy = MappedVSSNode(self.tree, self.index, self.name, self.type)
+        if "source_dict" in self.__dict__:
+            # the source dict changes when overlays are merged into the node
+            copy.unpack(self.source_dict.copy())
+        for child in self.children:
+            child_copy = child.__deepcopy__(memo)
+            child_copy.parent = copy
+        return copy
+
+
+class BinaryTree:
+    """A binary tree file mapped read-only into memory."""
+
+    def __init__(self, path: str):
+        """Map the binary tree file.
+
+        Raises:
+            InvalidBinaryTree: If the file is not a complete binary tree of a
+                supported version
+        """
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < HEADER.size:
+                raise InvalidBinaryTree(path, "Not a binary VSS tree")
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mmap)
+        if self.view[:8] != MAGIC:
+            raise InvalidBinaryTree(path, "Not a binary VSS tree")
+        header = HEADER.unpack_from(self.view, 0)
+        if header[1] != VERSION:
+            raise InvalidBinaryTree(
+                path, f"Binary VSS tree version {header[1]} is not supported"
+            )
+        (
+            self.node_count,
+            self.string_count,
+            self.attribute_count,
+            self.unit_count,
+            self.strings_offset,
+            self.string_data_offset,
+            self.nodes_offset,
+            self.attributes_offset,
+            self.units_offset,
+        ) = header[2:]
+        # the units are the last section
+        if len(self.view) < self.units_offset + UNIT.size * self.unit_count:
+            raise InvalidBinaryTree(path, "The binary VSS tree is truncated")
+        self.units: Dict[str, VSSConstant] = {}
+        for name, label, description, domain in UNIT.iter_unpack(
+            self.view[
+                self.units_offset : self.units_offset + UNIT.size * self.unit_count
+            ]
+        ):
+            unit = self.string(name)
+            self.units[unit] = VSSConstant(
+                self.string(label), unit, self.string(description), self.string(domain)
+            )
+
+    def string(self, index: int) -> str:
+        """Decode a string of the string table."""
+        start, end = struct.unpack_from(
+            "<2I", self.view, self.strings_offset + 4 * index
+        )
+        offset = self.string_data_offset
+        return str(self.view[offset + start : offset + end], "utf-8")
+
+    def source_dict(self, index: int) -> dict:
+        """Decode the source dict of a node, without its children and type."""
+        _, _, _, first, count = NODE.unpack_from(
+            self.view, self.nodes_offset + NODE.size * index
+        )
+        start = self.attributes_offset + ATTRIBUTE.size * first
+        return {
+            self.string(key): json.loads(self.string(value))
+            for key, value in ATTRIBUTE.iter_unpack(
+                self.view[start : start + ATTRIBUTE.size * count]
+            )
+        }
+
+    def unit(self, name: str) -> VSSConstant:
+        """Return a unit of the tree, the unit files are not needed."""
+        if name in self.units:
+            return self.units[name]
+        # units of merged overlays come from the unit files
+        return Unit.from_str(name)  # type: ignore
+
+    def register_units(self):
+        """Register the units of the tree with vss-tools."""
+        Unit.add_config(
+            {
+                name: {
+                    "label": unit.label,
+                    "description": unit.description,
+                    "domain": unit.domain,
+                }
+                for name, unit in self.units.items()
+            }
+        )
+
+    def load_tree(self) -> MappedVSSNode:
+        """Create the nodes of the tree, their attributes are decoded lazily."""
+        records = NODE.iter_unpack(
+            self.view[
+                self.nodes_offset : self.nodes_offset + NODE.size * self.node_count
+            ]
+        )
+        types = [VSSType.from_str(value) for value in _TYPES]
+        name, vss_type, child_count, _, _ = next(records)
+        root = MappedVSSNode(self, 0, self.string(name), types[vss_type])
+        # the parents still expecting children, with the number they expect
+        stack: List[Tuple[MappedVSSNode, int]] = [(root, child_count)]
+        for index, (name, vss_type, child_count, _, _) in enumerate(records, 1):
+            while stack[-1][1] == 0:
+                stack.pop()
+            parent, expected = stack[-1]
+            stack[-1] = (parent, expected - 1)
+            node = MappedVSSNode(
+                self, index, self.string(name), types[vss_type], parent
+            )
+            if child_count:
+                stack.append((node, child_count))
+        return root
@@ -14,3 +14,4 @@
 
 VSPEC = "vspec"
 JSON = "json"
+BINARY = "vssb"
@@ -13,15 +13,110 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
+import logging
+import os
+import re
 from abc import abstractmethod
-from typing import List
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 import vspec  # type: ignore
 
-from velocitas.model_generator.tree_generator.constants import JSON, VSPEC
+from velocitas.model_generator.tree_generator.constants import BINARY, JSON, VSPEC
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from velocitas.model_generator.tree_generator.binary_tree import BinaryTree
 
 # supported file formats
-formats = [VSPEC, JSON]
+formats = [VSPEC, JSON, BINARY]
+
+logger = logging.getLogger(__name__)
+
+# same directive vss-tools expands, e.g. "#include Door.vspec Vehicle.Cabin"
+_INCLUDE_DIRECTIVE = re.compile(r"^#include\s+(\S+)", re.MULTILINE)
+
+# below this number of overlays, starting worker processes costs more than
+# parsing the overlays one after another
+_MIN_PARALLEL_OVERLAYS = 2
+
+
+def _overlay_workers(overlay_count: int) -> int:
+    """Number of processes parsing overlays, 0 to parse them sequentially."""
+    workers = min(overlay_count, os.cpu_count() or 1)
+    return workers if workers >= _MIN_PARALLEL_OVERLAYS else 0
+
+
+def _overlay_pool(workers: int) -> "ProcessPoolExecutor":
+    """The processes parsing overlays, started without forking this one.
+
+    Trees are also loaded from threads, e.g. of the server. A forked process
+    inherits the locks other threads hold, e.g. of logging or vss_tools_state,
+    and may wait for them forever.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context(method))
+
+
+def _unit_files(file_path: str, unit_file_path_list: List[str]) -> List[str]:
+    """The unit files vss-tools loads for the given input file."""
+    if unit_file_path_list:
+        return list(unit_file_path_list)
+    # vss-tools falls back to a units.yaml next to the input file
+    default_unit_file = os.path.join(
+        os.path.dirname(os.path.realpath(file_path)), "units.yaml"
+    )
+    return [default_unit_file] if os.path.exists(default_unit_file) else []
+
+
+def _find_vspec_file(file_name: str, include_dirs: List[str]) -> Optional[str]:
+    """Resolve a vspec file name the way vss-tools searches for it."""
+    if os.path.isabs(file_name):
+        return file_name if os.path.isfile(file_name) else None
+    for directory in include_dirs:
+        path = f"{directory}/{file_name}"
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _collect_vspec_files(file_name: str, include_dirs: List[str], files: List[str]):
+    """Add a vspec file and all files it includes, in reading order."""
+    path = _find_vspec_file(file_name, include_dirs)
+    if path is None:
+        # vss-tools reports the missing file when loading the tree
+        return
+    files.append(path)
+
+    directory = os.path.dirname(path)
+    if directory not in include_dirs:
+        include_dirs = [directory] + include_dirs
+    with open(path, encoding="utf-8") as file:
+        for include in _INCLUDE_DIRECTIVE.findall(file.read()):
+            _collect_vspec_files(include, include_dirs, files)
+
+
+def _parse_vspec(file_name: str, include_dirs: List[str]) -> dict:
+    """Parse a vspec file and its includes into the nested model of vss-tools.
+
+    These are the steps of vspec.load_tree before rendering the tree. They
+    neither depend on the loaded units nor on other files, so overlays can be
+    parsed in worker processes while the base tree is loaded.
+    """
+    flat_model = vspec.load_flat_model(
+        file_name, "", include_dirs, vspec.VSSTreeType.SIGNAL_TREE
+    )
+    absolute_path_flat_model = vspec.create_absolute_paths(flat_model)
+    deep_model = vspec.create_nested_model(absolute_path_flat_model, file_name)
+    vspec.cleanup_deep_model(deep_model)
+    return deep_model["children"]
 
 
 class FileFormat:
@@ -33,6 +128,28 @@ def __init__(self, file_path: str):
     def load_tree(self):
         pass
 
+    # method to override when adding a new format
+    @abstractmethod
+    def input_files(self) -> List[str]:
+        """Return all files loading the tree reads, in reading order."""
+        pass
+
+    def load_base_tree(self):
+        """loads the tree without applying overlays"""
+        return self.load_tree()
+
+    def apply_overlays(self, tree):
+        """merges the overlays into a tree returned by load_base_tree"""
+        return tree
+
+    def load_units(self):
+        """registers the units of the model with vss-tools
+
+        Needed again before copying a tree loaded in another vss_tools_state,
+        as copying recreates its nodes.
+        """
+        pass
+
 
 class Vspec(FileFormat):
     def __init__(
@@ -51,12 +168,23 @@ def __init__(
 
     def load_tree(self):
         """loads a tree of a vspec file through vss-tools"""
-        print("Loading vspec...")
-        vspec.load_units(
-            self.file_path,
-            self.unit_file_path_list,
-        )
-        tree = vspec.load_tree(
+        workers = _overlay_workers(len(self.overlays))
+        if not workers:
+            return self.apply_overlays(self.load_base_tree())
+
+        # the overlays are parsed while the base tree is loaded
+        with _overlay_pool(workers) as pool:
+            overlay_models = [
+                pool.submit(_parse_vspec, overlay, self.include_dirs)
+                for overlay in self.overlays
+            ]
+            tree = self.load_base_tree()
+            return self.__merge_overlays(tree, (m.result() for m in overlay_models))
+
+    def load_base_tree(self):
+        logger.info("Loading vspec...")
+        self.load_units()
+        return vspec.load_tree(
             self.file_path,
             self.include_dirs,
             tree_type=vspec.VSSTreeType.SIGNAL_TREE,
@@ -64,19 +192,42 @@ def load_tree(self):
             expand_inst=False,
         )
 
-        for overlay in self.overlays:
-            print(f"Applying VSS overlay from {overlay}...")
-            overlay_tree = vspec.load_tree(
-                overlay,
-                self.include_dirs,
-                merge_private=False,
-                break_on_unknown_attribute=self.strict,
+    def apply_overlays(self, tree):
+        workers = _overlay_workers(len(self.overlays))
+        if not workers:
+            overlay_models = (
+                _parse_vspec(overlay, self.include_dirs) for overlay in self.overlays
+            )
+            return self.__merge_overlays(tree, overlay_models)
+
+        with _overlay_pool(workers) as pool:
+            overlay_models = pool.map(
+                _parse_vspec, self.overlays, [self.include_dirs] * len(self.overlays)
+            )
+            return self.__merge_overlays(tree, overlay_models)
+
+    def __merge_overlays(self, tree, overlay_models: Iterable[dict]):
+        """merges the parsed overlays in their declared order"""
+        for overlay, overlay_model in zip(self.overlays, overlay_models):
+            logger.info("Applying VSS overlay from %s...", overlay)
+            overlay_tree = vspec.render_tree(
+                overlay_model,
+                vspec.VSSTreeType.SIGNAL_TREE,
                 break_on_name_style_violation=self.strict,
-                expand_inst=False,
             )
             vspec.merge_tree(tree, overlay_tree)
         return tree
 
+    def load_units(self):
+        vspec.load_units(self.file_path, self.unit_file_path_list)
+
+    def input_files(self) -> List[str]:
+        files = _unit_files(self.file_path, self.unit_file_path_list)
+        _collect_vspec_files(self.file_path, self.include_dirs, files)
+        for overlay in self.overlays:
+            _collect_vspec_files(overlay, self.include_dirs, files)
+        return files
+
 
 class Json(FileFormat):
     def __init__(self, file_path: str, unit_file_path_list: List[str]):
@@ -86,21 +237,67 @@ def __init__(self, file_path: str, unit_file_path_list: List[str]):
     # VSS nodes have a field "$file_name",
     # so it needs to be added for the vss-tools to work
     def __extend_fields(self, d: dict):
-        if "children" in d:
-            for child_d in d["children"].values():
-                self.__extend_fields(child_d)
-        d["$file_name$"] = ""
-        return
+        # explicit stack, deep trees do not hit the recursion limit
+        stack = [d]
+        while stack:
+            d = stack.pop()
+            if "children" in d:
+                stack.extend(d["children"].values())
+            d["$file_name$"] = ""
 
     def load_tree(self):
         """loads a tree of a json file through vss-tools"""
-        print("Loading json...")
+        logger.info("Loading json...")
         output_json = json.load(open(self.file_path))
         self.__extend_fields(next(iter(output_json.values())))
-        print("Generating tree from json...")
-        vspec.load_units(
-            self.file_path,
-            self.unit_file_path_list,
-        )
+        logger.info("Generating tree from json...")
+        self.load_units()
         tree = vspec.render_tree(output_json, vspec.VSSTreeType.SIGNAL_TREE)
         return tree
+
+    def load_units(self):
+        vspec.load_units(self.file_path, self.unit_file_path_list)
+
+    def input_files(self) -> List[str]:
+        return _unit_files(self.file_path, self.unit_file_path_list) + [self.file_path]
+
+
+class Binary(Vspec):
+    """A tree converted into a binary tree file, see binary_tree.
+
+    The overlays are vspec files, merged like for Vspec. The units are part of
+    the file, unit files are only needed for units the overlays add.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        unit_file_path_list: List[str],
+        include_dirs: List,
+        strict: bool,
+        overlays: List[str],
+    ):
+        super().__init__(file_path, unit_file_path_list, include_dirs, strict, overlays)
+        self.binary_tree: Optional["BinaryTree"] = None
+
+    def load_base_tree(self):
+        logger.info("Loading binary tree...")
+        self.load_units()
+        assert self.binary_tree is not None
+        return self.binary_tree.load_tree()
+
+    def load_units(self):
+        from velocitas.model_generator.tree_generator.binary_tree import BinaryTree
+
+        # the file is mapped again on every load, it may have been converted
+        # again in the meantime
+        self.binary_tree = BinaryTree(self.file_path)
+        self.binary_tree.register_units()
+        if self.unit_file_path_list:
+            vspec.load_units(self.file_path, self.unit_file_path_list)
+
+    def input_files(self) -> List[str]:
+        files = list(self.unit_file_path_list) + [self.file_path]
+        for overlay in self.overlays:
+            _collect_vspec_files(overlay, self.include_dirs, files)
+        return files
@@ -15,8 +15,13 @@
 import os
 from typing import List
 
-from velocitas.model_generator.tree_generator.constants import JSON, VSPEC
-from velocitas.model_generator.tree_generator.file_formats import Json, Vspec, formats
+from velocitas.model_generator.tree_generator.constants import BINARY, JSON, VSPEC
+from velocitas.model_generator.tree_generator.file_formats import (
+    Binary,
+    Json,
+    Vspec,
+    formats,
+)
 
 
 # if no other file supported format is found
@@ -53,7 +58,7 @@ def __get_format_implementation(
         file_path: str,
         unit_file_path_list: List[str],
     ):
-        """Initialize implementation of VSPEC or JSON.
+        """Initialize implementation of VSPEC, JSON or BINARY.
 
         Args:
             file_path str: path to the file that is used for format checking
@@ -82,8 +87,28 @@ def __get_format_implementation(
                     file_path=file_path,
                     unit_file_path_list=unit_file_path_list,
                 )
+            elif file_ext == BINARY:
+                return Binary(
+                    file_path=self.file_path,
+                    unit_file_path_list=unit_file_path_list,
+                    include_dirs=self.include_dirs,
+                    strict=self.strict,
+                    overlays=self.overlays,
+                )
         else:
             raise UnsupportedFileFormat(file_ext)
 
     def load_tree(self):
         return self.format_implementation.load_tree()
+
+    def load_base_tree(self):
+        return self.format_implementation.load_base_tree()
+
+    def apply_overlays(self, tree):
+        return self.format_implementation.apply_overlays(tree)
+
+    def load_units(self):
+        self.format_implementation.load_units()
+
+    def input_files(self) -> List[str]:
+        return self.format_implementation.input_files()
@@ -13,7 +13,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import re
-from typing import Optional
+from typing import Dict, List, Optional
+
+_SLOT_REG_EX = re.compile(r"%([A-Z_]+)%")
 
 
 def camel_to_snake_case(input: str) -> str:
@@ -24,6 +26,89 @@ def camel_to_snake_case(input: str) -> str:
     return "_".join(map(str.lower, parts))
 
 
+class Template:
+    """A code template with %SLOT% placeholders.
+
+    Slots are filled verbatim. When indented, every line is indented like
+    CodeGeneratorContext.write does, except that lines without content are
+    left empty even if the template indents them. The lines of a multi-line
+    value keep the indentation of the template line of the slot.
+
+    The template is compiled once per indentation into a format string,
+    filled in one pass.
+    """
+
+    def __init__(self, text: str):
+        """Compile the template text."""
+        # the indentation of every line and its content, alternating literal
+        # text and slot names
+        self.lines = []
+        for line in text.split("\n"):
+            content = line.lstrip(" ")
+            self.lines.append(
+                (line[: len(line) - len(content)], _SLOT_REG_EX.split(content))
+            )
+        # a line consisting of slots only is empty if their values are
+        self.line_slots = [
+            parts[1::2]
+            for _, parts in self.lines
+            if len(parts) > 1 and not any(parts[0::2])
+        ]
+        self.__indented: Dict[str, str] = {}
+
+    def fill(self, **values: str) -> str:
+        """Return the text with the slots filled, without indenting it."""
+        return "\n".join(
+            indent + self.__fill_line(parts, values) for indent, parts in self.lines
+        )
+
+    def indented(self, prefix: str, values: Dict[str, str]) -> str:
+        """Return the filled text with every line indented by prefix."""
+        for names in self.line_slots:
+            if not any(values[name] for name in names):
+                return self.__indent_lines(prefix, values)
+        for value in values.values():
+            if "\n" in value:
+                return self.__indent_lines(prefix, values)
+
+        indented = self.__indented.get(prefix)
+        if indented is None:
+            indented = self.__indented[prefix] = self.__compile(prefix)
+        return indented.format_map(values)
+
+    def __compile(self, prefix: str) -> str:
+        lines = []
+        for indent, parts in self.lines:
+            content = "".join(
+                f"{{{part}}}" if i % 2 else part.replace("{", "{{").replace("}", "}}")
+                for i, part in enumerate(parts)
+            )
+            lines.append(prefix + indent + content if content else "")
+        return "\n".join(lines)
+
+    def __indent_lines(self, prefix: str, values: Dict[str, str]) -> str:
+        lines = []
+        for indent, parts in self.lines:
+            for line in self.__fill_line(parts, values).split("\n"):
+                lines.append(prefix + indent + line if line else "")
+        return "\n".join(lines)
+
+    def __fill_line(self, parts: List[str], values: Dict[str, str]) -> str:
+        return "".join(values[part] if i % 2 else part for i, part in enumerate(parts))
+
+
+class _Slot(str):
+    """The placeholder of a slot in the generated code."""
+
+    name: str
+
+    def __new__(cls, name: str):
+        """Create the placeholder of the named slot."""
+        slot = super().__new__(cls, f"%{name}%")
+        slot.name = name
+        return slot
+
+
 class CodeGeneratorContext:
     """CodeGeneratorContext."""
 
@@ -53,8 +138,18 @@ def set_position(self, position: int):
         """Set the position of the writing cursor in the generated model code."""
         self.position = position
 
-    def get_content(self):
-        """Return the content of the generated model code."""
+    def get_content(self, **slots: str):
+        """Return the content of the generated model code.
+
+        Slots written with write_slot are filled with the given values.
+        """
+        if slots:
+            return "".join(
+                [
+                    slots[code.name] if isinstance(code, _Slot) else code
+                    for code in self.model_code
+                ]
+            )
         code = "".join(self.model_code)
         return code
 
@@ -93,6 +188,32 @@ def write(
                 self.model_code.insert(self.position, line_prefix + line + line_suffix)
                 self.position += 1
 
+    def emit(self, template: Template, **values: str):
+        """Write the filled template at the current position.
+
+        Writes the same as writing the filled template line by line with
+        write, see Template for the indentation.
+        """
+        line_prefix = self.tab * self.level
+        text = template.indented(line_prefix, values)
+        # like write, a line continuing the previous one is not indented
+        if line_prefix and self.position > 0 and text.startswith(line_prefix):
+            prev_line = self.model_code[self.position - 1]
+            if len(prev_line) > 0 and not prev_line[-1] == self.line_break:
+                text = text[len(line_prefix) :]
+        self.model_code.insert(self.position, text)
+        self.position += 1
+
+    def write_slot(self, name: str):
+        """Write a slot at the current position, filled by get_content."""
+        line_prefix = self.tab * self.level
+        if self.position > 0:
+            prev_line = self.model_code[self.position - 1]
+            if len(prev_line) > 0 and not prev_line[-1] == self.line_break:
+                line_prefix = ""
+        self.model_code[self.position : self.position] = [line_prefix, _Slot(name)]
+        self.position += 2
+
     def indent(self):
         """Increase the indentation level."""
         self.level += 1
@@ -0,0 +1,59 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Isolate the process global state of vss-tools between generations.
+
+vss-tools keeps the whitelisted extended attributes and all loaded units in
+class attributes. Loading a tree therefore runs under a lock, with these
+set up for the generation and restored afterwards. Rendering a loaded tree
+does not use them and runs concurrently.
+"""
+
+import contextlib
+import threading
+from typing import Any, Iterator, List
+
+from vspec.model.constants import Unit  # type: ignore
+from vspec.model.vsstree import VSSNode  # type: ignore
+
+_lock = threading.RLock()
+
+# the unit registry is kept by the metaclass of Unit
+_units: Any = Unit
+
+
+@contextlib.contextmanager
+def vss_tools_state(ext_attributes_list: List[str]) -> Iterator[None]:
+    """Run vss-tools with the given whitelisted extended attributes.
+
+    Other threads using vss-tools wait meanwhile. Units loaded in the scope
+    are removed again at its end.
+    """
+    with _lock:
+        whitelisted_extended_attributes = VSSNode.whitelisted_extended_attributes
+        members = dict(_units.__members__)
+        reverse_lookup = dict(_units.__reverse_lookup__)
+        values = list(_units.__values__)
+
+        VSSNode.whitelisted_extended_attributes = list(ext_attributes_list)
+        try:
+            yield
+        finally:
+            VSSNode.whitelisted_extended_attributes = whitelisted_extended_attributes
+            # restored in place, vss-tools holds references to the containers
+            _units.__members__.clear()
+            _units.__members__.update(members)
+            _units.__reverse_lookup__.clear()
+            _units.__reverse_lookup__.update(reverse_lookup)
+            _units.__values__[:] = values
@@ -0,0 +1,285 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Regenerate a model whenever one of its input files changes.
+
+The loaded tree stays in memory. On a change only the base tree or only the
+overlays are reloaded, and only the files of branches whose content differs
+from the previous tree are rendered again.
+"""
+
+import copy
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Set, Tuple, Type, Union
+
+import vspec  # type: ignore
+from anytree import PreOrderIter  # type: ignore
+from vspec.model.constants import VSSType  # type: ignore
+from vspec.model.vsstree import VSSNode  # type: ignore
+
+from velocitas.model_generator.cpp.cpp_generator import VehicleModelCppGenerator
+from velocitas.model_generator.catalog import write_catalog
+from velocitas.model_generator.descriptor import write_descriptor
+from velocitas.model_generator.manifest import ManifestSink, ModelManifest
+from velocitas.model_generator.prune import SignalFilter
+from velocitas.model_generator.python.python_generator import (
+    VehicleModelPythonGenerator,
+)
+from velocitas.model_generator.sinks import FileSystemSink
+from velocitas.model_generator.staging import staged_folder
+from velocitas.model_generator.tree_generator.file_import import (
+    FileImport,
+    UnsupportedFileFormat,
+)
+from velocitas.model_generator.vss_state import vss_tools_state
+
+logger = logging.getLogger(__name__)
+
+_GENERATORS: Dict[
+    str, Type[Union[VehicleModelPythonGenerator, VehicleModelCppGenerator]]
+] = {
+    "python": VehicleModelPythonGenerator,
+    "cpp": VehicleModelCppGenerator,
+}
+
+
+def _node_fingerprint(node: VSSNode) -> Tuple:
+    """All properties of a node the generators render."""
+    return (node.name, node.type.value) + tuple(
+        str(getattr(node, attribute, None))
+        for attribute in (
+            "datatype",
+            "description",
+            "comment",
+            "min",
+            "max",
+            "unit",
+            "allowed",
+            "instances",
+        )
+    )
+
+
+def branch_fingerprints(tree: VSSNode) -> Dict[str, Tuple]:
+    """Map every branch to the properties its generated file depends on.
+
+    The file of a branch renders the branch itself and its direct children,
+    so a branch needs to be rendered again if any of them changed.
+    """
+    fingerprints = {}
+    for node in PreOrderIter(tree):
+        if node.type.value == VSSType.BRANCH.value:
+            fingerprints[node.qualified_name()] = (
+                _node_fingerprint(node),
+                tuple(_node_fingerprint(child) for child in node.children),
+            )
+    return fingerprints
+
+
+class ModelWatcher:
+    """Keeps a generated model up to date with its input files."""
+
+    def __init__(
+        self,
+        input_file_path: str,
+        input_unit_file_path_list: List[str],
+        language: str,
+        target_folder: str,
+        name: str,
+        strict: bool,
+        include_dirs: List[str],
+        overlays: List[str],
+        signal_filter: Optional[SignalFilter] = None,
+        ext_attributes_list: List[str] = [],
+        docs: str = "full",
+        stubs: bool = False,
+        descriptor: Optional[str] = None,
+        catalog: Optional[str] = None,
+    ):
+        """Initialize the watcher, see generate_model for the arguments."""
+        if language not in _GENERATORS:
+            raise ValueError(f"Language {language} is not supported yet.")
+        self.language = language
+        self.target_folder = target_folder
+        self.name = name
+        self.signal_filter = signal_filter
+        self.ext_attributes_list = ext_attributes_list
+        self.docs = docs
+        self.stubs = stubs
+        self.descriptor = descriptor
+        self.catalog = catalog
+        self.file_import = FileImport(
+            input_file_path, input_unit_file_path_list, include_dirs, strict, overlays
+        )
+        self.base_import = FileImport(
+            input_file_path, input_unit_file_path_list, include_dirs, strict, []
+        )
+        self.base_files = set(self.base_import.input_files())
+        self.stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+        self.base_tree: Optional[VSSNode] = None
+        self.fingerprints: Optional[Dict[str, Tuple]] = None
+        self.manifest_files: Dict[str, str] = {}
+
+    def __stamp_files(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+        for input_file in self.file_import.input_files():
+            try:
+                stat = os.stat(input_file)
+                stamps[input_file] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                stamps[input_file] = None
+        return stamps
+
+    def __manifest(self) -> ModelManifest:
+        """The manifest of the model, with the files generated so far."""
+        manifest = ModelManifest(
+            self.file_import.input_files(),
+            self.language,
+            self.name,
+            self.file_import.strict,
+            self.ext_attributes_list,
+            self.signal_filter.options() if self.signal_filter is not None else [],
+            self.docs,
+            self.stubs,
+        )
+        if self.fingerprints is None:
+            # the whole model is generated
+            self.manifest_files = {}
+        manifest.files = self.manifest_files
+        return manifest
+
+    def __generator(
+        self, tree: VSSNode, folder: str, sink: ManifestSink
+    ) -> Union[VehicleModelPythonGenerator, VehicleModelCppGenerator]:
+        if self.language == "python":
+            return VehicleModelPythonGenerator(
+                tree, folder, self.name, sink, self.docs, self.stubs
+            )
+        return _GENERATORS[self.language](tree, folder, self.name, sink, self.docs)
+
+    def __load_tree(self, changed: Set[str]) -> VSSNode:
+        """Reload the base tree only if one of its files changed."""
+        if self.base_tree is None or changed & self.base_files:
+            # the edit may have added or removed includes
+            self.base_files = set(self.base_import.input_files())
+            self.base_tree = self.file_import.load_base_tree()
+        tree = self.base_tree
+        if self.file_import.overlays or self.signal_filter is not None:
+            self.file_import.load_units()
+            tree = self.file_import.apply_overlays(copy.deepcopy(self.base_tree))
+        if self.signal_filter is not None:
+            tree = self.signal_filter.prune(tree)
+        return tree
+
+    def update(self) -> bool:
+        """Regenerate the changed parts of the model if an input changed.
+
+        Returns:
+            bool: True if input files changed since the last update
+        """
+        stamps = self.__stamp_files()
+        changed = {
+            f
+            for f in stamps.keys() | self.stamps.keys()
+            if stamps.get(f) != self.stamps.get(f)
+        }
+        if not changed:
+            return False
+
+        start = time.perf_counter()
+        try:
+            with vss_tools_state(self.ext_attributes_list):
+                tree = self.__load_tree(changed)
+        except (vspec.VSpecError, UnsupportedFileFormat) as e:
+            # the inputs are loaded again once they change
+            self.stamps = stamps
+            logger.error("Error: %s", e)
+            return True
+        except SystemExit:
+            # vss-tools exits on invalid specifications, keep the last model
+            self.stamps = stamps
+            logger.error("Error: loading the tree failed, keeping the previous model.")
+            return True
+        except Exception as e:
+            self.stamps = stamps
+            logger.error("Error: %r", e)
+            return True
+
+        try:
+            rendered, fingerprints = self.__render(tree)
+        except Exception as e:
+            # the stamps are kept, so the next poll tries again; the model may
+            # be partly updated, so it is generated as a whole then
+            self.fingerprints = None
+            logger.error("Error: %r", e)
+            return True
+        self.stamps = stamps
+
+        duration = (time.perf_counter() - start) * 1000
+        logger.info(
+            "Rendered %d of %d branches in %.0f ms.",
+            len(rendered),
+            len(fingerprints),
+            duration,
+        )
+        return True
+
+    def __render(self, tree: VSSNode) -> Tuple[Set[str], Dict[str, Tuple]]:
+        """Write the model and the signal files of the tree.
+
+        Returns:
+            The branches rendered and the fingerprints of all branches
+        """
+        fingerprints = branch_fingerprints(tree)
+        if self.descriptor is not None:
+            write_descriptor(tree, self.descriptor)
+        if self.catalog is not None:
+            write_catalog(tree, self.catalog)
+        manifest = self.__manifest()
+        if self.fingerprints is None:
+            with staged_folder(self.target_folder) as staging:
+                sink = FileSystemSink(staging)
+                self.__generator(tree, staging, ManifestSink(sink, manifest)).generate()
+                manifest.write(sink)
+                sink.flush()
+            rendered: Set[str] = set(fingerprints)
+        else:
+            sink = FileSystemSink(self.target_folder)
+            generator = self.__generator(
+                tree, self.target_folder, ManifestSink(sink, manifest)
+            )
+            for removed in sorted(self.fingerprints.keys() - fingerprints.keys()):
+                generator.remove_branch(removed)
+            rendered = {
+                branch
+                for branch, fingerprint in fingerprints.items()
+                if self.fingerprints.get(branch) != fingerprint
+            }
+            generator.generate(rendered)
+            manifest.write(sink)
+            sink.flush()
+        self.fingerprints = fingerprints
+        return rendered, fingerprints
+
+    def watch(self, interval: float = 0.5):
+        """Poll the input files and update the model until interrupted."""
+        logger.info("Watching for changes, press Ctrl+C to stop...")
+        try:
+            while True:
+                self.update()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
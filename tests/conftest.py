@@ -16,6 +16,8 @@
 import subprocess
 from pathlib import Path
 
+import pytest
+from velocitas.model_generator.log import logger
 from velocitas_lib import download_file
 
 
@@ -54,3 +56,11 @@ def pytest_configure(config) -> None:
     prepare_vss_repo_data("v3.1")
     prepare_vss_repo_data("v3.1.1")
     prepare_vss_repo_data("v4.0")
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    """Undo configure_logging, e.g. of gen-model, after each test."""
+    state = (logger.handlers[:], logger.level, logger.propagate)
+    yield
+    logger.handlers[:], logger.level, logger.propagate = state
@@ -0,0 +1,284 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measure how expensive a generated vehicle model is to consume.
+
+For C++ a translation unit including the root header is compiled with every
+requested compiler, recording wall time and peak memory of the compiler.
+For Python the model is imported in a fresh interpreter, recording the cold
+import time, the cost of constructing another ``Vehicle("Vehicle")`` and the
+memory retained by the model.
+
+Results are stored per variant, i.e. per set of generator options, so the
+downstream effect of a generator change can be compared run by run::
+
+    python -m tests.perf.artifact_cost -u units.yaml -I spec \\
+        --variant 'default={}' spec/VehicleSignalSpecification.vspec
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from glob import glob
+from typing import Any, Dict, List, Optional
+
+from velocitas.model_generator import generate_model
+
+_ROOT_CLASS = "Vehicle"
+
+_PYTHON_PROBE = """
+import gc, importlib, json, sys, time
+mode, path, package = sys.argv[1:4]
+sys.path.insert(0, path)
+import velocitas_sdk.model  # exclude the SDK itself from the measurement
+gc.collect()
+if mode == "memory":
+    import tracemalloc
+    tracemalloc.start()
+start = time.perf_counter()
+module = importlib.import_module(package)
+import_s = time.perf_counter() - start
+start = time.perf_counter()
+vehicle = module.Vehicle("Vehicle")
+construct_s = time.perf_counter() - start
+result = {"import_s": import_s, "construct_s": construct_s}
+if mode == "memory":
+    gc.collect()
+    result["retained_bytes"], result["peak_bytes"] = tracemalloc.get_traced_memory()
+print(json.dumps(result))
+"""
+
+
+def _max_rss_bytes(max_rss: int) -> int:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def find_compilers() -> List[str]:
+    """Return the C++ compilers available for measuring compile cost."""
+    candidates = [os.environ["CXX"]] if "CXX" in os.environ else ["g++", "clang++"]
+    return [c for c in candidates if shutil.which(c)]
+
+
+def find_root_header(target_folder: str) -> str:
+    """Return the path of the root header relative to the include folder."""
+    include_folder = os.path.join(target_folder, "include")
+    headers = glob(
+        os.path.join(include_folder, "**", f"{_ROOT_CLASS}.hpp"), recursive=True
+    )
+    if not headers:
+        raise FileNotFoundError(f"No {_ROOT_CLASS}.hpp found in {include_folder}")
+    header = min(headers, key=lambda h: h.count(os.sep))
+    return os.path.relpath(header, include_folder)
+
+
+def measure_cpp(
+    target_folder: str, compiler: str, sdk_include_dirs: List[str]
+) -> Dict[str, Any]:
+    """Compile a translation unit including the root header of a C++ model.
+
+    Args:
+        target_folder (str): The folder the C++ model was generated to
+        compiler (str): The compiler executable to use
+        sdk_include_dirs (List[str]): Include folders of the C++ vehicle app SDK
+
+    Returns:
+        Dict[str, Any]: compile time in seconds and peak memory in bytes
+    """
+    root_header = find_root_header(target_folder)
+    namespace = "::".join(os.path.dirname(root_header).split(os.sep))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = os.path.join(tmp_dir, "root.cpp")
+        with open(source, "w", encoding="utf-8") as file:
+            file.write(
+                f'#include "{root_header}"\n\n'
+                "int main() {\n"
+                f"    {namespace}::{_ROOT_CLASS} vehicle;\n"
+                "    return 0;\n"
+                "}\n"
+            )
+
+        args = [compiler, "-std=c++17", "-c", source, "-o", source + ".o"]
+        for include_dir in [os.path.join(target_folder, "include")] + sdk_include_dirs:
+            args += ["-I", include_dir]
+
+        with tempfile.TemporaryFile() as stderr:
+            start = time.perf_counter()
+            process = subprocess.Popen(args, stderr=stderr)
+            _, status, rusage = os.wait4(process.pid, 0)
+            compile_s = time.perf_counter() - start
+            process.returncode = os.waitstatus_to_exitcode(status)
+            if process.returncode != 0:
+                stderr.seek(0)
+                raise RuntimeError(
+                    f"{compiler} failed:\n{stderr.read().decode(errors='replace')}"
+                )
+
+    return {
+        "compile_s": compile_s,
+        "peak_rss_bytes": _max_rss_bytes(rusage.ru_maxrss),
+    }
+
+
+def measure_python(target_folder: str, package: str, repeat: int = 3) -> Dict[str, Any]:
+    """Import a generated Python model in fresh interpreters.
+
+    Timings are the best of ``repeat`` runs, memory is measured in a separate
+    run since tracing allocations distorts the timings.
+
+    Args:
+        target_folder (str): The folder the Python model was generated to
+        package (str): The dotted name of the root package of the model
+        repeat (int): How often the timing run is repeated
+
+    Returns:
+        Dict[str, Any]: import and construction time in seconds, retained and
+            peak memory of the model in bytes
+    """
+
+    def probe(mode: str) -> Dict[str, Any]:
+        output = subprocess.check_output(
+            [sys.executable, "-c", _PYTHON_PROBE, mode, target_folder, package]
+        )
+        return json.loads(output)
+
+    timings = [probe("time") for _ in range(repeat)]
+    result = {
+        "import_s": min(t["import_s"] for t in timings),
+        "construct_s": min(t["construct_s"] for t in timings),
+    }
+    memory = probe("memory")
+    result["retained_bytes"] = memory["retained_bytes"]
+    result["peak_bytes"] = memory["peak_bytes"]
+    return result
+
+
+def measure_variant(
+    input_file_path: str,
+    input_unit_file_path_list: List[str],
+    language: str,
+    options: Dict[str, Any],
+    compilers: Optional[List[str]] = None,
+    sdk_include_dirs: List[str] = [],
+) -> Dict[str, Any]:
+    """Generate a model with the given generator options and measure it.
+
+    Args:
+        input_file_path (str): The vspec or json file to generate the model from
+        input_unit_file_path_list (List[str]): The unit files
+        language (str): The language of the model to measure (python/cpp)
+        options (Dict[str, Any]): Keyword arguments passed to generate_model
+        compilers (Optional[List[str]]): The compilers used for C++ models,
+            all available compilers if not given
+        sdk_include_dirs (List[str]): Include folders of the C++ vehicle app SDK
+
+    Returns:
+        Dict[str, Any]: the measurements of the generated model
+    """
+    name = options.get("name", "vehicle")
+    with tempfile.TemporaryDirectory() as target_folder:
+        model_folder = os.path.join(target_folder, "model")
+        start = time.perf_counter()
+        generate_model(
+            input_file_path,
+            input_unit_file_path_list,
+            language,
+            target_folder=model_folder,
+            **options,
+        )
+        result: Dict[str, Any] = {"generate_s": time.perf_counter() - start}
+
+        if language == "python":
+            result.update(measure_python(model_folder, name.replace("/", ".")))
+        elif language == "cpp":
+            for compiler in compilers if compilers is not None else find_compilers():
+                result[compiler] = measure_cpp(model_folder, compiler, sdk_include_dirs)
+    return result
+
+
+def record_results(results_file: str, variant: str, language: str, result: dict):
+    """Merge the result of a variant into the results file."""
+    results: Dict[str, Any] = {}
+    if os.path.exists(results_file):
+        with open(results_file, encoding="utf-8") as file:
+            results = json.load(file)
+
+    results.setdefault(variant, {})[language] = result
+    os.makedirs(os.path.dirname(os.path.abspath(results_file)), exist_ok=True)
+    with open(results_file, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure compile, import and memory cost of generated models."
+    )
+    parser.add_argument("-u", "--units", nargs="+", default=[])
+    parser.add_argument("-I", "--include-dir", action="append", default=[])
+    parser.add_argument(
+        "-l",
+        "--language",
+        action="append",
+        choices=["python", "cpp"],
+        help="The languages to measure, all if omitted.",
+    )
+    parser.add_argument(
+        "--variant",
+        action="append",
+        default=[],
+        metavar="LABEL=JSON",
+        help="A labelled set of generate_model options, e.g. "
+        "'strict={\"strict\": true}'. May be given multiple times.",
+    )
+    parser.add_argument("--compiler", action="append", help="C++ compilers to use.")
+    parser.add_argument(
+        "--sdk-include",
+        action="append",
+        default=[],
+        help="Include folder of the C++ vehicle app SDK.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="results/Performance/artifact-cost.json",
+        help="The results file the measurements are merged into.",
+    )
+    parser.add_argument("input_file_path")
+    args = parser.parse_args()
+
+    variants = dict(v.split("=", 1) for v in args.variant) or {"default": "{}"}
+    for label, options_json in variants.items():
+        options = json.loads(options_json)
+        options.setdefault("include_dir", args.include_dir)
+        for language in args.language or ["python", "cpp"]:
+            result = measure_variant(
+                args.input_file_path,
+                args.units,
+                language,
+                options,
+                args.compiler,
+                args.sdk_include,
+            )
+            result["options"] = options
+            record_results(args.output, label, language, result)
+            print(f"{label:20}{language:8}{json.dumps(result)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Profile the regex and string work of rendering a loaded tree.
+
+The tree is loaded once, then the Python and the C++ model are rendered in
+memory under cProfile. The calls of the regex functions, of the name
+conversions and of the string joins are listed per language.
+
+Usage::
+
+    python -m tests.perf.naming_profile -u units.yaml -I spec \\
+        spec/VehicleSignalSpecification.vspec
+    python -m tests.perf.naming_profile --synthetic 200 --members 20
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import re
+import tempfile
+import time
+from typing import Dict, Tuple
+
+from velocitas.model_generator import _render_model
+from velocitas.model_generator.sinks import MemorySink
+from velocitas.model_generator.tree_generator.file_import import FileImport
+from velocitas.model_generator.vss_state import vss_tools_state
+
+from .synthetic_tree import write_vspec
+
+# the regex functions, the name conversions and the string joins
+_REPORTED = re.compile(
+    r"(re\.py|re/__init__\.py|naming\.py):|camel_to_snake_case|"
+    r"method 'join' of 'str'"
+)
+
+
+def profile_render(
+    tree, language: str, repeat: int = 3
+) -> Tuple[float, Dict[str, Tuple[int, float]]]:
+    """Render the tree into memory under cProfile.
+
+    Returns:
+        Tuple[float, Dict[str, Tuple[int, float]]]: the shortest duration in
+            seconds of repeat renderings without the profiler and the calls
+            and cumulative seconds of every profiled function
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _render_model(tree, language, "", "vehicle", MemorySink())
+        durations.append(time.perf_counter() - start)
+
+    profiler = cProfile.Profile()
+    profiler.runcall(_render_model, tree, language, "", "vehicle", MemorySink())
+    stats = pstats.Stats(profiler).stats  # type: ignore
+    functions = {}
+    for (file_name, line, function), (_, calls, _, total, _) in stats.items():
+        label = f"{'/'.join(file_name.split(os.sep)[-2:])}:{line}({function})"
+        functions[label] = (calls, total)
+    return min(durations), functions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Profile the name and instance handling of the generators."
+    )
+    parser.add_argument("-u", "--units", nargs="+", default=[])
+    parser.add_argument("-I", "--include-dir", action="append", default=[])
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        metavar="BRANCHES",
+        help="Profile a synthetic tree with this many top level branches.",
+    )
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("input_file_path", nargs="?")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file_path = args.input_file_path
+        include_dirs = args.include_dir
+        if args.synthetic is not None:
+            input_file_path = write_vspec(tmp_dir, args.synthetic, args.members)
+            include_dirs = [tmp_dir]
+            if not args.units:
+                args.units = [
+                    os.path.join(os.path.dirname(__file__), "..", "data", "units.yaml")
+                ]
+        if input_file_path is None:
+            parser.error("either an input file or --synthetic is required")
+
+        file_import = FileImport(
+            input_file_path, args.units, ["."] + include_dirs, False, []
+        )
+        with vss_tools_state([]):
+            tree = file_import.load_tree()
+
+    for language in ["python", "cpp"]:
+        duration, functions = profile_render(tree, language)
+        print(f"{language}: {duration * 1000:.1f} ms")
+        for label, (calls, total) in sorted(
+            functions.items(), key=lambda item: -item[1][0]
+        ):
+            if _REPORTED.search(label):
+                print(f"  {calls:10} calls {total * 1000:9.1f} ms  {label}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Time rendering a synthetic tree with wide branches.
+
+A tree with a few branches of thousands of members each is loaded once and
+rendered into memory repeatedly, the bytes per second of every language are
+printed. The member documentation and declarations are emitted through
+templates and dominate the generated files of such branches.
+
+Usage::
+
+    python -m tests.perf.render_benchmark --branches 2 --members 5000 -n 10
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import tempfile
+import time
+from typing import List, Tuple
+
+from velocitas.model_generator import _render_model
+from velocitas.model_generator.log import configure_logging
+from velocitas.model_generator.sinks import CountingSink
+from velocitas.model_generator.tree_generator.file_import import FileImport
+from velocitas.model_generator.vss_state import vss_tools_state
+
+from .synthetic_tree import write_vspec
+
+_UNITS = os.path.join(os.path.dirname(__file__), "..", "data", "units.yaml")
+
+
+def time_render(tree, language: str, repeat: int) -> Tuple[List[float], int]:
+    """Render the tree repeatedly into a CountingSink.
+
+    Returns:
+        Tuple[List[float], int]: the durations in seconds and the bytes of
+            the model
+    """
+    durations = []
+    for _ in range(repeat):
+        sink = CountingSink()
+        start = time.perf_counter()
+        _render_model(tree, language, "", "vehicle", sink)
+        durations.append(time.perf_counter() - start)
+    return durations, sink.bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time rendering branches with thousands of members."
+    )
+    parser.add_argument("--branches", type=int, default=2)
+    parser.add_argument("--members", type=int, default=5000)
+    parser.add_argument("-n", "--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    configure_logging(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file_path = write_vspec(tmp_dir, args.branches, args.members, depth=1)
+        file_import = FileImport(input_file_path, [_UNITS], [".", tmp_dir], False, [])
+        with vss_tools_state([]):
+            tree = file_import.load_tree()
+
+    for language in ["python", "cpp"]:
+        durations, size = time_render(tree, language, args.repeat)
+        print(
+            f"{language:8}median {statistics.median(durations) * 1000:8.1f} ms"
+            f"   min {min(durations) * 1000:8.1f} ms"
+            f"   {size / min(durations) / 1e6:6.1f} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
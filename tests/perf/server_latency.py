@@ -0,0 +1,143 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare the latency of warm server requests against cold CLI runs.
+
+Three ways of generating the same model are timed:
+
+* ``cold``: a fresh ``gen-model`` process
+* ``client``: a fresh ``gen-model client`` process talking to the server
+* ``request``: a request sent from this process to the server
+
+Usage::
+
+    python -m tests.perf.server_latency -u units.yaml -I spec -n 10 \\
+        spec/VehicleSignalSpecification.vspec
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from velocitas.model_generator.server import send_request
+
+
+def _time(run, repeat: int) -> List[float]:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def measure_latency(
+    generator_args: List[str], request_args: dict, repeat: int
+) -> Dict[str, List[float]]:
+    """Time cold CLI runs, client runs and plain requests.
+
+    Args:
+        generator_args (List[str]): The gen-model arguments of the generation
+        request_args (dict): The same generation as keyword arguments of
+            generate_model, used for the plain requests
+        repeat (int): How often each variant is run
+
+    Returns:
+        Dict[str, List[float]]: the durations in seconds of every variant
+    """
+    cli = [sys.executable, "-m", "velocitas.model_generator.cli"]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        socket_path = os.path.join(tmp_dir, "server.sock")
+        server = subprocess.Popen(
+            cli + ["serve", "--socket", socket_path], stdout=subprocess.DEVNULL
+        )
+        try:
+            while True:
+                try:
+                    send_request({"command": "ping"}, socket_path)
+                    break
+                except (FileNotFoundError, ConnectionRefusedError):
+                    time.sleep(0.05)
+
+            def run_cold():
+                subprocess.check_call(cli + generator_args, stdout=subprocess.DEVNULL)
+
+            def run_client():
+                subprocess.check_call(
+                    cli + ["client", "--socket", socket_path] + generator_args,
+                    stdout=subprocess.DEVNULL,
+                )
+
+            def run_request():
+                response = send_request(
+                    {"command": "generate", "args": request_args}, socket_path
+                )
+                assert response["exit_code"] == 0, response["output"]
+
+            # the first request loads the tree, the benchmark is about warm ones
+            run_request()
+            return {
+                "cold": _time(run_cold, repeat),
+                "client": _time(run_client, repeat),
+                "request": _time(run_request, repeat),
+            }
+        finally:
+            send_request({"command": "shutdown"}, socket_path)
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare warm server requests against cold gen-model runs."
+    )
+    parser.add_argument("-u", "--units", nargs="+", default=[])
+    parser.add_argument("-I", "--include-dir", action="append", default=[])
+    parser.add_argument("-l", "--language", default="python")
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    parser.add_argument("input_file_path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as target_folder:
+        generator_args = ["-l", args.language, "-T", target_folder]
+        for include_dir in args.include_dir:
+            generator_args += ["-I", os.path.abspath(include_dir)]
+        generator_args += [os.path.abspath(args.input_file_path)]
+        generator_args += ["-u"] + [os.path.abspath(u) for u in args.units]
+
+        durations = measure_latency(
+            generator_args,
+            {
+                "input_file_path": os.path.abspath(args.input_file_path),
+                "input_unit_file_path_list": [os.path.abspath(u) for u in args.units],
+                "language": args.language,
+                "target_folder": target_folder,
+                "include_dir": [os.path.abspath(i) for i in args.include_dir],
+            },
+            args.repeat,
+        )
+
+    for variant, times in durations.items():
+        print(
+            f"{variant:10}median {statistics.median(times) * 1000:9.1f} ms"
+            f"   min {min(times) * 1000:9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
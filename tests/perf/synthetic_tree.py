@@ -0,0 +1,91 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Write synthetic vspec trees of a given size for the benchmarks.
+
+The tree has ``branches`` top level branches, each a chain of ``depth``
+nested branches. Every branch has ``members`` signals of various datatypes,
+the innermost branches have instances, alternating between a named range
+with choices, a choice and a named range.
+"""
+
+import os
+from typing import List
+
+_DATATYPES = ["boolean", "uint8", "int32", "float", "double", "string", "float[]"]
+_TYPES = ["sensor", "actuator", "attribute"]
+_INSTANCES = [
+    ["- Row[1,2]", '- ["DriverSide", "PassengerSide"]'],
+    ['["Low", "High"]'],
+    ["Sensor[1,4]"],
+]
+
+
+def _branch(path: str, index: int, with_instances: bool) -> List[str]:
+    lines = [f"{path}:", "  type: branch"]
+    if with_instances:
+        instances = _INSTANCES[index % len(_INSTANCES)]
+        if len(instances) == 1:
+            lines.append(f"  instances: {instances[0]}")
+        else:
+            lines.append("  instances:")
+            lines.extend(f"    {instance}" for instance in instances)
+    lines.append(f"  description: Synthetic branch {index}.")
+    return lines + [""]
+
+
+def _member(path: str, index: int) -> List[str]:
+    datatype = _DATATYPES[index % len(_DATATYPES)]
+    lines = [
+        f"{path}:",
+        f"  datatype: {datatype}",
+        f"  type: {_TYPES[index % len(_TYPES)]}",
+    ]
+    if index % 5 == 0:
+        lines.append("  unit: km/h")
+    lines.append(f"  description: Synthetic signal {index}.")
+    return lines + [""]
+
+
+def write_vspec(
+    folder: str, branches: int, members: int, depth: int = 3, instances: bool = True
+) -> str:
+    """Write a synthetic tree into the folder.
+
+    Args:
+        folder (str): The folder to write the vspec file to
+        branches (int): The number of top level branches
+        members (int): The number of signals of every branch
+        depth (int): The number of nested branches below each top level branch
+        instances (bool): Whether the innermost branches have instances
+
+    Returns:
+        str: the path of the vspec file
+    """
+    lines = ["Vehicle:", "  type: branch", "  description: Synthetic vehicle.", ""]
+    for b in range(branches):
+        path = "Vehicle"
+        for level in range(depth):
+            path += f".SyntheticBranch{b}Level{level}"
+            innermost = level == depth - 1
+            lines += _branch(path, b, instances and innermost)
+            for m in range(members):
+                # boolean signals are named Is... by convention
+                name = "IsSignal" if m % len(_DATATYPES) == 0 else "SignalValue"
+                lines += _member(f"{path}.{name}{m}", m)
+
+    file_path = os.path.join(folder, "VehicleSignalSpecification.vspec")
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines))
+    return file_path
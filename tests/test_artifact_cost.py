@@ -0,0 +1,71 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.perf.artifact_cost import find_compilers, measure_variant, record_results
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+# the measurements are only kept if a results file is given
+results_env = "ARTIFACT_COST_RESULTS"
+
+# generator options whose downstream cost is tracked
+variants = {
+    "default": {},
+}
+
+
+def results_file(tmp_path) -> str:
+    return os.environ.get(results_env) or str(tmp_path / "artifact-cost.json")
+
+
+@pytest.mark.parametrize("variant", variants.keys())
+def test_python_artifact_cost(variant: str, tmp_path):
+    pytest.importorskip("velocitas_sdk")
+
+    result = measure_variant(
+        test_data_base_path.joinpath("json", "vss_rel_4.0.json").__str__(),
+        [test_data_base_path.joinpath("units.yaml").__str__()],
+        "python",
+        variants[variant],
+    )
+    record_results(results_file(tmp_path), variant, "python", result)
+
+    assert result["import_s"] > 0
+    assert result["construct_s"] > 0
+    assert result["retained_bytes"] > 0
+
+
+@pytest.mark.parametrize("variant", variants.keys())
+def test_cpp_artifact_cost(variant: str, tmp_path):
+    # the SDK headers are provided e.g. by the vehicle-app-sdk conan package
+    sdk_include_dirs = os.environ.get("VELOCITAS_SDK_INCLUDE", "")
+    if not sdk_include_dirs or not find_compilers():
+        pytest.skip("C++ compiler or VELOCITAS_SDK_INCLUDE not available")
+
+    result = measure_variant(
+        test_data_base_path.joinpath("json", "vss_rel_4.0.json").__str__(),
+        [test_data_base_path.joinpath("units.yaml").__str__()],
+        "cpp",
+        variants[variant],
+        sdk_include_dirs=sdk_include_dirs.split(os.pathsep),
+    )
+    record_results(results_file(tmp_path), variant, "cpp", result)
+
+    for compiler in find_compilers():
+        assert result[compiler]["compile_s"] > 0
+        assert result[compiler]["peak_rss_bytes"] > 0
@@ -0,0 +1,121 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from velocitas.model_generator import generate_model, generate_model_async
+from velocitas.model_generator.progress import ProgressStream
+from velocitas.model_generator.sinks import MemorySink
+
+from .test_staging import wait_for_removals
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+input_file_path = test_data_base_path.joinpath("json", "vss_rel_4.0.json").__str__()
+input_unit_file_path_list = [test_data_base_path.joinpath("units.yaml").__str__()]
+
+
+def test_generate_model_async_reports_progress():
+    expected = generate_model(
+        input_file_path, input_unit_file_path_list, "python", sink=MemorySink()
+    )
+
+    async def generate():
+        progress = ProgressStream()
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        generation = asyncio.create_task(
+            generate_model_async(
+                input_file_path,
+                input_unit_file_path_list,
+                "python",
+                sink=MemorySink(),
+                progress=progress,
+            )
+        )
+        events = [event async for event in progress]
+        sink = await generation
+        ticker.cancel()
+        return sink, events, ticks
+
+    sink, events, ticks = asyncio.run(generate())
+
+    assert isinstance(sink, MemorySink) and isinstance(expected, MemorySink)
+    assert sink.files == expected.files
+    assert [e.stage for e in events[:2]] == ["load", "render"]
+    assert events[-1].stage == "done"
+    assert [e.path for e in events if e.stage == "write"] == list(expected.files)
+    # the event loop kept running during the generation
+    assert ticks > 1
+
+
+class BlockingStream(ProgressStream):
+    """Holds the generation at its first write until it was cancelled."""
+
+    def __init__(self):
+        super().__init__()
+        self.cancelled = threading.Event()
+
+    def emit(self, event):
+        super().emit(event)
+        if event.stage == "write":
+            self.cancelled.wait()
+
+
+@pytest.mark.parametrize("to_sink", [False, True])
+def test_cancelled_generation_leaves_no_output(tmp_path, to_sink):
+    target = tmp_path / "model"
+    target.mkdir()
+    (target / "old.txt").write_text("old")
+    sink = MemorySink() if to_sink else None
+
+    async def generate():
+        progress = BlockingStream()
+        generation = asyncio.create_task(
+            generate_model_async(
+                input_file_path,
+                input_unit_file_path_list,
+                "python",
+                str(target),
+                sink=sink,
+                progress=progress,
+            )
+        )
+        async for event in progress:
+            if event.stage == "write":
+                generation.cancel()
+                # let the generation handle the cancellation first
+                await asyncio.sleep(0)
+                progress.cancelled.set()
+                break
+        with pytest.raises(asyncio.CancelledError):
+            await generation
+
+    asyncio.run(generate())
+
+    wait_for_removals()
+    assert os.listdir(target) == ["old.txt"]
+    assert os.listdir(tmp_path) == ["model"]
+    if sink is not None:
+        assert sink.files == {}
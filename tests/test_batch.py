@@ -0,0 +1,131 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml  # type: ignore
+from velocitas.model_generator import batch
+from velocitas.model_generator.batch import load_manifest, run_batch
+from velocitas.model_generator.tree_generator.file_import import FileImport
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+
+
+def test_batch_shares_base_tree(tmp_path, monkeypatch):
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(
+        yaml.safe_dump(
+            {
+                "defaults": {
+                    "input": str(test_data_base_path / "json" / "vss_rel_4.0.json"),
+                    "units": [str(test_data_base_path / "units.yaml")],
+                },
+                "jobs": [
+                    {"language": "python", "target_folder": "python"},
+                    {"language": "cpp", "target_folder": "cpp"},
+                    {"language": "cpp", "target_folder": "other", "name": "other"},
+                ],
+            }
+        )
+    )
+
+    load_base_tree = FileImport.load_base_tree
+    loaded = []
+
+    def counting_load_base_tree(self):
+        loaded.append(self.file_path)
+        return load_base_tree(self)
+
+    monkeypatch.setattr(FileImport, "load_base_tree", counting_load_base_tree)
+    results = run_batch(load_manifest(str(manifest_path)), max_workers=1)
+
+    assert [r.error for r in results] == [None, None, None]
+    assert len(loaded) == 1
+    assert os.path.isfile(tmp_path / "python" / "vehicle" / "__init__.py")
+    assert os.path.isfile(tmp_path / "cpp" / "include" / "vehicle" / "Vehicle.hpp")
+    assert os.path.isfile(tmp_path / "other" / "include" / "other" / "Vehicle.hpp")
+
+
+def write_manifest(tmp_path, jobs) -> str:
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(
+        yaml.safe_dump(
+            {
+                "defaults": {
+                    "input": str(test_data_base_path / "json" / "vss_rel_4.0.json"),
+                    "units": [str(test_data_base_path / "units.yaml")],
+                },
+                "jobs": jobs,
+            }
+        )
+    )
+    return str(manifest_path)
+
+
+def test_batch_continues_after_a_failing_job(tmp_path, monkeypatch):
+    manifest_path = write_manifest(
+        tmp_path,
+        [
+            {"language": "python", "target_folder": "python"},
+            {"language": "cpp", "target_folder": "cpp"},
+        ],
+    )
+    render_model = batch._render_model
+
+    def failing_render_model(tree, language, *args, **kwargs):
+        if language == "python":
+            raise RuntimeError("broken template")
+        return render_model(tree, language, *args, **kwargs)
+
+    monkeypatch.setattr(batch, "_render_model", failing_render_model)
+    results = run_batch(load_manifest(manifest_path), max_workers=1)
+
+    assert results[0].error == "RuntimeError('broken template')"
+    assert results[1].error is None
+    assert not os.path.exists(tmp_path / "python")
+    assert os.path.isfile(tmp_path / "cpp" / "include" / "vehicle" / "Vehicle.hpp")
+
+
+@pytest.mark.parametrize(
+    "job, message",
+    [
+        (
+            {"language": "cpp", "target_folder": "cpp", "target": "x"},
+            "Unknown key 'target' in batch job 0-cpp",
+        ),
+        (
+            {"label": "no-target", "language": "cpp"},
+            "Batch job no-target is missing key 'target_folder'",
+        ),
+    ],
+)
+def test_invalid_jobs_are_named(tmp_path, job, message):
+    with pytest.raises(ValueError) as error:
+        load_manifest(write_manifest(tmp_path, [job]))
+    assert str(error.value) == message
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["", "- jobs\n", "defaults: {}\n", "jobs: 1\n", "jobs: [1]\n", "jobs: [\n"],
+)
+def test_invalid_manifests_are_named(tmp_path, content):
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(content)
+
+    with pytest.raises(ValueError) as error:
+        load_manifest(str(manifest_path))
+    assert str(manifest_path) in str(error.value)
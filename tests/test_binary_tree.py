@@ -0,0 +1,134 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+
+import pytest
+from anytree import PreOrderIter  # type: ignore
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.cli import main
+from velocitas.model_generator.manifest import MANIFEST_FILE
+from velocitas.model_generator.sinks import MemorySink
+from velocitas.model_generator.tree_generator.binary_tree import (
+    BinaryTree,
+    InvalidBinaryTree,
+    MappedVSSNode,
+)
+from velocitas.model_generator.tree_generator.file_import import FileImport
+
+from .test_prune import input_file_path, load_tree, spec_dir, unit_file_path
+from .test_watch import BODY_OVERLAY
+
+ATTRIBUTES = [
+    "name",
+    "type",
+    "description",
+    "comment",
+    "min",
+    "max",
+    "allowed",
+    "instances",
+    "unit",
+    "data_type_str",
+    "deprecation",
+    "default",
+    "extended_attributes",
+]
+
+
+def convert(tmp_path) -> str:
+    path = str(tmp_path / "vss.vssb")
+    main(["convert", input_file_path, path, "-I", str(spec_dir), "-u", unit_file_path])
+    return path
+
+
+def load_binary_tree(path: str, overlays=[]):
+    return FileImport(path, [], ["."], False, overlays).load_tree()
+
+
+def generate(input_path: str, language: str, overlays=[]):
+    sink = generate_model(
+        input_path,
+        [unit_file_path],
+        language,
+        strict=False,
+        include_dir=[str(spec_dir)],  # type: ignore
+        overlays=overlays,
+        sink=MemorySink(),
+    )
+    assert isinstance(sink, MemorySink)
+    del sink.files[MANIFEST_FILE]
+    return sink.files
+
+
+def test_binary_tree_loads_like_vspec(tmp_path):
+    path = convert(tmp_path)
+    tree = load_binary_tree(path)
+    assert isinstance(tree, MappedVSSNode)
+    assert "description" not in tree.__dict__
+
+    expected = list(PreOrderIter(load_tree()))
+    for nodes in [list(PreOrderIter(tree)), list(PreOrderIter(copy.deepcopy(tree)))]:
+        assert len(nodes) == len(expected)
+        for node, other in zip(nodes, expected):
+            assert node.qualified_name() == other.qualified_name()
+            for attribute in ATTRIBUTES:
+                assert getattr(node, attribute) == getattr(other, attribute)
+            assert getattr(node, "datatype", None) == getattr(other, "datatype", None)
+            assert node.has_unit() == other.has_unit()
+
+
+@pytest.mark.parametrize("language", ["python", "cpp"])
+def test_binary_tree_generates_same_model(tmp_path, language):
+    path = convert(tmp_path)
+    assert generate(path, language) == generate(input_file_path, language)
+
+
+def test_overlays_apply_to_binary_tree(tmp_path):
+    overlay = tmp_path / "overlay.vspec"
+    overlay.write_text(BODY_OVERLAY)
+    path = convert(tmp_path)
+
+    files = generate(path, "python", [str(overlay)])
+    assert files == generate(input_file_path, "python", [str(overlay)])
+    assert "Overlaid." in files["vehicle/Body/__init__.py"]
+
+
+def truncated(data: bytes) -> bytes:
+    return data[: len(data) // 2]
+
+
+def other_version(data: bytes) -> bytes:
+    return data[:8] + (2).to_bytes(4, "little") + data[12:]
+
+
+@pytest.mark.parametrize(
+    "corrupt", [lambda data: b"", lambda data: b"\0" * 128, truncated, other_version]
+)
+def test_invalid_binary_tree_is_rejected(tmp_path, corrupt):
+    path = tmp_path / "vss.vssb"
+    path.write_bytes(corrupt(open(convert(tmp_path), "rb").read()))
+    with pytest.raises(InvalidBinaryTree):
+        BinaryTree(str(path))
+
+
+def test_truncated_binary_tree_is_reported(tmp_path, capsys):
+    path = tmp_path / "vss.vssb"
+    path.write_bytes(truncated(open(convert(tmp_path), "rb").read()))
+    capsys.readouterr()
+    with pytest.raises(SystemExit) as exit_info:
+        generate(str(path), "python")
+
+    assert exit_info.value.code == 255
+    assert "The binary VSS tree is truncated" in capsys.readouterr().out
@@ -0,0 +1,82 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import filecmp
+import os
+from pathlib import Path
+
+import pytest
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.cache import ModelCache
+from velocitas.model_generator.tree_generator.file_import import FileImport
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+input_file_path = test_data_base_path.joinpath("json", "vss_rel_4.0.json").__str__()
+input_unit_file_path_list = [test_data_base_path.joinpath("units.yaml").__str__()]
+
+
+def assert_same_tree(left: str, right: str):
+    comparison = filecmp.dircmp(left, right)
+    assert not comparison.left_only and not comparison.right_only
+    _, mismatch, errors = filecmp.cmpfiles(
+        left, right, comparison.common_files, shallow=False
+    )
+    assert not mismatch and not errors
+    for sub_dir in comparison.common_dirs:
+        assert_same_tree(os.path.join(left, sub_dir), os.path.join(right, sub_dir))
+
+
+@pytest.mark.parametrize("hard_link", [False, True])
+def test_cache_hit_skips_generation(tmp_path, monkeypatch, hard_link: bool):
+    cache = ModelCache(str(tmp_path / "cache"), hard_link=hard_link)
+    generate_model(
+        input_file_path,
+        input_unit_file_path_list,
+        "python",
+        str(tmp_path / "first"),
+        cache=cache,
+    )
+
+    def fail_load_tree(self):
+        raise AssertionError("tree must not be loaded on a cache hit")
+
+    monkeypatch.setattr(FileImport, "load_tree", fail_load_tree)
+    generate_model(
+        input_file_path,
+        input_unit_file_path_list,
+        "python",
+        str(tmp_path / "second"),
+        cache=cache,
+    )
+
+    assert_same_tree(str(tmp_path / "first"), str(tmp_path / "second"))
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ModelCache(str(tmp_path / "cache"), max_size=1)
+    for language in ["python", "cpp"]:
+        generate_model(
+            input_file_path,
+            input_unit_file_path_list,
+            language,
+            str(tmp_path / language),
+            cache=cache,
+        )
+
+    # only the most recent entry is kept, even though it exceeds max_size
+    assert len(os.listdir(cache.entries_dir)) == 1
+    python_key = cache.key(
+        input_unit_file_path_list + [input_file_path], "python", "vehicle", True, []
+    )
+    assert not cache.restore(python_key, str(tmp_path / "restored"))
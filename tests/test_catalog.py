@@ -0,0 +1,85 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import sqlite3
+
+from anytree import PreOrderIter  # type: ignore
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.catalog import SCHEMA_VERSION, write_catalog
+from velocitas.model_generator.sinks import MemorySink
+
+from .test_prune import input_file_path, load_tree, spec_dir, unit_file_path
+
+
+def test_catalog_has_all_nodes(tmp_path):
+    tree = load_tree()
+    path = str(tmp_path / "catalog.db")
+    write_catalog(tree, path)
+
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT value FROM meta").fetchall() == [
+            (str(SCHEMA_VERSION),)
+        ]
+        rows = db.execute("SELECT path, type FROM nodes ORDER BY id").fetchall()
+        assert rows == [
+            (node.qualified_name(), node.type.value) for node in PreOrderIter(tree)
+        ]
+
+        actuators = "SELECT path FROM nodes WHERE type = 'actuator' AND path GLOB ?"
+        assert db.execute(actuators, ("Vehicle.Cabin.Light.*",)).fetchall() == [
+            ("Vehicle.Cabin.Light.Brightness",),
+            ("Vehicle.Cabin.Light.Mode",),
+        ]
+        plan = " ".join(
+            row[-1]
+            for row in db.execute("EXPLAIN QUERY PLAN " + actuators, ("Vehicle.*",))
+        )
+        assert "USING COVERING INDEX" in plan
+
+        assert db.execute(
+            "SELECT unit, min, max FROM nodes WHERE path = ?",
+            ("Vehicle.Cabin.Light.Brightness",),
+        ).fetchone() == ("percent", 0, 100)
+        assert db.execute(
+            "SELECT value FROM allowed_values JOIN nodes ON node_id = id"
+            " WHERE path = 'Vehicle.Cabin.Light.Mode' ORDER BY position"
+        ).fetchall() == [("OFF",), ("ON",), ("AUTO",)]
+
+        door_paths = db.execute(
+            "SELECT expanded_paths.path FROM expanded_paths JOIN nodes ON node_id = id"
+            " WHERE nodes.path = 'Vehicle.Cabin.Door.IsOpen' ORDER BY 1"
+        ).fetchall()
+        assert [p for (p,) in door_paths] == [
+            f"Vehicle.Cabin.Door.{row}.{side}.IsOpen"
+            for row in ["Row1", "Row2"]
+            for side in ["DriverSide", "PassengerSide"]
+        ]
+
+
+def test_generate_model_writes_catalog(tmp_path):
+    path = str(tmp_path / "catalogs" / "catalog.db")
+    generate_model(
+        input_file_path,
+        [unit_file_path],
+        "python",
+        strict=False,
+        include_dir=[str(spec_dir)],  # type: ignore
+        sink=MemorySink(),
+        catalog=path,
+    )
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT path FROM nodes WHERE id = 1").fetchone() == (
+            "Vehicle",
+        )
+    assert [p.name for p in (tmp_path / "catalogs").iterdir()] == ["catalog.db"]
@@ -0,0 +1,65 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from pathlib import Path
+
+import pytest
+from velocitas.model_generator.cli import main
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+input_file_path = test_data_base_path.joinpath("json", "vss_rel_4.0.json").__str__()
+units_file_path = test_data_base_path.joinpath("units.yaml").__str__()
+
+
+def gen_model(target_folder: Path, *options: str):
+    main(["-u", units_file_path, "-T", str(target_folder), *options, input_file_path])
+
+
+def test_check_detects_drift(tmp_path, capsys):
+    target_folder = tmp_path / "model"
+    gen_model(target_folder)
+    gen_model(target_folder, "--check")
+    assert "is up to date" in capsys.readouterr().out
+
+    (target_folder / "setup.py").write_text("changed")
+    (target_folder / "vehicle" / "__init__.py").unlink()
+    (target_folder / "stale.py").write_text("")
+    (target_folder / "vehicle" / "__pycache__").mkdir()
+    (target_folder / "vehicle" / "__pycache__" / "x.pyc").write_text("")
+    modified = {p: p.stat().st_mtime_ns for p in target_folder.rglob("*")}
+
+    with pytest.raises(SystemExit) as exit_info:
+        gen_model(target_folder, "--check")
+
+    assert exit_info.value.code == 1
+    output = capsys.readouterr().out
+    assert "added    vehicle/__init__.py" in output
+    assert "removed  stale.py" in output
+    assert "changed  setup.py" in output
+    assert "1 added, 1 removed and 1 changed files" in output
+    assert {p: p.stat().st_mtime_ns for p in target_folder.rglob("*")} == modified
+
+
+@pytest.mark.parametrize("mode", ["--check", "--dry-run"])
+@pytest.mark.parametrize(
+    "option", ["--cache-dir", "--depfile", "--descriptor", "--catalog"]
+)
+def test_read_only_modes_reject_options_writing_files(tmp_path, mode, option):
+    written = tmp_path / "written"
+    with pytest.raises(SystemExit) as exit_info:
+        gen_model(tmp_path / "model", mode, option, str(written))
+
+    assert exit_info.value.code == 2
+    assert not written.exists()
+    assert not (tmp_path / "model").exists()
@@ -0,0 +1,50 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import re
+from pathlib import Path
+
+from velocitas.model_generator import generate_model
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+
+
+def test_depfile_lists_included_vspec_files(tmp_path):
+    spec_dir = test_data_base_path.joinpath("vspec", "v4.0", "spec")
+    input_file_path = spec_dir.joinpath("VehicleSignalSpecification.vspec")
+    unit_file_path = test_data_base_path.joinpath("units.yaml")
+    depfile = tmp_path / "model.d"
+
+    generate_model(
+        str(input_file_path),
+        [str(unit_file_path)],
+        "python",
+        str(tmp_path / "model"),
+        include_dir=[str(spec_dir)],
+        depfile=str(depfile),
+        depfile_target="model.stamp",
+    )
+
+    rule, *phony_rules = depfile.read_text().split("\n\n")
+    target, dependencies = rule.split(":", 1)
+    dependencies = re.split(r"\s*\\\n\s*", dependencies.strip())[1:]
+    assert target == "model.stamp"
+    assert str(unit_file_path) in dependencies
+    assert str(input_file_path) in dependencies
+
+    included = re.findall(r"^#include\s+(\S+)", input_file_path.read_text(), re.M)
+    included_names = {os.path.basename(d) for d in dependencies}
+    assert included and set(map(os.path.basename, included)) <= included_names
+    assert len(phony_rules) == len(dependencies)
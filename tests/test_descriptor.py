@@ -0,0 +1,158 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import shutil
+import subprocess
+
+import pytest
+from anytree import PreOrderIter  # type: ignore
+from velocitas.model_generator import descriptor, generate_model
+from velocitas.model_generator.descriptor import ModelDescriptor, write_descriptor
+from velocitas.model_generator.sinks import MemorySink
+
+from .test_prune import input_file_path, load_tree, spec_dir, unit_file_path
+
+CPP_READER = r"""
+#include "ModelDescriptor.hpp"
+
+#include <iostream>
+
+using namespace velocitas::descriptor;
+
+int main(int argc, char** argv) {
+    ModelDescriptor descriptor(argv[1]);
+    for (uint32_t i = 0; i < descriptor.size(); ++i) {
+        Node node = descriptor.node(i);
+        auto parent = node.parent();
+        std::cout << node.path() << " " << static_cast<int>(node.kind()) << " "
+                  << node.datatype().value_or("-") << " " << node.unit().value_or("-")
+                  << " " << (parent ? static_cast<int>(parent->index()) : -1) << " "
+                  << node.min().value_or(-1) << " " << node.max().value_or(-1);
+        for (uint32_t a = 0; a < node.allowedCount(); ++a) {
+            std::cout << " " << node.allowed(a);
+        }
+        for (uint32_t l = 0; l < node.levelCount(); ++l) {
+            Level level = node.level(l);
+            std::cout << " " << level.name() << ":";
+            for (uint32_t e = 0; e < level.size(); ++e) {
+                std::cout << level.element(e) << ",";
+            }
+        }
+        std::cout << "\n";
+    }
+    std::cout << descriptor.find("Vehicle.Cabin.Light.Mode")->description() << "\n";
+    std::cout << descriptor.find("Vehicle.Cabin.Nope").has_value() << "\n";
+}
+"""
+
+
+def describe(node) -> str:
+    """Print a node like the C++ reader."""
+
+    def number(value):
+        return "-1" if value is None else f"{value:g}"
+
+    parent = node.parent
+    fields = [
+        node.path,
+        str(descriptor.KINDS.index(node.kind)),
+        node.datatype or "-",
+        node.unit or "-",
+        str(parent.index if parent else -1),
+        number(node.min),
+        number(node.max),
+    ]
+    fields += node.allowed
+    fields += [
+        f"{name}:" + "".join(e + "," for e in names) for name, names in node.instances
+    ]
+    return " ".join(fields)
+
+
+def test_descriptor_has_all_nodes(tmp_path):
+    tree = load_tree()
+    path = str(tmp_path / "model.vssd")
+    write_descriptor(tree, path)
+
+    nodes = {node.qualified_name(): node for node in PreOrderIter(tree)}
+    with ModelDescriptor(path) as model:
+        assert len(model) == len(nodes)
+        for mapped in model:
+            node = nodes.pop(mapped.path)
+            assert mapped.name == node.name
+            assert mapped.kind == node.type.value
+            assert mapped.description == node.description
+            for child in mapped.children:
+                assert child.parent.index == mapped.index
+
+        assert nodes == {}
+        brightness = model.find("Vehicle.Cabin.Light.Brightness")
+        assert (brightness.min, brightness.max, brightness.unit) == (0, 100, "percent")
+        assert model.find("Vehicle.Cabin.Light.Mode").allowed == ["OFF", "ON", "AUTO"]
+        assert model.find("Vehicle.Cabin.Door").instances == [
+            ("Row", ["Row1", "Row2"]),
+            ("element", ["DriverSide", "PassengerSide"]),
+        ]
+        assert model.find("Vehicle.Cabin.Nope") is None
+
+
+def test_invalid_descriptor_is_rejected(tmp_path):
+    path = tmp_path / "model.vssd"
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        ModelDescriptor(str(path))
+
+
+def test_cpp_reader_reads_like_python_reader(tmp_path):
+    compiler = shutil.which("c++") or shutil.which("g++")
+    if compiler is None:
+        pytest.skip("C++ compiler not available")
+    path = str(tmp_path / "model.vssd")
+    write_descriptor(load_tree(), path)
+
+    source = tmp_path / "reader.cpp"
+    source.write_text(CPP_READER)
+    include_dir = os.path.join(os.path.dirname(descriptor.__file__), "cpp")
+    binary = str(tmp_path / "reader")
+    subprocess.run(
+        [compiler, "-std=c++17", "-Wall", "-Werror", "-I", include_dir, str(source)]
+        + ["-o", binary],
+        check=True,
+    )
+    output = subprocess.run(
+        [binary, path], check=True, capture_output=True, text=True
+    ).stdout
+
+    with ModelDescriptor(path) as model:
+        expected = [describe(node) for node in model]
+        expected.append(model.find("Vehicle.Cabin.Light.Mode").description)
+    assert output.splitlines() == expected + ["0"]
+
+
+def test_generate_model_writes_descriptor(tmp_path):
+    path = str(tmp_path / "descriptors" / "model.vssd")
+    sink = generate_model(
+        input_file_path,
+        [unit_file_path],
+        "cpp",
+        strict=False,
+        include_dir=[str(spec_dir)],  # type: ignore
+        sink=MemorySink(),
+        descriptor=path,
+    )
+    assert isinstance(sink, MemorySink)
+    assert not any(p.endswith(".vssd") for p in sink.files)
+    with ModelDescriptor(path) as model:
+        assert model.root.name == "Vehicle"
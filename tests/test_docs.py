@@ -0,0 +1,61 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+from anytree import PreOrderIter  # type: ignore
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.docs import DOCS_FILE
+from velocitas.model_generator.manifest import MANIFEST_FILE
+from velocitas.model_generator.sinks import MemorySink
+
+from .test_prune import input_file_path, load_tree, spec_dir, unit_file_path
+
+
+def generate(language: str, docs: str):
+    sink = generate_model(
+        input_file_path,
+        [unit_file_path],
+        language,
+        strict=False,
+        include_dir=[str(spec_dir)],  # type: ignore
+        sink=MemorySink(),
+        docs=docs,
+    )
+    assert isinstance(sink, MemorySink)
+    return sink.files
+
+
+@pytest.mark.parametrize("language", ["python", "cpp"])
+def test_minimal_and_external_docs_drop_descriptions(language):
+    full = generate(language, "full")
+    minimal = generate(language, "minimal")
+    external = generate(language, "external")
+
+    index = json.loads(external.pop(DOCS_FILE))
+    for files in [full, minimal, external]:
+        del files[MANIFEST_FILE]
+    assert minimal == external
+    assert minimal.keys() == full.keys()
+    assert sum(map(len, minimal.values())) < sum(map(len, full.values()))
+
+    tree = load_tree()
+    assert list(index) == [node.qualified_name() for node in PreOrderIter(tree)]
+    speed = index["Vehicle.Speed"]
+    assert speed["type"] == "sensor" and speed["unit"] == "km/h"
+    code = "".join(minimal.values())
+    assert speed["description"] in "".join(full.values())
+    assert speed["description"] not in code
+    assert "Speed: sensor" in code
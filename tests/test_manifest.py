@@ -0,0 +1,86 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.depfile import list_files
+from velocitas.model_generator.manifest import MANIFEST_FILE
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+spec_dir = test_data_base_path.joinpath("vspec", "v4.0", "spec")
+input_file_path = str(spec_dir.joinpath("VehicleSignalSpecification.vspec"))
+units_file_path = str(test_data_base_path.joinpath("units.yaml"))
+
+
+def sha256(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def test_manifest_lists_hashes_of_all_files(tmp_path):
+    target_folder = str(tmp_path / "model")
+    generate_model(
+        input_file_path,
+        [units_file_path],
+        "cpp",
+        target_folder,
+        strict=False,
+        include_dir=[str(spec_dir)],  # type: ignore
+    )
+
+    with open(os.path.join(target_folder, MANIFEST_FILE)) as file:
+        manifest = json.load(file)
+    files = {
+        os.path.relpath(path, target_folder).replace(os.sep, "/"): sha256(path)
+        for path in list_files(target_folder)
+    }
+    del files[MANIFEST_FILE]
+    assert manifest["files"] == files
+
+    tree = hashlib.sha256()
+    for path in sorted(files):
+        tree.update(f"{path}\0{files[path]}\n".encode())
+    assert manifest["tree"] == tree.hexdigest()
+    assert sha256(units_file_path) in manifest["inputs"]
+    assert manifest["options"]["language"] == "cpp"
+
+
+def test_output_does_not_depend_on_hash_seed(tmp_path):
+    manifests = []
+    for seed in ["1", "2"]:
+        target_folder = tmp_path / seed
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-m",
+                "velocitas.model_generator.cli",
+                "-q",
+                "-u",
+                units_file_path,
+                "-I",
+                str(spec_dir),
+                "-T",
+                str(target_folder),
+                input_file_path,
+            ],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        )
+        manifests.append((target_folder / MANIFEST_FILE).read_text())
+    assert manifests[0] == manifests[1]
@@ -0,0 +1,157 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import gc
+import sys
+import tracemalloc
+
+import pytest
+from anytree import PreOrderIter  # type: ignore
+from velocitas.model_generator import _render_model, generate_model
+from velocitas.model_generator.cpp.cpp_generator import VehicleModelCppGenerator
+from velocitas.model_generator.memory import gc_paused
+from velocitas.model_generator.python.python_generator import (
+    VehicleModelPythonGenerator,
+)
+from velocitas.model_generator.sinks import MemorySink, OutputSink
+from vspec.model.constants import VSSTreeType  # type: ignore
+from vspec.model.vsstree import VSSNode  # type: ignore
+
+from .test_prune import input_file_path, load_tree, spec_dir, unit_file_path
+
+GENERATORS = [VehicleModelPythonGenerator, VehicleModelCppGenerator]
+
+
+class DiscardingSink(OutputSink):
+    """Drops the files, so only the memory of the generator is measured."""
+
+    def write(self, path: str, content: str):
+        pass
+
+
+def create_node(name: str, parent=None, **source) -> VSSNode:
+    source.setdefault("type", "branch")
+    source.update(description=f"The {name}.", **{"$file_name$": ""})
+    return VSSNode(
+        name, source, VSSTreeType.SIGNAL_TREE.available_types(), parent=parent
+    )
+
+
+def balanced_tree(depth: int, fan_out: int = 4, signals: int = 5) -> VSSNode:
+    """A tree whose files do not grow with its depth, unlike its size."""
+    root = create_node("Vehicle")
+    level = [root]
+    for _ in range(depth):
+        next_level = []
+        for parent in level:
+            for index in range(signals):
+                create_node(f"Signal{index}", parent, type="sensor", datatype="float")
+            for index in range(fan_out):
+                next_level.append(create_node(f"Branch{index}", parent))
+        level = next_level
+    return root
+
+
+def render_peak(generator_class, tree, release_payloads: bool) -> int:
+    """The peak memory allocated while rendering the tree."""
+    generator = generator_class(
+        tree, ".", "vehicle", DiscardingSink(), release_payloads=release_payloads
+    )
+    tracemalloc.start()
+    try:
+        generator.generate()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("generator_class", GENERATORS)
+def test_rendering_memory_does_not_grow_with_the_tree(generator_class):
+    # fills the caches of the templates, which are not part of the ceiling
+    render_peak(generator_class, balanced_tree(1), True)
+    small_peak = render_peak(generator_class, balanced_tree(3), True)
+    large_tree = balanced_tree(5)
+    large_peak = render_peak(generator_class, large_tree, True)
+
+    # sixteen times the branches, the ceiling is the largest file
+    assert large_peak < 1.5 * small_peak
+    # the names of all branches are kept otherwise
+    assert render_peak(generator_class, large_tree, False) > 1.5 * large_peak
+
+
+@pytest.mark.parametrize("generator_class", GENERATORS)
+def test_released_payloads_render_the_same_model(generator_class):
+    expected = MemorySink()
+    generator_class(load_tree(), ".", "vehicle", expected).generate()
+
+    tree = load_tree()
+    sink = MemorySink()
+    generator_class(tree, ".", "vehicle", sink, release_payloads=True).generate()
+
+    assert sink.files == expected.files
+    assert all(node.description is None for node in PreOrderIter(tree))
+
+
+def test_low_memory_generates_the_same_model():
+    def generate(**kwargs) -> MemorySink:
+        return generate_model(  # type: ignore
+            input_file_path,
+            [unit_file_path],
+            "python",
+            strict=False,
+            include_dir=[str(spec_dir)],  # type: ignore
+            sink=MemorySink(),
+            **kwargs,
+        )
+
+    assert generate(low_memory=True).files == generate().files
+
+
+def test_external_docs_keep_payloads():
+    tree = load_tree()
+    sink = MemorySink()
+    VehicleModelPythonGenerator(
+        tree, ".", "vehicle", sink, docs="external", release_payloads=True
+    ).generate()
+
+    assert tree.description
+
+
+@pytest.mark.parametrize("language", ["python", "cpp"])
+def test_deep_tree_does_not_hit_recursion_limit(language):
+    tree = load_tree()
+    branch = tree
+    for level in range(sys.getrecursionlimit() + 100):
+        branch = create_node(f"Level{level}", branch)
+
+    sink = MemorySink()
+    assert _render_model(tree, language, ".", "vehicle", sink)
+    assert len(sink.files) > sys.getrecursionlimit()
+
+
+def test_gc_paused_restores_the_collector():
+    assert gc.isenabled()
+    with gc_paused():
+        with gc_paused():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        with gc_paused():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
@@ -0,0 +1,76 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from anytree import PreOrderIter  # type: ignore
+from velocitas.model_generator.naming import (
+    DEFAULT_RANGE_NAME,
+    ModelNames,
+    cpp_namespace_name,
+    parse_instances,
+)
+from vspec.model.constants import VSSType  # type: ignore
+
+from .test_prune import load_tree
+
+
+def test_cpp_namespace_name_escapes_keywords():
+    assert cpp_namespace_name("VehicleIdentification") == "vehicle_identification"
+    assert cpp_namespace_name("OBD") == "obd"
+    assert cpp_namespace_name("Private") == "private_"
+
+
+def test_parse_instances():
+    row, side = parse_instances(["Row[1,2]", ["DriverSide", "PassengerSide"]])
+    assert (row.name, row.elements, row.bounds) == ("Row", ("Row1", "Row2"), (1, 2))
+    assert (side.name, side.elements, side.is_range) == (
+        DEFAULT_RANGE_NAME,
+        ("DriverSide", "PassengerSide"),
+        False,
+    )
+
+    (choice,) = parse_instances(["Low", "High"])
+    assert choice.elements == ("Low", "High") and not choice.is_range
+    (sensor,) = parse_instances("Sensor[1,3]")
+    assert sensor.elements == ("Sensor1", "Sensor2", "Sensor3")
+
+    with pytest.raises(ValueError):
+        parse_instances(["Row[1,2]", "Row"])
+
+
+def test_model_names_of_all_branches():
+    tree = load_tree()
+    names = ModelNames(tree, ["my", "vehicle"])
+
+    branches = [n for n in PreOrderIter(tree) if n.type == VSSType.BRANCH]
+    for branch in branches:
+        branch_names = names[branch]
+        assert branch_names.path == branch.qualified_name()
+        path = branch.qualified_name().split(".")
+        assert branch_names.package == ["my", "vehicle"] + path[1:]
+        assert branch_names.folders == [
+            cpp_namespace_name(n) for n in branch_names.package
+        ]
+        assert branch_names.instances == (
+            parse_instances(branch.instances) if branch.instances else ()
+        )
+
+    (door_branch,) = [b for b in branches if b.name == "Door"]
+    door = names[door_branch]
+    assert door.path == "Vehicle.Cabin.Door"
+    assert door.namespace == "my::vehicle::cabin::door"
+    assert door.guard == "MY_VEHICLE_CABIN_DOOR_DOOR_H"
+    assert door.header == "include/my/vehicle/cabin/door/Door.hpp"
+    assert door.module == "my.vehicle.Cabin.Door"
+    assert door.init_file == "my/vehicle/Cabin/Door/__init__.py"
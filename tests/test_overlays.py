@@ -0,0 +1,81 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from concurrent import futures
+from pathlib import Path
+
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.sinks import MemorySink
+from velocitas.model_generator.tree_generator import file_formats
+
+from .test_watch import BODY_OVERLAY, CABIN_OVERLAY, SPEC
+
+units_file_path = str(Path(__file__).parent.joinpath("data", "units.yaml"))
+
+# applied after BODY_OVERLAY, its comment has to win
+LATER_BODY_OVERLAY = """
+Vehicle.Body.BodyType:
+  datatype: string
+  type: attribute
+  description: Body type code as defined by ISO 3779.
+  comment: Overlaid later.
+"""
+
+
+def generate(tmp_path, language: str):
+    spec_file = tmp_path / "spec.vspec"
+    spec_file.write_text(SPEC)
+    overlays = []
+    for i, overlay in enumerate([BODY_OVERLAY, CABIN_OVERLAY, LATER_BODY_OVERLAY]):
+        overlay_file = tmp_path / f"overlay{i}.vspec"
+        overlay_file.write_text(overlay)
+        overlays.append(str(overlay_file))
+
+    sink = generate_model(
+        str(spec_file),
+        [units_file_path],
+        language,
+        overlays=overlays,
+        sink=MemorySink(),
+    )
+    assert isinstance(sink, MemorySink)
+    return sink.files
+
+
+def test_parallel_overlays_match_sequential(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_formats.os, "cpu_count", lambda: 4)
+    parallel = generate(tmp_path, "python")
+
+    monkeypatch.setattr(file_formats, "_MIN_PARALLEL_OVERLAYS", 100)
+    sequential = generate(tmp_path, "python")
+
+    assert parallel == sequential
+    body = parallel["vehicle/Body/__init__.py"]
+    assert "Overlaid later." in body and "Overlaid." not in body
+    assert "IsLocked" in parallel["vehicle/Cabin/__init__.py"]
+
+
+def test_overlay_workers_are_not_forked(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_formats.os, "cpu_count", lambda: 4)
+    start_methods = []
+    process_pool_executor = futures.ProcessPoolExecutor
+
+    def recording_executor(*args, **kwargs):
+        start_methods.append(kwargs["mp_context"].get_start_method())
+        return process_pool_executor(*args, **kwargs)
+
+    monkeypatch.setattr(futures, "ProcessPoolExecutor", recording_executor)
+    generate(tmp_path, "python")
+
+    assert start_methods and "fork" not in start_methods
@@ -0,0 +1,80 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+from pathlib import Path
+
+from velocitas.model_generator.cli import main
+from velocitas.model_generator.depfile import list_files
+from velocitas.model_generator.log import logger
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+input_file_path = test_data_base_path.joinpath("json", "vss_rel_4.0.json").__str__()
+units_file_path = test_data_base_path.joinpath("units.yaml").__str__()
+spec_path = test_data_base_path.joinpath("vspec", "v4.0", "spec")
+
+
+def test_quiet_generation_writes_events(tmp_path, capsys):
+    events_path = tmp_path / "events.jsonl"
+    target_folder = tmp_path / "model"
+    main(
+        [
+            "-u",
+            units_file_path,
+            "-T",
+            str(target_folder),
+            "--quiet",
+            "--events",
+            str(events_path),
+            input_file_path,
+        ]
+    )
+
+    assert capsys.readouterr().out == ""
+    events = [json.loads(line) for line in events_path.read_text().splitlines()]
+    assert [e["event"] for e in events[:2]] == ["load", "render"]
+    writes = [e for e in events if e["event"] == "write"]
+    assert len(writes) == len(list_files(str(target_folder)))
+
+    done = events[-1]
+    assert done["event"] == "done"
+    assert done["nodes"] == events[1]["nodes"] > 0
+    assert done["files"] == len(writes)
+    assert done["bytes"] == sum(e["bytes"] for e in writes)
+
+
+def test_collections_are_printed_in_verbose_mode(tmp_path, capsys):
+    main(
+        [
+            "-u",
+            units_file_path,
+            "-I",
+            str(spec_path),
+            "-T",
+            str(tmp_path),
+            "-v",
+            str(spec_path.joinpath("VehicleSignalSpecification.vspec")),
+        ]
+    )
+
+    output = capsys.readouterr().out
+    assert "Loading vspec..." in output
+    assert "- DoorCollection" in output
+
+
+def test_importing_prints_nothing():
+    # the application embedding the generator decides where records go
+    assert logger.propagate
+    assert all(isinstance(h, logging.NullHandler) for h in logger.handlers)
@@ -0,0 +1,112 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+from pathlib import Path
+
+from anytree import PreOrderIter  # type: ignore
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.prune import SignalFilter, read_signals_file
+from velocitas.model_generator.tree_generator.file_import import FileImport
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+spec_dir = test_data_base_path.joinpath("vspec", "v4.0", "spec")
+input_file_path = str(spec_dir.joinpath("VehicleSignalSpecification.vspec"))
+unit_file_path = str(test_data_base_path.joinpath("units.yaml"))
+
+
+def load_tree():
+    return FileImport(
+        input_file_path, [unit_file_path], [".", str(spec_dir)], False, []
+    ).load_tree()
+
+
+def qualified_names(tree):
+    return {node.qualified_name() for node in PreOrderIter(tree)}
+
+
+def test_prune_keeps_selected_paths_and_ancestors():
+    tree = SignalFilter(
+        include=["Vehicle.Speed", "Vehicle.Cabin.Door.Row1.DriverSide.IsOpen"]
+    ).prune(load_tree())
+
+    assert qualified_names(tree) == {
+        "Vehicle",
+        "Vehicle.Speed",
+        "Vehicle.Cabin",
+        "Vehicle.Cabin.Door",
+        "Vehicle.Cabin.Door.IsOpen",
+    }
+    # all instances are kept, as the collection contains all of them
+    door = next(n for n in PreOrderIter(tree) if n.name == "Door")
+    assert door.instances
+
+
+def test_prune_excludes_subtrees():
+    tree = SignalFilter(
+        include=["Vehicle.Cabin.*"], exclude=["Vehicle.Cabin.Door*"]
+    ).prune(load_tree())
+
+    names = qualified_names(tree)
+    assert "Vehicle.Cabin.Seat" in names
+    assert not any(name.startswith("Vehicle.Cabin.Door") for name in names)
+    assert "Vehicle.Speed" not in names
+
+
+def test_read_signals_file_from_app_manifest(tmp_path):
+    manifest = tmp_path / "AppManifest.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "manifestVersion": "v3",
+                "name": "SampleApp",
+                "interfaces": [
+                    {"type": "pubsub", "config": {}},
+                    {
+                        "type": "vehicle-signal-interface",
+                        "config": {
+                            "datapoints": {
+                                "required": [
+                                    {"path": "Vehicle.Speed", "access": "read"}
+                                ]
+                            }
+                        },
+                    },
+                ],
+            }
+        )
+    )
+    assert read_signals_file(str(manifest)) == ["Vehicle.Speed"]
+
+
+def test_generate_pruned_model(tmp_path):
+    signals_file = tmp_path / "signals.txt"
+    signals_file.write_text("# used by the app\nVehicle.Speed\n")
+
+    generate_model(
+        input_file_path,
+        [unit_file_path],
+        "python",
+        str(tmp_path / "model"),
+        include_dir=[str(spec_dir)],
+        signal_filter=SignalFilter(signals_files=[str(signals_file)]),
+    )
+
+    package_dir = tmp_path / "model" / "vehicle"
+    assert os.listdir(package_dir) == ["__init__.py"]
+    assert (
+        'self.Speed = DataPointFloat("Speed", self)'
+        in (package_dir / "__init__.py").read_text()
+    )
@@ -0,0 +1,97 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+from velocitas.model_generator.server import create_server, send_request
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    path = str(tmp_path / "server.sock")
+    server = create_server(path)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield path
+    send_request({"command": "shutdown"}, path)
+    thread.join()
+    server.server_close()
+
+
+def test_server_reuses_loaded_tree(socket_path, tmp_path):
+    args = {
+        "input_file_path": str(test_data_base_path / "json" / "vss_rel_4.0.json"),
+        "input_unit_file_path_list": [str(test_data_base_path / "units.yaml")],
+        "language": "cpp",
+    }
+
+    first = send_request(
+        {"command": "generate", "args": {**args, "target_folder": str(tmp_path / "a")}},
+        socket_path,
+    )
+    second = send_request(
+        {"command": "generate", "args": {**args, "target_folder": str(tmp_path / "b")}},
+        socket_path,
+    )
+
+    assert first["exit_code"] == 0 and second["exit_code"] == 0
+    assert "Reusing loaded tree." not in first["output"]
+    assert "Reusing loaded tree." in second["output"]
+    for folder in ["a", "b"]:
+        assert os.path.isfile(tmp_path / folder / "include" / "vehicle" / "Vehicle.hpp")
+
+
+def test_server_reports_errors(socket_path, tmp_path):
+    response = send_request(
+        {
+            "command": "generate",
+            "args": {
+                "input_file_path": str(tmp_path / "model.txt"),
+                "language": "python",
+            },
+        },
+        socket_path,
+    )
+
+    assert response["exit_code"] == 255
+    assert "The txt file format is not supported" in response["output"]
+
+
+def test_only_the_owner_can_connect(socket_path):
+    assert os.stat(socket_path).st_mode & 0o777 == 0o600
+    assert send_request({"command": "ping"}, socket_path)["exit_code"] == 0
+
+
+@pytest.mark.parametrize(
+    "request_line",
+    [b"\n", b'{"command": "generate"', b"[]\n", b'{"command": "generate"}\n'],
+)
+def test_server_rejects_invalid_requests(socket_path, request_line):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(request_line)
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as response_file:
+            response = json.loads(response_file.readline())
+
+    assert response["exit_code"] == 2
+    assert response["output"].startswith("Invalid request: ")
+    assert send_request({"command": "ping"}, socket_path)["exit_code"] == 0
@@ -0,0 +1,114 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import os
+import tarfile
+import time
+import zipfile
+from pathlib import Path
+
+import pytest
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.cache import ModelCache
+from velocitas.model_generator.depfile import list_files
+from velocitas.model_generator.sinks import ArchiveSink, MemorySink
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+input_file_path = test_data_base_path.joinpath("json", "vss_rel_4.0.json").__str__()
+input_unit_file_path_list = [test_data_base_path.joinpath("units.yaml").__str__()]
+
+
+def read_folder(folder: str):
+    files = {}
+    for path in list_files(folder):
+        relative_path = os.path.relpath(path, folder).replace(os.sep, "/")
+        files[relative_path] = Path(path).read_text(encoding="utf-8")
+    return files
+
+
+@pytest.mark.parametrize("language", ["python", "cpp"])
+def test_memory_sink_matches_target_folder(tmp_path, language):
+    generate_model(
+        input_file_path, input_unit_file_path_list, language, str(tmp_path / "fs")
+    )
+    sink = generate_model(
+        input_file_path,
+        input_unit_file_path_list,
+        language,
+        str(tmp_path / "memory"),
+        sink=MemorySink(),
+    )
+
+    assert isinstance(sink, MemorySink)
+    assert sink.files == read_folder(str(tmp_path / "fs"))
+    assert not os.path.exists(tmp_path / "memory")
+
+
+@pytest.mark.parametrize("archive_format", ["tar", "tar.gz", "zip"])
+def test_archive_sink(archive_format):
+    stream = io.BytesIO()
+    with ArchiveSink(stream, archive_format, prefix="model") as sink:
+        sink.write("vehicle/__init__.py", "content")
+
+    stream.seek(0)
+    if archive_format == "zip":
+        with zipfile.ZipFile(stream) as archive:
+            assert archive.read("model/vehicle/__init__.py") == b"content"
+    else:
+        with tarfile.open(fileobj=stream) as archive:
+            member = archive.extractfile("model/vehicle/__init__.py")
+            assert member is not None and member.read() == b"content"
+
+
+def test_cache_restores_into_sink(tmp_path):
+    cache = ModelCache(str(tmp_path / "cache"))
+    first = generate_model(
+        input_file_path,
+        input_unit_file_path_list,
+        "python",
+        cache=cache,
+        sink=MemorySink(),
+    )
+    second = generate_model(
+        input_file_path,
+        input_unit_file_path_list,
+        "python",
+        cache=cache,
+        sink=MemorySink(),
+    )
+
+    assert isinstance(first, MemorySink) and isinstance(second, MemorySink)
+    assert first.files == second.files
+
+
+@pytest.mark.parametrize("archive_format", ["tar", "tar.gz", "zip"])
+def test_archives_are_reproducible(archive_format, monkeypatch):
+    def archive(now: float) -> bytes:
+        monkeypatch.setattr(time, "time", lambda: now)
+        stream = io.BytesIO()
+        with ArchiveSink(stream, archive_format) as sink:
+            sink.write("vehicle/__init__.py", "content")
+        return stream.getvalue()
+
+    assert archive(1e9) == archive(2e9)
+
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    stream = io.BytesIO(archive(1e9))
+    if archive_format == "zip":
+        with zipfile.ZipFile(stream) as zip_archive:
+            assert zip_archive.infolist()[0].date_time == (2023, 11, 14, 22, 13, 20)
+    else:
+        with tarfile.open(fileobj=stream) as tar_archive:
+            assert tar_archive.getmembers()[0].mtime == 1700000000
@@ -0,0 +1,135 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+import pytest
+from velocitas.model_generator import staging
+from velocitas.model_generator.staging import staged_file, staged_folder
+
+
+def wait_for_removals():
+    for thread in staging._removals:
+        thread.join()
+
+
+def test_staged_folder_replaces_target(tmp_path):
+    target = tmp_path / "model"
+    target.mkdir()
+    (target / "old.txt").write_text("old")
+
+    with staged_folder(str(target)) as folder:
+        assert not os.path.samefile(folder, target)
+        with open(os.path.join(folder, "new.txt"), "w") as file:
+            file.write("new")
+
+    wait_for_removals()
+    assert os.listdir(target) == ["new.txt"]
+    assert os.listdir(tmp_path) == ["model"]
+
+
+def test_staged_folder_keeps_target_on_error(tmp_path):
+    target = tmp_path / "model"
+    target.mkdir()
+    (target / "old.txt").write_text("old")
+
+    with pytest.raises(RuntimeError):
+        with staged_folder(str(target)) as folder:
+            with open(os.path.join(folder, "new.txt"), "w") as file:
+                file.write("half written")
+            raise RuntimeError("generation failed")
+
+    wait_for_removals()
+    assert os.listdir(target) == ["old.txt"]
+    assert os.listdir(tmp_path) == ["model"]
+
+
+def test_staged_folder_removes_stale_folders(tmp_path):
+    stale = tmp_path / ".model.old-1234"
+    stale.mkdir()
+
+    with staged_folder(str(tmp_path / "model")):
+        pass
+
+    wait_for_removals()
+    assert os.listdir(tmp_path) == ["model"]
+
+
+def age(path, seconds: float = 3600):
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+def test_staging_removes_stale_staging_paths(tmp_path):
+    for stale in [".model.staging-1234", ".model.staging-5678"]:
+        (tmp_path / stale).mkdir()
+        (tmp_path / stale / "file.txt").write_text("stale")
+        age(tmp_path / stale)
+    (tmp_path / ".model.staging-5678").touch()
+    (tmp_path / ".model.db.staging-1234").touch()
+    age(tmp_path / ".model.db.staging-1234")
+
+    with staged_folder(str(tmp_path / "model")):
+        pass
+    with staged_file(str(tmp_path / "model.db")):
+        pass
+
+    wait_for_removals()
+    # a staging folder this young may still be unlocked
+    assert sorted(os.listdir(tmp_path)) == [".model.staging-5678", "model", "model.db"]
+
+
+def test_staging_keeps_staging_folders_in_use(tmp_path):
+    target = str(tmp_path / "model")
+    with staged_folder(target) as live:
+        with open(os.path.join(live, "live.txt"), "w") as file:
+            file.write("live")
+        age(live)
+        with staged_folder(target):
+            pass
+        wait_for_removals()
+        assert os.listdir(live) == ["live.txt"]
+
+    wait_for_removals()
+    assert os.listdir(tmp_path) == ["model"]
+    assert os.listdir(target) == ["live.txt"]
+
+
+def test_staged_folder_in_a_folder_named_like_staging(tmp_path):
+    parent = tmp_path / "a.staging-b"
+    target = parent / "model"
+    target.mkdir(parents=True)
+
+    with staged_folder(str(target)):
+        pass
+
+    wait_for_removals()
+    assert os.listdir(tmp_path) == ["a.staging-b"]
+    assert os.listdir(parent) == ["model"]
+
+
+def test_staging_uses_the_umask_without_changing_it(tmp_path, monkeypatch):
+    umask = os.umask(0o027)
+    try:
+        monkeypatch.setattr(os, "umask", None)
+        with staged_folder(str(tmp_path / "model")):
+            pass
+        with staged_file(str(tmp_path / "model.db")):
+            pass
+    finally:
+        monkeypatch.undo()
+        os.umask(umask)
+
+    assert os.stat(tmp_path / "model").st_mode & 0o777 == 0o750
+    assert os.stat(tmp_path / "model.db").st_mode & 0o777 == 0o640
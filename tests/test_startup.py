@@ -0,0 +1,92 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import subprocess
+import sys
+from typing import List, Set
+
+import pytest
+
+from .test_prune import input_file_path, spec_dir, unit_file_path
+
+# modules only the selected input format or backend needs
+HEAVY_MODULES = {
+    "vspec",
+    "anytree",
+    "yaml",
+    "asyncio",
+    "sqlite3",
+    "velocitas.model_generator.tree_generator.file_import",
+    "velocitas.model_generator.python.python_generator",
+    "velocitas.model_generator.cpp.cpp_generator",
+}
+
+
+def imported_modules(code: str, args: List[str] = []) -> Set[str]:
+    """Run code with -X importtime and return the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code] + args,
+        capture_output=True,
+        text=True,
+    )
+    return {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and not line.endswith("| imported package")
+    }
+
+
+def test_importing_cli_does_not_import_backends():
+    modules = imported_modules("import velocitas.model_generator.cli")
+    assert "velocitas.model_generator.cli" in modules
+    assert modules & HEAVY_MODULES == set()
+
+
+def test_help_does_not_import_backends():
+    modules = imported_modules(
+        "import sys; from velocitas.model_generator.cli import main; main(sys.argv[1:])",
+        ["--help"],
+    )
+    assert modules & HEAVY_MODULES == set()
+
+
+@pytest.mark.parametrize(
+    "language, other_backend",
+    [
+        ("python", "velocitas.model_generator.cpp.cpp_generator"),
+        ("cpp", "velocitas.model_generator.python.python_generator"),
+    ],
+)
+def test_generation_imports_only_selected_backend(tmp_path, language, other_backend):
+    modules = imported_modules(
+        "import sys; from velocitas.model_generator.cli import main; main(sys.argv[1:])",
+        [
+            input_file_path,
+            "-l",
+            language,
+            "-I",
+            str(spec_dir),
+            "-T",
+            str(tmp_path / "model"),
+            "-u",
+            unit_file_path,
+        ],
+    )
+    assert "vspec" in modules
+    assert other_backend not in modules
+    assert "sqlite3" not in modules
+    # only needed for binary trees and parallel overlays
+    assert "velocitas.model_generator.tree_generator.binary_tree" not in modules
+    assert "multiprocessing" not in modules
+    assert (tmp_path / "model").is_dir()
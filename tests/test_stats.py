@@ -0,0 +1,76 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from anytree import PreOrderIter  # type: ignore
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.cli import main
+from velocitas.model_generator.manifest import MANIFEST_FILE
+from velocitas.model_generator.sinks import MemorySink
+from velocitas.model_generator.stats import analyze_tree
+
+from .test_memory import balanced_tree
+from .test_prune import input_file_path, load_tree, spec_dir, unit_file_path
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"docs": "minimal"}, {"docs": "external"}, {"stubs": True}],
+)
+def test_statistics_match_generated_models(options):
+    tree = load_tree()
+    stats = analyze_tree(tree, **options)
+
+    assert stats.branches + sum(stats.leaves.values()) == len(list(PreOrderIter(tree)))
+    assert stats.collections > 0 and stats.instances >= stats.collections
+    assert stats.max_depth > 0 and stats.max_fan_out > 0
+    for language in ["python", "cpp"]:
+        sink = generate_model(
+            input_file_path,
+            [unit_file_path],
+            language,
+            strict=False,
+            include_dir=[str(spec_dir)],  # type: ignore
+            sink=MemorySink(),
+            **options,
+        )
+        assert isinstance(sink, MemorySink)
+        del sink.files[MANIFEST_FILE]
+        assert stats.files[language] == len(sink.files)
+        assert stats.bytes[language] == sum(
+            len(content.encode("utf-8")) for content in sink.files.values()
+        )
+
+
+@pytest.mark.parametrize("options", [{}, {"docs": "external"}, {"stubs": True}])
+def test_large_models_are_estimated_from_a_sample(options):
+    tree = balanced_tree(3)
+    exact = analyze_tree(tree, sample_size=None, **options)
+    estimated = analyze_tree(tree, sample_size=10, **options)
+
+    assert not exact.estimated and estimated.estimated
+    assert estimated.files == exact.files
+    for language in ["python", "cpp"]:
+        assert abs(estimated.bytes[language] / exact.bytes[language] - 1) < 0.05
+
+
+def test_dry_run_renders_the_selected_language(capsys):
+    main(
+        ["-u", unit_file_path, "-I", str(spec_dir), "-l", "cpp"]
+        + ["--dry-run", input_file_path]
+    )
+
+    output = capsys.readouterr().out
+    assert "cpp bytes" in output
+    assert "python" not in output
@@ -0,0 +1,67 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import ast
+
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.manifest import MANIFEST_FILE
+from velocitas.model_generator.sinks import MemorySink
+
+from .test_prune import input_file_path, spec_dir, unit_file_path
+
+
+def generate(stubs: bool):
+    sink = generate_model(
+        input_file_path,
+        [unit_file_path],
+        "python",
+        strict=False,
+        include_dir=[str(spec_dir)],  # type: ignore
+        sink=MemorySink(),
+        stubs=stubs,
+    )
+    assert isinstance(sink, MemorySink)
+    del sink.files[MANIFEST_FILE]
+    return sink.files
+
+
+def test_stubs_carry_types_and_documentation():
+    plain = generate(stubs=False)
+    files = generate(stubs=True)
+
+    modules = [p for p in plain if p.endswith("__init__.py")]
+    assert sorted(p for p in files if p.endswith(".pyi")) == sorted(
+        p + "i" for p in modules
+    )
+    assert files["vehicle/py.typed"] == ""
+    assert '"*.pyi", "py.typed"' in files["setup.py"]
+
+    for module in modules:
+        documented = (ast.Module, ast.ClassDef, ast.FunctionDef)
+        assert not any(
+            ast.get_docstring(node)
+            for node in ast.walk(ast.parse(files[module]))
+            if isinstance(node, documented)
+        )
+        assert len(files[module]) < len(plain[module])
+        ast.parse(files[module + "i"])
+
+    door = files["vehicle/Cabin/Door/__init__.pyi"]
+    assert "    IsOpen: DataPointBoolean\n" in door
+    assert "Is door open or closed" in door
+    cabin = files["vehicle/Cabin/__init__.pyi"]
+    assert "    Door: DoorCollection\n" in cabin
+    assert "    def Row(self, index: int) -> DoorCollection.RowType: ...\n" in cabin
+    assert "        def element(self, index: int) -> Door: ...\n" in cabin
+    assert files["vehicle/__init__.pyi"].endswith("\nvehicle: Vehicle\n")
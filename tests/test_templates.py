@@ -0,0 +1,73 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from velocitas.model_generator.utils import CodeGeneratorContext, Template
+
+DOC = Template("%NAME%: %TYPE%\n    %DESCRIPTION%\n\n    Unit: %UNIT%\n")
+
+
+def write_doc(ctx: CodeGeneratorContext, name, type, description, unit):
+    # how the documentation was written before it became a template
+    ctx.write(f"{name}: {type}\n")
+    ctx.indent()
+    ctx.write(f"{description}\n")
+    ctx.write("\n")
+    ctx.write(f"Unit: {unit}\n")
+    ctx.dedent()
+
+
+@pytest.mark.parametrize("level", [0, 1, 3])
+@pytest.mark.parametrize(
+    "description",
+    ["Vehicle speed.", "", "First line.\nSecond line.", "Paragraph.\n\nNext {one}."],
+)
+def test_emit_writes_like_write(level, description):
+    expected = CodeGeneratorContext()
+    emitted = CodeGeneratorContext()
+    for ctx in [expected, emitted]:
+        ctx.level = level
+        # the first line continues an unterminated one
+        ctx.write("def speed(self):")
+    write_doc(expected, "Speed", "sensor", description, "km/h")
+    emitted.emit(DOC, NAME="Speed", TYPE="sensor", DESCRIPTION=description, UNIT="km/h")
+    for ctx in [expected, emitted]:
+        ctx.write("return self.speed\n")
+
+    assert emitted.get_content() == expected.get_content()
+
+
+def test_fill_inserts_values_verbatim():
+    template = Template('setup(\n    name="%NAME%",\n)\n')
+    assert template.fill(NAME="a.b") == 'setup(\n    name="a.b",\n)\n'
+    assert Template("{%NAME%}").fill(NAME="x\ny") == "{x\ny}"
+
+
+def test_slots_are_filled_by_get_content():
+    ctx = CodeGeneratorContext()
+    ctx.write("Vehicle() :\n")
+    with ctx:
+        ctx.write('ParentClass("Vehicle")')
+        ctx.write_slot("MEMBER")
+        ctx.write("\n")
+        ctx.write("{}\n")
+
+    members = ',\n\t\tSpeed("Speed", this)'
+    assert ctx.get_content(MEMBER=members) == (
+        "Vehicle() :\n"
+        '    ParentClass("Vehicle"),\n'
+        '\t\tSpeed("Speed", this)\n'
+        "    {}\n"
+    )
+    assert "%MEMBER%" in ctx.get_content()
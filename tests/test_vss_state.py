@@ -0,0 +1,59 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.manifest import MANIFEST_FILE
+from velocitas.model_generator.sinks import MemorySink
+from vspec.model.constants import Unit  # type: ignore
+from vspec.model.vsstree import VSSNode  # type: ignore
+
+test_data_base_path = Path(__file__).parent.joinpath("data")
+input_file_path = test_data_base_path.joinpath("json", "vss_rel_4.0.json").__str__()
+input_unit_file_path_list = [test_data_base_path.joinpath("units.yaml").__str__()]
+
+
+def generate(language: str, ext_attributes_list):
+    sink = generate_model(
+        input_file_path,
+        input_unit_file_path_list,
+        language,
+        ext_attributes_list=ext_attributes_list,
+        sink=MemorySink(),
+    )
+    assert isinstance(sink, MemorySink)
+    # records the extended attributes, which differ between the generations
+    del sink.files[MANIFEST_FILE]
+    return sink.files
+
+
+def test_concurrent_generations_are_isolated():
+    whitelisted_extended_attributes = VSSNode.whitelisted_extended_attributes
+    units = list(Unit.values())
+    expected = {language: generate(language, ["dbc"]) for language in ["python", "cpp"]}
+
+    languages = ["python", "cpp"] * 4
+    with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+        results = list(
+            executor.map(
+                generate, languages, [[f"attribute{i}"] for i in range(len(languages))]
+            )
+        )
+
+    for language, files in zip(languages, results):
+        assert files == expected[language]
+    assert VSSNode.whitelisted_extended_attributes == whitelisted_extended_attributes
+    assert list(Unit.values()) == units
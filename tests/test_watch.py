@@ -0,0 +1,159 @@
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from pathlib import Path
+
+import pytest
+from velocitas.model_generator import generate_model
+from velocitas.model_generator.manifest import MANIFEST_FILE
+from velocitas.model_generator.watch import ModelWatcher
+
+from .test_cache import assert_same_tree
+
+units_file_path = str(Path(__file__).parent.joinpath("data", "units.yaml"))
+
+SPEC = """
+Vehicle:
+  type: branch
+  description: High-level vehicle data.
+
+Vehicle.Speed:
+  datatype: float
+  type: sensor
+  unit: km/h
+  description: Vehicle speed.
+
+Vehicle.Cabin:
+  type: branch
+  description: All in-cabin components.
+
+Vehicle.Cabin.DoorCount:
+  datatype: uint8
+  type: attribute
+  default: 4
+  description: Number of doors in vehicle.
+
+Vehicle.Body:
+  type: branch
+  description: All body components.
+
+Vehicle.Body.BodyType:
+  datatype: string
+  type: attribute
+  description: Body type code as defined by ISO 3779.
+"""
+
+BODY_OVERLAY = """
+Vehicle.Body.BodyType:
+  datatype: string
+  type: attribute
+  description: Body type code as defined by ISO 3779.
+  comment: Overlaid.
+"""
+
+CABIN_OVERLAY = """
+Vehicle.Cabin.IsLocked:
+  datatype: boolean
+  type: actuator
+  description: Is cabin locked.
+"""
+
+
+def _touch_all(folder: str):
+    for root, _, files in os.walk(folder):
+        for file in files:
+            os.utime(os.path.join(root, file), ns=(0, 0))
+
+
+def _modified_files(folder: str):
+    modified = set()
+    for root, _, files in os.walk(folder):
+        for file in files:
+            path = os.path.join(root, file)
+            if os.stat(path).st_mtime_ns != 0:
+                modified.add(os.path.relpath(path, folder))
+    return modified
+
+
+@pytest.mark.parametrize(
+    "language, cabin_file",
+    [
+        ("python", os.path.join("vehicle", "Cabin", "__init__.py")),
+        ("cpp", os.path.join("include", "vehicle", "cabin", "Cabin.hpp")),
+    ],
+)
+def test_watch_rewrites_only_changed_branches(tmp_path, language, cabin_file):
+    spec_file = tmp_path / "spec.vspec"
+    spec_file.write_text(SPEC)
+    overlay_file = tmp_path / "overlay.vspec"
+    overlay_file.write_text(BODY_OVERLAY)
+    target_folder = str(tmp_path / "watched")
+
+    watcher = ModelWatcher(
+        str(spec_file),
+        [units_file_path],
+        language,
+        target_folder,
+        "vehicle",
+        False,
+        ["."],
+        [str(overlay_file)],
+    )
+    assert watcher.update()
+    assert not watcher.update()
+
+    _touch_all(target_folder)
+    overlay_file.write_text(BODY_OVERLAY + CABIN_OVERLAY)
+    assert watcher.update()
+    assert _modified_files(target_folder) == {cabin_file, MANIFEST_FILE}
+
+    generate_model(
+        str(spec_file),
+        [units_file_path],
+        language,
+        str(tmp_path / "fresh"),
+        strict=False,
+        overlays=[str(overlay_file)],
+    )
+    assert_same_tree(target_folder, str(tmp_path / "fresh"))
+
+
+def test_watch_retries_after_a_failed_render(tmp_path):
+    spec_file = tmp_path / "spec.vspec"
+    spec_file.write_text(SPEC)
+    blocking_file = tmp_path / "signals"
+    blocking_file.write_text("not a folder")
+    target_folder = tmp_path / "watched"
+
+    watcher = ModelWatcher(
+        str(spec_file),
+        [units_file_path],
+        "python",
+        str(target_folder),
+        "vehicle",
+        False,
+        ["."],
+        [],
+        descriptor=str(blocking_file / "model.vssd"),
+    )
+    assert watcher.update()
+    # the descriptor can not be written, the inputs are not considered done
+    assert watcher.update()
+
+    blocking_file.unlink()
+    assert watcher.update()
+    assert not watcher.update()
+    assert (tmp_path / "signals" / "model.vssd").exists()
+    assert (target_folder / "vehicle" / "__init__.py").exists()